@@ -13,8 +13,10 @@ Schedule: None (manual trigger only)
 from datetime import datetime, timedelta
 
 from airflow import DAG
+from airflow.decorators import task, task_group
 from airflow.operators.bash import BashOperator
-from airflow.operators.python import PythonOperator
+
+START_DATE = datetime(2025, 1, 1)
 
 default_args = {
     "owner": "rewardsense",
@@ -25,6 +27,7 @@ default_args = {
     "retry_delay": timedelta(minutes=2),
 }
 
+@task(task_id="check_python_dependencies")
 def check_dependencies():
     """Verify that key Python packages are importable."""
     import pandas as pd
@@ -38,6 +41,7 @@ def check_dependencies():
     print(f"pyyaml: {yaml.__version__}")
     print("All core dependencies verified.")
 
+@task(task_id="check_gcp_connection")
 def check_gcp_connection():
     """
     Test GCP connectivity. This will fail gracefully until
@@ -53,6 +57,7 @@ def check_gcp_connection():
         # Don't raise - this is informational, not a hard failure
         # Remove this try/except once GCP is wired up
 
+@task(task_id="check_src_mount")
 def check_src_mount():
     """Verify that the src/ directory is accessible from within the container."""
     import os
@@ -63,40 +68,32 @@ def check_src_mount():
     else:
         print(f"WARNING: {src_path} not found. Check volume mount.")
 
+@task_group(group_id="environment_checks", prefix_group_id=False)
+def environment_checks():
+    """Independent post-dependency checks, fanned out in parallel."""
+    return [check_gcp_connection(), check_src_mount()]
+
 with DAG(
     dag_id="example_rewardsense_setup_check",
     default_args=default_args,
     description="Validates Airflow environment setup for RewardSense",
     schedule=None,  # Manual trigger only
-    start_date=datetime(2025, 1, 1),
+    start_date=START_DATE,
     catchup=False,
     tags=["setup", "validation", "rewardsense"],
 ) as dag:
 
     t1_echo = BashOperator(
         task_id="echo_environment",
+        # One printf builtin instead of five echo commands.
         bash_command=(
-            'echo "Airflow is running!" && '
-            'echo "Executor: $AIRFLOW__CORE__EXECUTOR" && '
-            'echo "DAGs folder: $AIRFLOW__CORE__DAGS_FOLDER" && '
-            'echo "GCP Project: $GCP_PROJECT_ID" && '
-            'echo "GCP Bucket: $GCP_BUCKET_NAME"'
+            "printf 'Airflow is running!\\nExecutor: %s\\nDAGs folder: %s\\n"
+            "GCP Project: %s\\nGCP Bucket: %s\\n' "
+            '"$AIRFLOW__CORE__EXECUTOR" "$AIRFLOW__CORE__DAGS_FOLDER" '
+            '"$GCP_PROJECT_ID" "$GCP_BUCKET_NAME"'
         ),
     )
 
-    t2_deps = PythonOperator(
-        task_id="check_python_dependencies",
-        python_callable=check_dependencies,
-    )
-
-    t3_gcp = PythonOperator(
-        task_id="check_gcp_connection",
-        python_callable=check_gcp_connection,
-    )
-
-    t4_src = PythonOperator(
-        task_id="check_src_mount",
-        python_callable=check_src_mount,
-    )
+    t2_deps = check_dependencies()
 
-    t1_echo >> t2_deps >> [t3_gcp, t4_src]
+    t1_echo >> t2_deps >> environment_checks()
@@ -23,19 +23,23 @@ Acceptance criteria:
 
 from __future__ import annotations
 
+# Source-specific packages are imported inside their runners so `--help`,
+# `--sources synthetic`, etc. start quickly.
 import argparse
 import dataclasses
-import datetime as dt
+import errno
 import hashlib
-import json
 import logging
 import os
 import shutil
 import sys
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import orjson
 
 # Make "src/" importable when running as: python3 scripts/download_data.py
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -47,36 +51,223 @@ if str(REPO_ROOT) not in sys.path:
 # -----------------------------
 
 
+_UTC_ISO_FMT = "%Y-%m-%dT%H:%M:%S+00:00"
+
+
+def utc_iso(ts: float) -> str:
+    """Format an epoch timestamp like utc_now_iso() without building a datetime."""
+    return time.strftime(_UTC_ISO_FMT, time.gmtime(ts))
+
+
 def utc_now_iso() -> str:
-    return dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds")
+    return utc_iso(time.time())
 
 
-def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
+def sha256_file(path: Union[str, Path]) -> str:
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
         for chunk in iter(lambda: f.read(1024 * 1024), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
+
+
+def _fsync_dir(path: Path) -> None:
+    """fsync a directory so renames inside it survive a crash (POSIX only)."""
+    if os.name != "posix":
+        return
+    fd = os.open(str(path), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# SHA-256 of every artifact this process wrote, keyed by (st_dev, st_ino) and
+# validated against size/mtime. The stage->current commit is a rename, so the
+# inodes survive and make_manifest can reuse these instead of re-reading files.
+_DIGEST_CACHE: Dict[Tuple[int, int], Tuple[int, int, str]] = {}
+
+# Stage path -> (previous committed file, its sha256) for files listed in the
+# previous manifest. Identical outputs are hardlinked instead of rewritten.
+_REUSABLE: Dict[str, Tuple[Path, str]] = {}
+
+
+def _remember_digest(path: Path, digest: str) -> None:
+    st = os.stat(path)
+    _DIGEST_CACHE[(st.st_dev, st.st_ino)] = (st.st_size, st.st_mtime_ns, digest)
+
+
+def _cached_digest(st: os.stat_result) -> Optional[str]:
+    hit = _DIGEST_CACHE.get((st.st_dev, st.st_ino))
+    if hit is None or hit[:2] != (st.st_size, st.st_mtime_ns):
+        return None
+    return hit[2]
+
+
+def _link_into_place(src: Path, dest: Path, durable: bool = True) -> bool:
+    """Atomically make dest a hardlink of src; False if linking is unsupported."""
+    tmp = dest.parent / f".{dest.name}.{os.getpid()}.{time.monotonic_ns()}.lnk"
+    try:
+        os.link(src, tmp)
+    except OSError:
+        return False
+    os.replace(str(tmp), str(dest))
+    if durable:
+        _fsync_dir(dest.parent)
+    return True
+
+
+def load_reusable_artifacts(
+    current_dir: Path, manifest_name: str, stage_dir: Path
+) -> Dict[str, Tuple[Path, str]]:
+    """
+    Map stage paths to still-present files recorded in the previous manifest.
+
+    A file is only trusted with its recorded sha256 while its size, mtime and
+    inode still match the manifest; anything edited in place (or recorded by an
+    older manifest without that metadata) is rewritten instead of linked.
+    """
+    try:
+        previous = orjson.loads((current_dir / manifest_name).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+    reusable: Dict[str, Tuple[Path, str]] = {}
+    for f in previous.get("files", []):
+        old = current_dir / f["path"]
+        try:
+            st = old.stat()
+        except OSError:
+            continue
+        if (st.st_size, st.st_mtime_ns, st.st_ino) != (
+            f["bytes"],
+            f.get("mtime_ns"),
+            f.get("inode"),
+        ):
+            continue
+        reusable[str(stage_dir / f["path"])] = (old, f["sha256"])
+    return reusable
 
 
-def atomic_write_bytes(dest: Path, data: bytes) -> None:
-    """Atomic file write: write to temp file in same directory then os.replace."""
+def _fsync_file(path: Union[str, Path]) -> None:
+    # Windows cannot flush a read-only descriptor.
+    fd = os.open(str(path), os.O_RDONLY if os.name == "posix" else os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(dest: Path, data: bytes, durable: bool = True) -> None:
+    """
+    Atomic file write: write to temp file in same directory then os.replace.
+
+    durable=False skips the file and directory fsyncs. Use it for stage
+    outputs, which commit_stage_to_processed syncs in one pass before they
+    become visible (a crashed run simply rewrites its stage).
+    """
     dest.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256(data).hexdigest()
+
+    previous = _REUSABLE.get(str(dest))
+    if previous is not None and previous[1] == digest:
+        if _link_into_place(previous[0], dest, durable=durable):
+            _remember_digest(dest, digest)
+            return
+
     with tempfile.NamedTemporaryFile(dir=str(dest.parent), delete=False) as tf:
         tmp_path = Path(tf.name)
         tf.write(data)
-        tf.flush()
-        os.fsync(tf.fileno())
+        if durable:
+            tf.flush()
+            os.fsync(tf.fileno())
     os.replace(str(tmp_path), str(dest))
+    if durable:
+        _fsync_dir(dest.parent)
+    _remember_digest(dest, digest)
 
 
-def atomic_write_text(dest: Path, text: str) -> None:
-    atomic_write_bytes(dest, (text + "\n").encode("utf-8"))
+class StreamingJsonArrayWriter:
+    """
+    Atomically write ``{**header, key: [...]}`` while items arrive in batches.
 
+    Items are encoded and appended to a temp file as they are passed to
+    extend(), so the full array never has to be held in memory. On a clean
+    exit the file is renamed into place (fsynced first if durable); on error
+    the temp file is removed and dest is left untouched.
+    """
 
-def atomic_write_json(dest: Path, obj: Any) -> None:
+    def __init__(
+        self,
+        dest: Path,
+        header: Dict[str, Any],
+        key: str = "offers",
+        durable: bool = True,
+    ):
+        self.dest = dest
+        self.header = header
+        self.key = key
+        self.durable = durable
+        self.count = 0
+        self._tf: Any = None
+        self._sha = hashlib.sha256()
+
+    def _write(self, data: bytes) -> None:
+        self._tf.write(data)
+        self._sha.update(data)
+
+    def __enter__(self) -> "StreamingJsonArrayWriter":
+        self.dest.parent.mkdir(parents=True, exist_ok=True)
+        self._tf = tempfile.NamedTemporaryFile(dir=str(self.dest.parent), delete=False)
+        prefix = orjson.dumps(
+            {**self.header, self.key: []}, option=orjson.OPT_NON_STR_KEYS
+        )
+        self._write(prefix[: -len(b"]}")])  # leave the array open
+        return self
+
+    def extend(self, items: List[Any]) -> None:
+        if not items:
+            return
+        chunk = b",".join(
+            orjson.dumps(item, option=orjson.OPT_NON_STR_KEYS) for item in items
+        )
+        self._write(chunk if self.count == 0 else b"," + chunk)
+        self.count += len(items)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        tmp_path = Path(self._tf.name)
+        if exc_type is not None:
+            self._tf.close()
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._write(b"]}\n")
+        if self.durable:
+            self._tf.flush()
+            os.fsync(self._tf.fileno())
+        self._tf.close()
+        os.replace(str(tmp_path), str(self.dest))
+        if self.durable:
+            _fsync_dir(self.dest.parent)
+        _remember_digest(self.dest, self._sha.hexdigest())
+
+
+def atomic_write_text(dest: Path, text: str, durable: bool = True) -> None:
+    atomic_write_bytes(dest, (text + "\n").encode("utf-8"), durable=durable)
+
+
+def atomic_write_json(dest: Path, obj: Any, durable: bool = True) -> None:
+    # orjson emits UTF-8 bytes directly, skipping the intermediate str copy.
     atomic_write_bytes(
-        dest, (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+        dest,
+        orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        ),
+        durable=durable,
     )
 
 
@@ -131,7 +322,8 @@ def run_creditcardbonuses_api(
     stage_dir: Path,
     logger: logging.Logger,
     include_raw: bool = False,
-) -> Tuple[List[Dict[str, Any]], int, List[Path]]:
+    fetched_at: Optional[str] = None,
+) -> Tuple[int, List[Path]]:
     """
     Fetch normalized offers from CreditCardBonusesClient and write JSON to stage_dir.
 
@@ -142,6 +334,7 @@ def run_creditcardbonuses_api(
         CreditCardBonusesClient,
     )
 
+    fetched_at = fetched_at or utc_now_iso()
     out_dir = stage_dir / "offers"
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -162,18 +355,27 @@ def run_creditcardbonuses_api(
     out_path = out_dir / "creditcardbonuses_offers.json"
     atomic_write_json(
         out_path,
-        {"source": "creditcardbonuses", "fetched_at": utc_now_iso(), "offers": offers},
+        {"source": "creditcardbonuses", "fetched_at": fetched_at, "offers": offers},
+        durable=False,
     )
 
-    return offers, n, [out_path]
+    return n, [out_path]
 
 
 def run_issuer_scrapers(
-    stage_dir: Path, logger: logging.Logger, issuers: Optional[List[str]] = None
-) -> Tuple[List[Dict[str, Any]], int, List[Path]]:
+    stage_dir: Path,
+    logger: logging.Logger,
+    issuers: Optional[List[str]] = None,
+    fetched_at: Optional[str] = None,
+    per_issuer_files: bool = False,
+) -> Tuple[int, List[Path]]:
     """
     Run issuer scrapers and write aggregated JSON to stage_dir.
 
+    All issuers are streamed into one offers/issuer_offers.json. Pass
+    per_issuer_files=True (--per-issuer-files) to additionally write one
+    issuer_<key>_offers.json per issuer for debugging.
+
     Note: Existing scrapers return dicts; we persist raw scraped dicts here.
     Later stories can normalize them into CardOffer.
     """
@@ -185,6 +387,7 @@ def run_issuer_scrapers(
         DiscoverScraper,
     )
 
+    fetched_at = fetched_at or utc_now_iso()
     out_dir = stage_dir / "offers"
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -203,13 +406,10 @@ def run_issuer_scrapers(
             f"Unknown issuers: {unknown}. Valid: {sorted(available.keys())}"
         )
 
-    all_rows: List[Dict[str, Any]] = []
-    files_written: List[Path] = []
-
-    for issuer in selected:
-        issuer_key = issuer.lower()
-        scraper_cls = available[issuer_key]
-        scraper = scraper_cls()
+    def scrape_one(
+        issuer_key: str,
+    ) -> Tuple[List[Dict[str, Any]], Optional[Path]]:
+        scraper = available[issuer_key]()
         logger.info("Scraper: %s - scraping card listings...", issuer_key)
 
         rows = scraper.scrape_all_cards()  # expected list[dict]
@@ -218,24 +418,46 @@ def run_issuer_scrapers(
                 f"Issuer scraper {issuer_key} returned {type(rows)}; expected list of dicts"
             )
 
-        out_path = out_dir / f"issuer_{issuer_key}_offers.json"
-        payload = {
-            "source": f"issuer:{issuer_key}",
-            "fetched_at": utc_now_iso(),
-            "offers": rows,
-        }
-        atomic_write_json(out_path, payload)
-
-        files_written.append(out_path)
-        all_rows.extend(rows)
+        if per_issuer_files:
+            out_path = out_dir / f"issuer_{issuer_key}_offers.json"
+            payload = {
+                "source": f"issuer:{issuer_key}",
+                "fetched_at": fetched_at,
+                "offers": rows,
+            }
+            atomic_write_json(out_path, payload, durable=False)
+            return rows, out_path
+        return rows, None
 
-    return all_rows, len(all_rows), files_written
+    files_written: List[Path] = []
+    issuer_keys = [x.lower() for x in selected]
+    combined_path = out_dir / "issuer_offers.json"
+    header = {"source": "issuers", "fetched_at": fetched_at, "issuers": issuer_keys}
+
+    # Each issuer hits a different host, so scrapes run concurrently; ex.map
+    # keeps results in the requested issuer order. Rows are appended to the
+    # combined file and dropped as each issuer completes, so only counts are
+    # kept in memory.
+    with StreamingJsonArrayWriter(combined_path, header, durable=False) as writer:
+        with ThreadPoolExecutor(max_workers=min(len(issuer_keys), 5)) as ex:
+            for rows, out_path in ex.map(scrape_one, issuer_keys):
+                writer.extend(rows)
+                del rows
+                if out_path is not None:
+                    files_written.append(out_path)
+    files_written.insert(0, combined_path)
+
+    return writer.count, files_written
 
 
 def run_nerdwallet_scraper(
-    stage_dir: Path, logger: logging.Logger, use_selenium: bool = False
-) -> Tuple[List[Dict[str, Any]], int, List[Path]]:
+    stage_dir: Path,
+    logger: logging.Logger,
+    use_selenium: bool = False,
+    fetched_at: Optional[str] = None,
+) -> Tuple[int, List[Path]]:
     """Run NerdWallet scraper (requests+bs4 by default, selenium optional) and write JSON to stage_dir."""
+    fetched_at = fetched_at or utc_now_iso()
     out_dir = stage_dir / "offers"
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -258,10 +480,10 @@ def run_nerdwallet_scraper(
         )
 
     out_path = out_dir / "nerdwallet_offers.json"
-    payload = {"source": "nerdwallet", "fetched_at": utc_now_iso(), "offers": rows}
-    atomic_write_json(out_path, payload)
+    payload = {"source": "nerdwallet", "fetched_at": fetched_at, "offers": rows}
+    atomic_write_json(out_path, payload, durable=False)
 
-    return rows, len(rows), [out_path]
+    return len(rows), [out_path]
 
 
 def run_synthetic_generators(
@@ -271,7 +493,8 @@ def run_synthetic_generators(
     history_months: int,
     seed: int,
     fmt: str = "csv",
-) -> Tuple[List[Dict[str, Any]], int, List[Path]]:
+    fetched_at: Optional[str] = None,
+) -> Tuple[int, List[Path]]:
     """
     Generate synthetic user + transaction datasets using repo generators.
     Writes:
@@ -280,7 +503,7 @@ def run_synthetic_generators(
       synthetic/transactions.csv
       synthetic/synthetic_meta.json
 
-    Returns: (rows_preview, record_count, files_written)
+    Returns: (record_count, files_written)
     """
     # Import inside function so CLI works even if deps are missing for this source
     import pandas as pd  # noqa: F401
@@ -288,6 +511,7 @@ def run_synthetic_generators(
     from src.data_pipeline.generators.user_profile_generator import UserProfileGenerator
     from src.data_pipeline.generators.transaction_generator import TransactionGenerator
 
+    fetched_at = fetched_at or utc_now_iso()
     out_dir = stage_dir / "synthetic"
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -334,9 +558,12 @@ def run_synthetic_generators(
         user_cards_path = out_dir / "user_cards.csv"
         txns_path = out_dir / "transactions.csv"
 
-        atomic_write_text(profiles_path, profiles_df.to_csv(index=False))
-        atomic_write_text(user_cards_path, user_cards_df.to_csv(index=False))
-        atomic_write_text(txns_path, txns_df.to_csv(index=False))
+        for path, df in (
+            (profiles_path, profiles_df),
+            (user_cards_path, user_cards_df),
+            (txns_path, txns_df),
+        ):
+            atomic_write_text(path, df.to_csv(index=False), durable=False)
 
         files_written.extend([profiles_path, user_cards_path, txns_path])
     else:
@@ -344,7 +571,7 @@ def run_synthetic_generators(
 
     meta = {
         "source": "synthetic",
-        "fetched_at": utc_now_iso(),
+        "fetched_at": fetched_at,
         "params": {
             "num_users": num_users,
             "history_months": history_months,
@@ -358,15 +585,11 @@ def run_synthetic_generators(
         },
     }
     meta_path = out_dir / "synthetic_meta.json"
-    atomic_write_json(meta_path, meta)
+    atomic_write_json(meta_path, meta, durable=False)
     files_written.append(meta_path)
 
-    # return a small preview (keeps orchestrator lightweight)
-    preview = (
-        profiles_df.head(3).to_dict(orient="records") if not profiles_df.empty else []
-    )
     total_records = int(len(profiles_df) + len(user_cards_df) + len(txns_df))
-    return preview, total_records, files_written
+    return total_records, files_written
 
 
 # -----------------------------
@@ -374,6 +597,18 @@ def run_synthetic_generators(
 # -----------------------------
 
 
+def _walk_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield regular files under root using scandir's cached d_type/stat."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
 def make_manifest(
     run_id: str,
     started_at: str,
@@ -381,44 +616,108 @@ def make_manifest(
     results: List[SourceResult],
     committed_dir: Path,
 ) -> Dict[str, Any]:
-    files: List[Dict[str, Any]] = []
-    for p in committed_dir.rglob("*"):
-        if p.is_file():
-            rel = str(p.relative_to(committed_dir))
-            files.append(
-                {"path": rel, "bytes": p.stat().st_size, "sha256": sha256_file(p)}
-            )
+    entries = [
+        (e.path, e.stat(follow_symlinks=False)) for e in _walk_files(committed_dir)
+    ]
+
+    def digest_of(entry: Tuple[str, os.stat_result]) -> str:
+        path, st = entry
+        return _cached_digest(st) or sha256_file(path)
+
+    # Files written (or hardlinked) by this run hit the digest cache; anything
+    # else is hashed on a thread pool - hashlib releases the GIL while digesting.
+    max_workers = max(1, min(len(entries), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        digests = list(ex.map(digest_of, entries))
+
+    files: List[Dict[str, Any]] = [
+        {
+            "path": os.path.relpath(path, committed_dir),
+            "bytes": st.st_size,
+            "sha256": digest,
+            # Let the next run check the file is unchanged before reusing digest
+            "mtime_ns": st.st_mtime_ns,
+            "inode": st.st_ino,
+        }
+        for (path, st), digest in zip(entries, digests)
+    ]
 
     return {
         "run_id": run_id,
         "started_at": started_at,
         "finished_at": finished_at,
-        "sources": [dataclasses.asdict(r) for r in results],
+        # SourceResult dataclasses are serialized natively by orjson in
+        # atomic_write_json; no dataclasses.asdict() deep copy is needed.
+        "sources": list(results),
         "artifact_root": str(committed_dir),
         "files": sorted(files, key=lambda x: x["path"]),
     }
 
 
+def _fsync_tree(root: Path) -> None:
+    """fsync every file and directory under root (files in parallel)."""
+    paths = [e.path for e in _walk_files(root)]
+    if paths:
+        max_workers = max(1, min(len(paths), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            list(ex.map(_fsync_file, paths))
+    for d in sorted({os.path.dirname(p) for p in paths} | {str(root)}):
+        _fsync_dir(Path(d))
+
+
+def _move_dir(src: Path, dest: Path) -> None:
+    """
+    Rename src to dest; across filesystems, copy next to dest and rename.
+
+    The fallback copies with shutil.copy2, whose copyfile fast path uses
+    sendfile(2) on Linux, so file bytes never pass through userspace.
+    """
+    try:
+        os.replace(str(src), str(dest))
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    tmp_target = dest.parent / f".{dest.name}_tmp_{int(time.time())}"
+    safe_rmtree(tmp_target)
+    try:
+        shutil.copytree(src, tmp_target, copy_function=shutil.copy2)
+        _fsync_tree(tmp_target)
+        os.replace(str(tmp_target), str(dest))
+    except BaseException:
+        safe_rmtree(tmp_target)
+        raise
+    safe_rmtree(src)
+
+
 def commit_stage_to_processed(
     stage_dir: Path, processed_dir: Path, logger: logging.Logger
 ) -> None:
     """
     Atomic commit strategy:
-    - Stage contains new files in a temporary directory.
-    - Commit by replacing processed/current via os.replace after copying stage.
+    - Stage contains new files in a temporary directory on the same filesystem.
+    - Stage files are written without fsync; they are synced here in one
+      parallel pass right before they become visible.
+    - Commit by moving processed/current aside and renaming stage into place;
+      no file contents are copied (unless stage is on another filesystem, see
+      _move_dir). On failure the previous current is restored.
     """
+    _fsync_tree(stage_dir)
     processed_dir.mkdir(parents=True, exist_ok=True)
     current = processed_dir / "current"
-    tmp_target = processed_dir / f"current_tmp_{int(time.time())}"
-
-    if tmp_target.exists():
-        safe_rmtree(tmp_target)
-    shutil.copytree(stage_dir, tmp_target)
-
     backup = processed_dir / f"current_backup_{int(time.time())}"
+
     if current.exists():
         os.replace(str(current), str(backup))
-    os.replace(str(tmp_target), str(current))
+    try:
+        _move_dir(stage_dir, current)
+    except OSError:
+        if backup.exists():
+            os.replace(str(backup), str(current))
+        raise
+    _fsync_dir(current)
+    _fsync_dir(processed_dir)
     safe_rmtree(backup)
 
     logger.info("Committed processed data to: %s", current)
@@ -438,6 +737,11 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Comma-separated issuer list for issuers source (e.g., chase,amex,citi). Empty = all.",
     )
+    p.add_argument(
+        "--per-issuer-files",
+        action="store_true",
+        help="Also write one issuer_<key>_offers.json per issuer (debugging).",
+    )
     p.add_argument(
         "--nerdwallet-selenium",
         action="store_true",
@@ -522,7 +826,7 @@ def main() -> int:
 
     repo_root = Path(__file__).resolve().parents[1]
     processed_dir = (repo_root / args.out_dir).resolve()
-    run_id = dt.datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_id = time.strftime("%Y%m%d_%H%M%S")
     started_at = utc_now_iso()
 
     logger.info("Run ID: %s", run_id)
@@ -536,14 +840,21 @@ def main() -> int:
     safe_rmtree(stage_dir)
     stage_dir.mkdir(parents=True, exist_ok=True)
 
+    _REUSABLE.clear()
+    _REUSABLE.update(
+        load_reusable_artifacts(
+            processed_dir / "current", args.manifest_name, stage_dir
+        )
+    )
+
     results: List[SourceResult] = []
 
-    def run_one(name: str, fn, *fn_args, **fn_kwargs) -> bool:
+    def run_one(name: str, fn, *fn_args, **fn_kwargs) -> SourceResult:
         t0 = time.time()
-        s0 = utc_now_iso()
+        s0 = utc_iso(t0)
         logger.info("==== START source=%s ====", name)
         try:
-            _rows, n, files = fn(*fn_args, **fn_kwargs)
+            n, files = fn(*fn_args, **fn_kwargs)
             ok = True
             err = None
         except Exception as e:
@@ -555,7 +866,7 @@ def main() -> int:
             logger.debug("Exception details", exc_info=True)
 
         t1 = time.time()
-        s1 = utc_now_iso()
+        s1 = utc_iso(t1)
         res = SourceResult(
             name=name,
             ok=ok,
@@ -568,7 +879,6 @@ def main() -> int:
             ),
             error=err,
         )
-        results.append(res)
         logger.info(
             "==== END source=%s ok=%s records=%d duration=%.3fs ====",
             name,
@@ -576,54 +886,79 @@ def main() -> int:
             n,
             (t1 - t0),
         )
-        return ok
+        return res
 
-    all_ok = True
+    # Network-bound sources are independent (each writes its own file under
+    # stage_dir/offers), so they run concurrently and the wall-clock cost is
+    # the slowest source rather than the sum of all of them.
+    network_jobs: List[Tuple[str, Any, Dict[str, Any]]] = []
 
     if "api" in sources:
-        ok = run_one(
-            "api:creditcardbonuses",
-            run_creditcardbonuses_api,
-            stage_dir,
-            logger,
-            include_raw=args.include_raw,
+        network_jobs.append(
+            (
+                "api:creditcardbonuses",
+                run_creditcardbonuses_api,
+                {"include_raw": args.include_raw, "fetched_at": started_at},
+            )
         )
-        all_ok = all_ok and ok
-        if args.fail_fast and not ok:
-            safe_rmtree(stage_dir)
-            return 2
 
     if "issuers" in sources:
         issuers = [
             x.strip().lower() for x in args.issuers.split(",") if x.strip()
         ] or None
-        ok = run_one(
-            "scrape:issuers",
-            run_issuer_scrapers,
-            stage_dir,
-            logger,
-            issuers=issuers,
+        network_jobs.append(
+            (
+                "scrape:issuers",
+                run_issuer_scrapers,
+                {
+                    "issuers": issuers,
+                    "fetched_at": started_at,
+                    "per_issuer_files": args.per_issuer_files,
+                },
+            )
         )
-        all_ok = all_ok and ok
-        if args.fail_fast and not ok:
-            safe_rmtree(stage_dir)
-            return 2
 
     if "nerdwallet" in sources:
-        ok = run_one(
-            "scrape:nerdwallet",
-            run_nerdwallet_scraper,
-            stage_dir,
-            logger,
-            use_selenium=args.nerdwallet_selenium,
+        network_jobs.append(
+            (
+                "scrape:nerdwallet",
+                run_nerdwallet_scraper,
+                {
+                    "use_selenium": args.nerdwallet_selenium,
+                    "fetched_at": started_at,
+                },
+            )
         )
-        all_ok = all_ok and ok
-        if args.fail_fast and not ok:
+
+    all_ok = True
+
+    if network_jobs:
+        finished: Dict[str, SourceResult] = {}
+        with ThreadPoolExecutor(max_workers=len(network_jobs)) as ex:
+            futures = [
+                ex.submit(run_one, name, fn, stage_dir, logger, **fn_kwargs)
+                for name, fn, fn_kwargs in network_jobs
+            ]
+            for fut in as_completed(futures):
+                res = fut.result()
+                finished[res.name] = res
+                if args.fail_fast and not res.ok:
+                    # Drop anything not yet started; running sources are
+                    # waited on so the stage dir is quiescent before cleanup.
+                    ex.shutdown(wait=True, cancel_futures=True)
+                    break
+
+        # Report sources in request order, independent of completion order.
+        results.extend(
+            finished[name] for name, _, _ in network_jobs if name in finished
+        )
+        all_ok = all(r.ok for r in results)
+        if args.fail_fast and not all_ok:
             safe_rmtree(stage_dir)
             return 2
 
     if "synthetic" in sources:
-        ok = run_one(
+        res = run_one(
             "generate:synthetic",
             run_synthetic_generators,
             stage_dir,
@@ -632,9 +967,11 @@ def main() -> int:
             history_months=args.history_months,
             seed=args.seed,
             fmt=args.synthetic_format,
+            fetched_at=started_at,
         )
-        all_ok = all_ok and ok
-        if args.fail_fast and not ok:
+        results.append(res)
+        all_ok = all_ok and res.ok
+        if args.fail_fast and not res.ok:
             safe_rmtree(stage_dir)
             return 2
 
@@ -649,9 +986,9 @@ def main() -> int:
             "started_at": started_at,
             "finished_at": finished_at,
             "committed": False,
-            "sources": [dataclasses.asdict(r) for r in results],
+            "sources": list(results),
         }
-        atomic_write_json(stage_dir / "run_report.json", report)
+        atomic_write_json(stage_dir / "run_report.json", report, durable=False)
         logger.info(
             "Wrote failure run report to staging: %s", stage_dir / "run_report.json"
         )
@@ -668,7 +1005,6 @@ def main() -> int:
     logger.info("Wrote manifest: %s", committed_current / args.manifest_name)
     atomic_write_json(committed_current / f"manifest_{run_id}.json", manifest)
 
-    safe_rmtree(stage_dir)
     logger.info("Done. All sources succeeded.")
     return 0
 
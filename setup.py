@@ -9,7 +9,9 @@ requirements = [
     "numpy>=1.24.0",
     "beautifulsoup4>=4.12.0",
     "requests>=2.31.0",
+    "urllib3>=2.0.0",
     "lxml>=5.0.0",
+    "orjson>=3.8.0",
     "pydantic>=2.0.0",
     "python-dotenv>=1.0.0",
     "pyyaml>=6.0.0",
@@ -31,38 +31,68 @@ Set these environment variables (optional):
     CREDITCARDBONUSES_BASE_URL     - Required if using API key
     CREDITCARDBONUSES_EXPORT_URL   - Override default public export URL
     CREDITCARDBONUSES_TIMEOUT_SEC  - Request timeout (default: 15)
+    CREDITCARDBONUSES_CACHE_DIR    - Cache the export here and re-fetch it
+                                     conditionally via ETag (default: off)
 
 If no API key is set, the client falls back to the free public GitHub export.
 """
 
-# -----------------------------------------------------------------------------
-# Base client (reusable for other APIs in the future)
-# -----------------------------------------------------------------------------
-from .client_base import (
-    BaseAPIClient,
-    APIClientError,
-    APIClientHTTPError,
-    APIClientTimeout,
-)
-
-# -----------------------------------------------------------------------------
-# Credit Card Bonuses API client
-# -----------------------------------------------------------------------------
-from .credit_card_bonuses_api import (
-    CreditCardBonusesClient,
-    CreditCardBonusesConfigError,
-    CreditCardBonusesUpstreamError,
-)
-
-# -----------------------------------------------------------------------------
-# Data normalization (converts raw API responses to clean schema)
-# -----------------------------------------------------------------------------
-from .normalizer import normalize_creditcardbonuses_offer
-
-# -----------------------------------------------------------------------------
-# Unified schema (same structure used by scrapers and API)
-# -----------------------------------------------------------------------------
-from .schema import CardOffer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Submodules are imported lazily (PEP 562) so that importing this package -
+# e.g. during Airflow DAG parsing - does not pull in requests/urllib3/pydantic
+# until one of the exported names is actually used.
+_LAZY_IMPORTS = {
+    # Base client (reusable for other APIs in the future)
+    "BaseAPIClient": ".client_base",
+    "APIClientError": ".client_base",
+    "APIClientHTTPError": ".client_base",
+    "APIClientTimeout": ".client_base",
+    # Credit Card Bonuses API client
+    "CreditCardBonusesClient": ".credit_card_bonuses_api",
+    "CreditCardBonusesConfigError": ".credit_card_bonuses_api",
+    "CreditCardBonusesUpstreamError": ".credit_card_bonuses_api",
+    # Data normalization (converts raw API responses to clean schema)
+    "normalize_creditcardbonuses_offer": ".normalizer",
+    "normalize_all": ".normalizer",
+    # Unified schema (same structure used by scrapers and API)
+    "CardOffer": ".schema",
+    "validate_card_offers": ".schema",
+    # Column-oriented batch view for vectorized matching
+    "CardOfferBatch": ".batch",
+}
+
+if TYPE_CHECKING:
+    from .client_base import (
+        BaseAPIClient,
+        APIClientError,
+        APIClientHTTPError,
+        APIClientTimeout,
+    )
+    from .credit_card_bonuses_api import (
+        CreditCardBonusesClient,
+        CreditCardBonusesConfigError,
+        CreditCardBonusesUpstreamError,
+    )
+    from .normalizer import normalize_all, normalize_creditcardbonuses_offer
+    from .schema import CardOffer, validate_card_offers
+    from .batch import CardOfferBatch
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
@@ -77,6 +107,10 @@ __all__ = [
     "CreditCardBonusesUpstreamError",
     # Normalizer
     "normalize_creditcardbonuses_offer",
+    "normalize_all",
     # Schema
     "CardOffer",
+    "validate_card_offers",
+    # Batch view
+    "CardOfferBatch",
 ]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .schema import CardOffer
+
+__all__ = ["CardOfferBatch"]
+
+
+@dataclass(frozen=True)
+class CardOfferBatch:
+    """
+    Column-oriented view of many CardOffers for vectorized matching.
+
+    reward_rates dicts are flattened into one (num_cards, num_categories)
+    matrix plus a category -> column index, so scoring thousands of cards
+    against a category is a single column gather instead of a dict lookup
+    per card. Missing rates are 0.0; missing annual fees are NaN.
+    """
+
+    offers: List[CardOffer]
+    card_names: List[str]
+    issuers: np.ndarray
+    annual_fees: np.ndarray
+    reward_categories: Dict[str, int]
+    reward_matrix: np.ndarray
+
+    @classmethod
+    def from_offers(cls, offers: Sequence[CardOffer]) -> "CardOfferBatch":
+        offers = list(offers)
+        n = len(offers)
+
+        categories: Dict[str, int] = {}
+        for offer in offers:
+            for category in offer.reward_rates:
+                categories.setdefault(category, len(categories))
+
+        matrix = np.zeros((n, len(categories)), dtype=np.float64)
+        for i, offer in enumerate(offers):
+            for category, rate in offer.reward_rates.items():
+                matrix[i, categories[category]] = rate
+
+        annual_fees = np.fromiter(
+            (np.nan if o.annual_fee is None else o.annual_fee for o in offers),
+            dtype=np.float64,
+            count=n,
+        )
+        issuers = np.empty(n, dtype=object)
+        issuers[:] = [o.issuer for o in offers]
+
+        return cls(
+            offers=offers,
+            card_names=[o.card_name for o in offers],
+            issuers=issuers,
+            annual_fees=annual_fees,
+            reward_categories=categories,
+            reward_matrix=matrix,
+        )
+
+    def __len__(self) -> int:
+        return len(self.offers)
+
+    def rates_for(self, category: str) -> np.ndarray:
+        """Per-card rate for one category (zeros if no card lists it)."""
+        idx = self.reward_categories.get(category)
+        if idx is None:
+            return np.zeros(len(self.offers), dtype=np.float64)
+        return self.reward_matrix[:, idx]
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import gzip
 import logging
-from typing import Any, Dict, List, Optional
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
-from .normalizer import normalize_creditcardbonuses_offer
+import orjson
+
+from .normalizer import normalize_all
 from .schema import CardOffer
 
 from .client_base import (
@@ -48,6 +55,8 @@ class CreditCardBonusesClient(BaseAPIClient):
         self.export_url: str = os.getenv(
             "CREDITCARDBONUSES_EXPORT_URL", self.DEFAULT_EXPORT_URL
         )
+        cache_dir = os.getenv("CREDITCARDBONUSES_CACHE_DIR") or None
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
 
         timeout_raw = os.getenv("CREDITCARDBONUSES_TIMEOUT_SEC", "15").strip()
         try:
@@ -86,14 +95,13 @@ class CreditCardBonusesClient(BaseAPIClient):
                 )
 
             # Parse export_url into base_url + endpoint path so we can use BaseAPIClient.get_json()
-            parsed = urlparse(self.export_url)
-            if not parsed.scheme or not parsed.netloc:
+            split = _split_export_url(self.export_url)
+            if split is None:
                 raise CreditCardBonusesConfigError(
                     f"CREDITCARDBONUSES_EXPORT_URL is not a valid URL: '{self.export_url}'"
                 )
 
-            self._export_endpoint = parsed.path  # includes leading '/'
-            export_base_url = f"{parsed.scheme}://{parsed.netloc}"
+            export_base_url, self._export_endpoint = split  # path keeps leading '/'
 
             super().__init__(
                 base_url=export_base_url,
@@ -117,6 +125,16 @@ class CreditCardBonusesClient(BaseAPIClient):
         data = self._fetch_from_public_export()
         return self._coerce_offers_list(data, source_hint="public_export")
 
+    async def fetch_current_offers_async(self) -> List[Dict[str, Any]]:
+        """
+        Awaitable variant of fetch_current_offers().
+
+        The fetch runs in a worker thread on the shared pooled session, so
+        several sources can be fetched concurrently with asyncio.gather and
+        the total wait is the slowest fetch rather than the sum.
+        """
+        return await asyncio.to_thread(self.fetch_current_offers)
+
     def fetch_normalized_offers(self) -> List["CardOffer"]:
         """
         Fetch all offers and return them as normalized CardOffer objects.
@@ -141,16 +159,9 @@ class CreditCardBonusesClient(BaseAPIClient):
         # Step 1: Fetch raw data from API or public export
         raw_offers = self.fetch_current_offers()
 
-        # Step 2: Normalize each offer, filtering out invalid ones
-        normalized = []
-        failed_count = 0
-
-        for raw in raw_offers:
-            offer = normalize_creditcardbonuses_offer(raw)
-            if offer is not None:
-                normalized.append(offer)
-            else:
-                failed_count += 1
+        # Step 2: Normalize the whole batch, filtering out invalid ones
+        normalized = normalize_all(raw_offers)
+        failed_count = len(raw_offers) - len(normalized)
 
         # Step 3: Log results for monitoring
         logger.info(
@@ -197,14 +208,81 @@ class CreditCardBonusesClient(BaseAPIClient):
     def _fetch_from_public_export(self) -> Any:
         """
         Temporary fallback: fetch the GitHub export JSON using BaseAPIClient.
+
+        If CREDITCARDBONUSES_CACHE_DIR is set, the export is fetched
+        conditionally (If-None-Match) and a 304 is served from the cached copy.
         """
         try:
-            return self.get_json(endpoint=self._export_endpoint)
+            if self.cache_dir is not None:
+                return self._fetch_export_conditional(self.cache_dir)
+            # Plain unauthenticated download: bypass requests' per-call overhead.
+            body = self.get_bytes(endpoint=self._export_endpoint)
         except (APIClientTimeout, APIClientHTTPError, APIClientError) as e:
             raise CreditCardBonusesUpstreamError(
                 f"Public export fetch failed: {e}"
             ) from e
 
+        try:
+            return orjson.loads(body)
+        except ValueError as e:
+            raise CreditCardBonusesUpstreamError(
+                f"Public export fetch failed: invalid JSON from {self.export_url}"
+            ) from e
+
+    def _fetch_export_conditional(self, cache_dir: Path) -> Any:
+        """
+        ETag-aware export fetch.
+
+        The last body is kept gzip-compressed next to its ETag; GitHub's raw
+        endpoint answers 304 with no body when the export is unchanged.
+        """
+        etag_path = cache_dir / "ccb_export.etag"
+        body_path = cache_dir / "ccb_export.json.gz"
+
+        headers: Dict[str, str] = {}
+        if etag_path.is_file() and body_path.is_file():
+            headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+
+        response = self.get_response(self._export_endpoint, headers=headers)
+
+        if response.status_code == 304 and headers:
+            logger.info("CreditCardBonuses export unchanged (304); using cache.")
+            try:
+                return orjson.loads(gzip.decompress(body_path.read_bytes()))
+            except (OSError, EOFError, zlib.error, ValueError) as e:
+                # Missing, truncated or corrupt cache: drop it and refetch
+                logger.warning(
+                    "Export cache in %s is unreadable (%s); refetching.", cache_dir, e
+                )
+                for path in (etag_path, body_path):
+                    try:
+                        path.unlink(missing_ok=True)
+                    except OSError:
+                        pass
+                response = self.get_response(self._export_endpoint)
+
+        try:
+            # Same parse as get_json(): orjson straight from the raw bytes.
+            data = orjson.loads(response.content)
+        except ValueError as e:
+            raise APIClientError(
+                f"Invalid JSON returned from {self._url(self._export_endpoint)}"
+            ) from e
+
+        etag = response.headers.get("ETag")
+        if etag:
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                # Drop the old ETag first so a half-updated cache never pairs
+                # a stale ETag with a newer body.
+                etag_path.unlink(missing_ok=True)
+                _replace_bytes(body_path, gzip.compress(response.content, 6))
+                _replace_bytes(etag_path, etag.encode("utf-8"))
+            except OSError as e:
+                logger.warning("Could not update export cache in %s: %s", cache_dir, e)
+
+        return data
+
     # -------------------------------------------------
     # Helpers
     # -------------------------------------------------
@@ -217,16 +295,47 @@ class CreditCardBonusesClient(BaseAPIClient):
         - {"data": list[dict]}
         - {"results": list[dict]}
         """
+        records: Optional[List[Any]] = None
         if isinstance(data, list):
-            return [x for x in data if isinstance(x, dict)]
-
-        if isinstance(data, dict):
+            records = data
+        elif isinstance(data, dict):
             for key in ("offers", "data", "results"):
                 val = data.get(key)
                 if isinstance(val, list):
-                    return [x for x in val if isinstance(x, dict)]
+                    records = val
+                    break
 
-        raise CreditCardBonusesUpstreamError(
-            f"Unexpected {source_hint} response shape; expected list[object] "
-            f"or object with offers/data/results list."
-        )
+        if records is None:
+            raise CreditCardBonusesUpstreamError(
+                f"Unexpected {source_hint} response shape; expected list[object] "
+                f"or object with offers/data/results list."
+            )
+
+        # The export is normally all objects: hand the parsed list straight
+        # through instead of holding a filtered copy alongside it.
+        if all(isinstance(x, dict) for x in records):
+            return records
+        return list(_iter_dict_records(records))
+
+
+def _iter_dict_records(records: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """Lazily yield only the object-shaped records of an export."""
+    for record in records:
+        if isinstance(record, dict):
+            yield record
+
+
+@lru_cache(maxsize=16)
+def _split_export_url(url: str) -> Optional[Tuple[str, str]]:
+    """(base_url, path) for an export URL, or None if it has no scheme/host."""
+    parsed = urlparse(url)
+    if not parsed.scheme or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}", parsed.path
+
+
+def _replace_bytes(dest: Path, data: bytes) -> None:
+    """Write via a temp file + os.replace so readers never see partial data."""
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, dest)
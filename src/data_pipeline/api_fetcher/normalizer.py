@@ -1,8 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .schema import CardOffer
+import numpy as np
+
+from .schema import (
+    CardOffer,
+    coerce_float,
+    compress_raw,
+    current_batch_timestamp,
+    dicts_only,
+    utc_now_iso,
+)
+
+__all__ = ["normalize_creditcardbonuses_offer", "normalize_all"]
+
+
+# Exact-type checks: parsed JSON only yields these concrete types, and a
+# set lookup on type() is cheaper than isinstance() against a tuple. bool is
+# listed because isinstance(True, int) held for the previous checks.
+_NUMBER_TYPES = frozenset({int, float, bool})
 
 
 def _extract_offer_amount(offer: Dict[str, Any]) -> float:
@@ -11,39 +33,93 @@ def _extract_offer_amount(offer: Dict[str, Any]) -> float:
     Return first numeric amount if found.
     """
     amt = offer.get("amount")
-    if isinstance(amt, list) and amt:
-        first = amt[0]
-        if isinstance(first, dict) and isinstance(first.get("amount"), (int, float)):
-            return float(first["amount"])
-    if isinstance(amt, (int, float)):
+    t = type(amt)
+    if t is list:
+        if amt:
+            first = amt[0]
+            if isinstance(first, dict):
+                inner = first.get("amount")
+                if type(inner) in _NUMBER_TYPES:
+                    return float(inner)
+        return 0.0
+    if t in _NUMBER_TYPES:
         return float(amt)
     return 0.0
 
 
 def _extract_offer_spend(offer: Dict[str, Any]) -> float:
     spend = offer.get("spend")
-    return float(spend) if isinstance(spend, (int, float)) else 0.0
+    return float(spend) if type(spend) in _NUMBER_TYPES else 0.0
 
 
 def _extract_offer_days(offer: Dict[str, Any]) -> float:
     days = offer.get("days")
-    return float(days) if isinstance(days, (int, float)) else 0.0
+    return float(days) if type(days) in _NUMBER_TYPES else 0.0
+
+
+# Below this many candidate offers the plain Python loop beats NumPy's
+# array-construction overhead (typical cards carry only a handful).
+_VECTORIZE_MIN_OFFERS = 16
+
 
+def _offers_to_arrays(
+    offers: List[Dict[str, Any]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extract (amount, spend, days) columns for a list of offer dicts."""
+    n = len(offers)
+    amt = np.fromiter(map(_extract_offer_amount, offers), dtype=np.float64, count=n)
+    spend = np.fromiter(map(_extract_offer_spend, offers), dtype=np.float64, count=n)
+    days = np.fromiter(map(_extract_offer_days, offers), dtype=np.float64, count=n)
+    return amt, spend, days
 
-def _pick_best_offer(raw_offer: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+
+def _best_idx(amt: np.ndarray, spend: np.ndarray, days: np.ndarray) -> int:
+    """
+    Index of the best (ratio, amount, -days) row, first occurrence on ties.
+
+    Cascaded masked max: three linear passes instead of a full sort.
+    """
+    ratio = np.divide(amt, spend, out=np.zeros_like(amt), where=spend > 0)
+    neg_days = -days
+    mask = ratio == ratio.max()
+    mask &= amt == amt[mask].max()
+    mask &= neg_days == neg_days[mask].max()
+    idx = int(np.argmax(mask))
+    key = (float(ratio[idx]), float(amt[idx]), float(neg_days[idx]))
+    return idx if key > (-1.0, -1.0, -1.0) else -1
+
+
+def _best_offer_index(offers: List[Dict[str, Any]]) -> int:
+    """
+    Vectorized selection over many offers; same ordering as the scalar loop
+    in _pick_best_offer (first occurrence wins ties). Returns -1 if nothing
+    beats the (-1, -1, -1) sentinel.
     """
-    Choose a 'best' offer from raw_offer["offers"] (fallback to historicalOffers).
+    return _best_idx(*_offers_to_arrays(offers))
+
+
+def _pick_best_offer(
+    offers: List[Any], historical_offers: List[Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Choose a 'best' offer from offers (fallback to historical_offers).
     Heuristic:
       - Prefer highest amount/spend ratio
       - Tie-break by highest amount
       - Tie-break by shortest days
     """
-    offers = raw_offer.get("offers")
-    if not isinstance(offers, list) or not offers:
-        offers = raw_offer.get("historicalOffers")
-        if not isinstance(offers, list) or not offers:
+    if not offers:
+        offers = historical_offers
+        if not offers:
             return None
 
+    if len(offers) >= _VECTORIZE_MIN_OFFERS:
+        dict_offers = [o for o in offers if isinstance(o, dict)]
+        if not dict_offers:
+            return None
+        idx = _best_offer_index(dict_offers)
+        return dict_offers[idx] if idx >= 0 else None
+
     best = None
     best_key: Tuple[float, float, float] = (-1.0, -1.0, -1.0)
 
@@ -64,6 +140,21 @@ def _pick_best_offer(raw_offer: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return best
 
 
+_FMT = "{:,}".format
+
+# Low-cardinality fields (~10 issuers, a handful of networks/currencies) are
+# interned so every CardOffer of a batch shares one str object per value.
+_intern = sys.intern
+
+
+def _preserve_raw() -> bool:
+    return os.getenv("REWARDSENSE_PRESERVE_RAW", "1").strip().lower() not in (
+        "0",
+        "false",
+        "no",
+    )
+
+
 def _build_welcome_bonus_text(best_offer: Dict[str, Any]) -> Optional[str]:
     """
     Build a readable string:
@@ -77,15 +168,18 @@ def _build_welcome_bonus_text(best_offer: Dict[str, Any]) -> Optional[str]:
     spend = _extract_offer_spend(best_offer)
     days = _extract_offer_days(best_offer)
 
-    parts = []
-    if amt > 0:
-        parts.append(f"{int(amt):,} bonus")
-    if spend > 0:
-        parts.append(f"after ${int(spend):,} spend")
-    if days > 0:
-        parts.append(f"in {int(days)} days")
-
-    return " ".join(parts) if parts else None
+    # int() truncates like before; "{:.0f}" would round instead.
+    text = " ".join(
+        filter(
+            None,
+            (
+                _FMT(int(amt)) + " bonus" if amt > 0 else "",
+                "after $" + _FMT(int(spend)) + " spend" if spend > 0 else "",
+                f"in {int(days)} days" if days > 0 else "",
+            ),
+        )
+    )
+    return text or None
 
 
 def normalize_creditcardbonuses_offer(raw_offer: Dict[str, Any]) -> Optional[CardOffer]:
@@ -100,42 +194,55 @@ def normalize_creditcardbonuses_offer(raw_offer: Dict[str, Any]) -> Optional[Car
     We preserve "everything" by:
       - copying structured lists (offers, historicalOffers, credits)
       - copying metadata (card_id, network, currency, etc.)
-      - storing full raw payload in `raw`
+      - storing full raw payload in `raw` (compressed; set
+        REWARDSENSE_PRESERVE_RAW=0 to skip it)
     """
+    return _normalize_offer(raw_offer, _preserve_raw())
+
+
+def _normalize_offer(raw_offer: Any, preserve_raw: bool) -> Optional[CardOffer]:
+    """normalize_creditcardbonuses_offer with the raw-payload switch resolved."""
+    fields = _to_offer_dict(raw_offer, preserve_raw)
+    if fields is None:
+        return None
+    # Trusted, pre-coerced values: skip CardOffer's validators.
+    return CardOffer.model_construct(**fields)
+
+
+def _to_offer_dict(
+    raw_offer: Dict[str, Any], preserve_raw: bool
+) -> Optional[Dict[str, Any]]:
+    """CardOffer field values for one export record, or None if unusable."""
     if not isinstance(raw_offer, dict):
         return None
 
-    card_name = raw_offer.get("name")
-    issuer = raw_offer.get("issuer")
+    g = raw_offer.get
+    card_name = g("name")
+    issuer = g("issuer")
     if not card_name or not issuer:
         return None
 
     # Core mappings
-    annual_fee = raw_offer.get("annualFee")
-    offer_url = raw_offer.get("url")
+    annual_fee = g("annualFee")
+    offer_url = g("url")
 
     # Upstream metadata
-    card_id = raw_offer.get("cardId")
-    network = raw_offer.get("network")
-    currency = raw_offer.get("currency")
-    is_business = raw_offer.get("isBusiness")
-    is_annual_fee_waived = raw_offer.get("isAnnualFeeWaived")
-    ucb = raw_offer.get("universalCashbackPercent")
-    image_url = raw_offer.get("imageUrl")
-    discontinued = raw_offer.get("discontinued")
-
-    # Offers lists
-    offers = (
-        raw_offer.get("offers") if isinstance(raw_offer.get("offers"), list) else []
-    )
-    historical_offers = (
-        raw_offer.get("historicalOffers")
-        if isinstance(raw_offer.get("historicalOffers"), list)
-        else []
-    )
-    credits = (
-        raw_offer.get("credits") if isinstance(raw_offer.get("credits"), list) else []
-    )
+    card_id = g("cardId")
+    network = g("network")
+    currency = g("currency")
+    is_business = g("isBusiness")
+    is_annual_fee_waived = g("isAnnualFeeWaived")
+    ucb = g("universalCashbackPercent")
+    image_url = g("imageUrl")
+    discontinued = g("discontinued")
+
+    # Offers lists (looked up once; reused for best-offer selection)
+    offers = g("offers")
+    offers = offers if isinstance(offers, list) else []
+    historical_offers = g("historicalOffers")
+    historical_offers = historical_offers if isinstance(historical_offers, list) else []
+    credits = g("credits")
+    credits = credits if isinstance(credits, list) else []
 
     # Reward rates: store baseline rate in a neutral key
     reward_rates = {}
@@ -143,42 +250,90 @@ def normalize_creditcardbonuses_offer(raw_offer: Dict[str, Any]) -> Optional[Car
         reward_rates["universal_base_rate"] = float(ucb)
 
     # Welcome bonus: pick best offer and format
-    best_offer = _pick_best_offer(raw_offer)
+    best_offer = _pick_best_offer(offers, historical_offers)
     welcome_bonus = _build_welcome_bonus_text(best_offer) if best_offer else None
 
     # categories / apr / bonus_value_usd are not present in this export
-    # (keep them empty/None unless you later enrich from scrapers)
+    # (keep them empty/None unless you later enrich from scrapers).
+    # Every value is already coerced to its CardOffer field type.
+    return dict(
+        source="creditcardbonuses",
+        card_name=str(card_name),
+        issuer=_intern(str(issuer)),
+        annual_fee=coerce_float(annual_fee),
+        welcome_bonus=welcome_bonus,
+        bonus_value_usd=None,
+        reward_rates=reward_rates,
+        categories=[],
+        apr=None,
+        offer_url=str(offer_url) if offer_url is not None else None,
+        # metadata
+        card_id=str(card_id) if card_id else None,
+        network=_intern(str(network)) if network else None,
+        currency=_intern(str(currency)) if currency else None,
+        is_business=is_business if isinstance(is_business, bool) else None,
+        is_annual_fee_waived=(
+            is_annual_fee_waived if isinstance(is_annual_fee_waived, bool) else None
+        ),
+        universal_cashback_percent=coerce_float(ucb),
+        image_url=str(image_url) if image_url else None,
+        discontinued=discontinued if isinstance(discontinued, bool) else None,
+        # preserve upstream structures
+        offers=dicts_only(offers),
+        historical_offers=dicts_only(historical_offers),
+        credits=dicts_only(credits),
+        # preserve raw payload (compressed; REWARDSENSE_PRESERVE_RAW=0 skips it)
+        raw_blob=compress_raw(raw_offer) if preserve_raw else None,
+    )
+
+
+# Normalizing a record takes microseconds, so a process pool only pays off
+# for very large exports; it is opt-in (max_workers > 1) and still skipped
+# below this many records, where spawn start-up and pickling dominate.
+_PARALLEL_MIN_RECORDS = 1000
+_PARALLEL_CHUNKSIZE = 64
+
+
+def _normalize_batch_chunk(
+    raw_offer: Dict[str, Any], timestamp: str, preserve_raw: bool
+) -> Optional[CardOffer]:
+    """Process-pool worker: context vars do not cross process boundaries."""
+    token = current_batch_timestamp.set(timestamp)
     try:
-        return CardOffer(
-            source="creditcardbonuses",
-            card_name=str(card_name),
-            issuer=str(issuer),
-            annual_fee=annual_fee,
-            welcome_bonus=welcome_bonus,
-            bonus_value_usd=None,
-            reward_rates=reward_rates,
-            categories=[],
-            apr=None,
-            offer_url=offer_url,
-            # metadata
-            card_id=str(card_id) if card_id else None,
-            network=str(network) if network else None,
-            currency=str(currency) if currency else None,
-            is_business=bool(is_business) if isinstance(is_business, bool) else None,
-            is_annual_fee_waived=(
-                bool(is_annual_fee_waived)
-                if isinstance(is_annual_fee_waived, bool)
-                else None
-            ),
-            universal_cashback_percent=ucb,
-            image_url=str(image_url) if image_url else None,
-            discontinued=bool(discontinued) if isinstance(discontinued, bool) else None,
-            # preserve upstream structures
-            offers=offers,
-            historical_offers=historical_offers,
-            credits=credits,
-            # preserve raw payload
-            raw=raw_offer,
+        return _normalize_offer(raw_offer, preserve_raw)
+    finally:
+        current_batch_timestamp.reset(token)
+
+
+def normalize_all(raw_offers: Iterable[Any], max_workers: int = 1) -> List[CardOffer]:
+    """
+    Batch entrypoint: normalize every record of an export in one call.
+
+    Invalid/incomplete records are dropped (same rules as
+    normalize_creditcardbonuses_offer); input order is preserved, and all
+    records share one `last_updated` timestamp.
+
+    Records are normalized sequentially by default. Pass max_workers > 1 to
+    opt into a process pool for batches of at least _PARALLEL_MIN_RECORDS.
+    """
+    raw_offers = list(raw_offers)
+    timestamp = utc_now_iso()
+    # Resolved once per batch rather than once per record.
+    preserve_raw = _preserve_raw()
+
+    if max_workers > 1 and len(raw_offers) >= _PARALLEL_MIN_RECORDS:
+        # "spawn" is safe even when called from a threaded orchestrator.
+        ctx = multiprocessing.get_context("spawn")
+        worker = partial(
+            _normalize_batch_chunk, timestamp=timestamp, preserve_raw=preserve_raw
         )
-    except Exception:
-        return None
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=ctx) as ex:
+            results = ex.map(worker, raw_offers, chunksize=_PARALLEL_CHUNKSIZE)
+            return [offer for offer in results if offer is not None]
+
+    token = current_batch_timestamp.set(timestamp)
+    try:
+        results = (_normalize_offer(raw, preserve_raw) for raw in raw_offers)
+        return [offer for offer in results if offer is not None]
+    finally:
+        current_batch_timestamp.reset(token)
@@ -1,9 +1,70 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import zlib
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+__all__ = [
+    "CardOffer",
+    "coerce_float",
+    "compress_raw",
+    "current_batch_timestamp",
+    "dicts_only",
+    "utc_now_iso",
+    "validate_card_offers",
+]
+
+
+# Set by batch producers (see normalizer.normalize_all) so every record of a
+# batch shares one timestamp instead of formatting a fresh one per record.
+current_batch_timestamp: ContextVar[Optional[str]] = ContextVar(
+    "current_batch_timestamp", default=None
+)
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _default_last_updated() -> str:
+    return current_batch_timestamp.get() or utc_now_iso()
+
+
+def compress_raw(raw: Dict[str, Any]) -> bytes:
+    """Pack a raw upstream record into the compact form kept on CardOffer."""
+    return zlib.compress(orjson.dumps(raw), 1)
+
+
+def coerce_float(v: Any) -> Optional[float]:
+    """Parse numbers and "$1,234"-style strings; anything else becomes None."""
+    if v is None:
+        return None
+    try:
+        if isinstance(v, str):
+            v = v.replace("$", "").replace(",", "").strip()
+        return float(v)
+    except (ValueError, TypeError):
+        return None
+
+
+def dicts_only(v: Any) -> List[Dict[str, Any]]:
+    """Keep only the dict entries of a list; non-lists become []."""
+    if isinstance(v, list):
+        return [x for x in v if isinstance(x, dict)]
+    return []
 
 
 class CardOffer(BaseModel):
@@ -15,8 +76,19 @@ class CardOffer(BaseModel):
     - Normalized for downstream use (card_name, annual_fee, welcome_bonus, etc.)
     - Enriched with optional upstream metadata when available (currency, network, etc.)
     - Able to preserve the full raw upstream record for debugging/auditing via `raw`
+
+    Validators below clean dirty external input. Producers that already emit
+    clean values (e.g. the API normalizer) can use `CardOffer.model_construct`
+    with `coerce_float`/`dicts_only` and skip validation entirely.
     """
 
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        validate_default=False,
+        revalidate_instances="never",
+    )
+
     # --- Required core metadata ---
     source: str = Field(..., description="Data source name")
     card_name: str = Field(..., description="Official name of the credit card")
@@ -81,19 +153,42 @@ class CardOffer(BaseModel):
     )
 
     # --- Full raw payload (optional but useful for debugging/auditing) ---
-    raw: Optional[Dict[str, Any]] = Field(
-        default=None, description="Full raw upstream record (for debugging/auditing)"
+    # Held as compressed JSON and only decoded when `raw` is read, so a batch
+    # does not pin a second copy of every upstream dict graph.
+    raw_blob: Optional[bytes] = Field(
+        default=None,
+        exclude=True,
+        repr=False,
+        description="zlib-compressed JSON of the raw upstream record",
     )
 
     last_updated: str = Field(
-        default_factory=lambda: datetime.utcnow().isoformat(),
+        default_factory=_default_last_updated,
         description="ISO timestamp when record was created",
     )
 
+    @computed_field(description="Full raw upstream record (for debugging/auditing)")
+    @property
+    def raw(self) -> Optional[Dict[str, Any]]:
+        if self.raw_blob is None:
+            return None
+        return orjson.loads(zlib.decompress(self.raw_blob))
+
     # ------------------------------
     # Field Validators (Pydantic v2)
     # ------------------------------
 
+    @model_validator(mode="before")
+    @classmethod
+    def pack_raw(cls, data):
+        # Keep accepting raw={...} from callers building CardOffer directly.
+        if isinstance(data, dict) and "raw" in data:
+            data = dict(data)
+            raw = data.pop("raw")
+            if isinstance(raw, dict) and data.get("raw_blob") is None:
+                data["raw_blob"] = compress_raw(raw)
+        return data
+
     @field_validator(
         "annual_fee",
         "bonus_value_usd",
@@ -102,14 +197,7 @@ class CardOffer(BaseModel):
     )
     @classmethod
     def validate_numeric_fields(cls, v):
-        if v is None:
-            return None
-        try:
-            if isinstance(v, str):
-                v = v.replace("$", "").replace(",", "").strip()
-            return float(v)
-        except (ValueError, TypeError):
-            return None
+        return coerce_float(v)
 
     @field_validator("reward_rates", mode="before")
     @classmethod
@@ -138,8 +226,29 @@ class CardOffer(BaseModel):
     @field_validator("offers", "historical_offers", "credits", mode="before")
     @classmethod
     def validate_list_of_dicts(cls, v):
-        if v is None:
-            return []
-        if isinstance(v, list):
-            return [x for x in v if isinstance(x, dict)]
-        return []
+        return dicts_only(v)
+
+
+_CARD_OFFER_LIST = TypeAdapter(List[CardOffer])
+
+
+def validate_card_offers(records: Iterable[Dict[str, Any]]) -> List[CardOffer]:
+    """
+    Validate many untrusted dicts into CardOffers in one pydantic-core call.
+
+    If any record fails, falls back to per-record validation and drops the
+    invalid ones (input order is preserved).
+    """
+    records = list(records)
+    try:
+        return _CARD_OFFER_LIST.validate_python(records)
+    except ValidationError:
+        pass
+
+    offers = []
+    for record in records:
+        try:
+            offers.append(CardOffer.model_validate(record))
+        except ValidationError:
+            continue
+    return offers
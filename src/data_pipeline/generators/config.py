@@ -8,6 +8,8 @@ and temporal patterns used by the generators.
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
+import numpy as np
+
 # ---------------------------------------------------------------------------
 # MCC (Merchant Category Code) mapping
 # Maps standardized spending categories to representative MCC ranges.
@@ -375,6 +377,12 @@ CARD_PORTFOLIO_TEMPLATES: Dict[str, List[str]] = {
     ],
 }
 
+# Every card that appears in a template, in first-seen order, and its code
+GLOBAL_CARD_VOCAB: List[str] = list(
+    dict.fromkeys(card for cards in CARD_PORTFOLIO_TEMPLATES.values() for card in cards)
+)
+CARD_INDEX: Dict[str, int] = {card: i for i, card in enumerate(GLOBAL_CARD_VOCAB)}
+
 # ---------------------------------------------------------------------------
 # Redemption preferences
 # ---------------------------------------------------------------------------
@@ -411,6 +419,38 @@ SEASONAL_MULTIPLIERS: Dict[str, Dict[int, float]] = {
 # Default multiplier when no seasonal adjustment applies
 DEFAULT_SEASONAL_MULTIPLIER: float = 1.0
 
+# Column position of each spending category in dense per-category tables
+CATEGORY_ORDER: List[str] = list(SPENDING_CATEGORIES)
+CATEGORY_INDEX: Dict[str, int] = {name: i for i, name in enumerate(CATEGORY_ORDER)}
+
+# Row position of each archetype, and the dense (num_archetypes,
+# num_categories) weight matrix; categories an archetype omits weigh 0.0
+ARCHETYPE_INDEX: Dict[str, int] = {a.name: i for i, a in enumerate(SPENDING_ARCHETYPES)}
+ARCHETYPE_WEIGHTS: np.ndarray = np.array(
+    [
+        [a.category_weights.get(cat, 0.0) for cat in CATEGORY_ORDER]
+        for a in SPENDING_ARCHETYPES
+    ],
+    dtype=np.float64,
+)
+
+
+def _build_seasonal_table() -> np.ndarray:
+    """Dense (13, num_categories) multiplier table indexed as [month, category].
+
+    Row 0 is unused so calendar months (1-12) index directly.
+    """
+    table = np.full(
+        (13, len(CATEGORY_INDEX)), DEFAULT_SEASONAL_MULTIPLIER, dtype=np.float64
+    )
+    for category, by_month in SEASONAL_MULTIPLIERS.items():
+        for month, multiplier in by_month.items():
+            table[month, CATEGORY_INDEX[category]] = multiplier
+    return table
+
+
+SEASONAL_TABLE: np.ndarray = _build_seasonal_table()
+
 # ---------------------------------------------------------------------------
 # Transaction amount distributions per category (mean, std)
 # Used to generate realistic individual transaction amounts.
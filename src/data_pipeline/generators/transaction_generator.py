@@ -8,19 +8,28 @@ day-of-week effects, and per-category amount distributions.
 All output is fully reproducible when using a fixed seed.
 """
 
+import calendar
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
 from src.data_pipeline.generators.config import (
+    ARCHETYPE_INDEX,
+    ARCHETYPE_WEIGHTS,
+    CARD_INDEX,
+    CATEGORY_ORDER,
     DEFAULT_HISTORY_MONTHS,
-    DEFAULT_SEASONAL_MULTIPLIER,
     DEFAULT_SEED,
+    GLOBAL_CARD_VOCAB,
     MIN_TRANSACTION_AMOUNT,
-    SEASONAL_MULTIPLIERS,
+    SEASONAL_TABLE,
     SPENDING_ARCHETYPES,
     SPENDING_CATEGORIES,
     TRANSACTION_AMOUNT_PARAMS,
@@ -29,6 +38,109 @@ from src.data_pipeline.generators.config import (
 logger = logging.getLogger(__name__)
 
 
+# Per-user column buffers; "category", "merchant" and "card_used" hold codes
+# that _build_frame() turns into pandas Categoricals, and "date" stays at day
+# resolution until the whole chunk is converted once.
+_COLUMN_DTYPES: Dict[str, object] = {
+    "user_id": object,
+    "date": "datetime64[D]",
+    "category": np.intp,
+    "merchant": np.intp,
+    "mcc_code": np.int32,
+    "amount": np.float64,
+    "card_used": np.intp,
+}
+
+# Day-of-week effects: weekends get higher weight for discretionary
+# categories, weekdays for essentials like utilities and insurance, and
+# monthly bills tend to cluster around the 1st or 15th.
+_WEEKEND_HEAVY = frozenset({"dining", "entertainment", "online_shopping", "travel"})
+_WEEKDAY_HEAVY = frozenset({"utilities", "insurance"})
+_BILL_LIKE = frozenset({"utilities", "insurance", "streaming"})
+_DAY_CLASSES = ("bill", "weekend", "weekday", "uniform")
+
+
+def _day_class(category: str) -> str:
+    if category in _BILL_LIKE:
+        return "bill"
+    if category in _WEEKEND_HEAVY:
+        return "weekend"
+    if category in _WEEKDAY_HEAVY:
+        return "weekday"
+    return "uniform"
+
+
+def _day_weights(day_class: str, days_in_month: int) -> np.ndarray:
+    """Normalized sampling weights over days 1..days_in_month."""
+    days = np.arange(1, days_in_month + 1)
+    # approximate: days 6,7,13,14,20,21,27,28 as weekends
+    weekend = np.isin(days % 7, (6, 0))
+
+    if day_class == "bill":
+        # cluster around day 1-5 and 15-20
+        weights = np.where((days <= 5) | ((days >= 15) & (days <= 20)), 3.0, 1.0)
+    elif day_class == "weekend":
+        weights = np.where(weekend, 1.8, 1.0)
+    elif day_class == "weekday":
+        weights = np.where(weekend, 1.0, 1.3)
+    else:
+        weights = np.ones(days_in_month)
+    return weights / weights.sum()
+
+
+def _build_day_cdf() -> np.ndarray:
+    """Day-of-month CDFs indexed [day class, days_in_month - 28, day - 1].
+
+    Days past the month end are padded with 1.0 so they are never drawn.
+    """
+    table = np.ones((len(_DAY_CLASSES), 4, 31), dtype=np.float64)
+    for c, day_class in enumerate(_DAY_CLASSES):
+        for days_in_month in range(28, 32):
+            cdf = np.cumsum(_day_weights(day_class, days_in_month))
+            cdf[-1] = 1.0
+            table[c, days_in_month - 28, :days_in_month] = cdf
+    return table
+
+
+_DAY_CDF = _build_day_cdf()
+
+
+def _date_order(dates: np.ndarray) -> np.ndarray:
+    """Stable permutation that sorts day-resolution datetime64 values."""
+    if len(dates) == 0:
+        return np.arange(0)
+    days = dates.astype("datetime64[D]").astype(np.int64)
+    days -= days.min()
+    # 16-bit keys take numpy's radix sort path for kind="stable"
+    if days.max() < np.iinfo(np.int16).max:
+        days = days.astype(np.int16)
+    return np.argsort(days, kind="stable")
+
+
+def _transaction_ids(first_id: int, n: int) -> np.ndarray:
+    """``txn_`` ids for ``first_id .. first_id + n - 1``, zero-padded to 7 digits."""
+    # A format spec pads to at least 7 digits and never truncates; np.char.zfill
+    # sizes its output to the pad width, so id 10,000,000 would repeat "1000000".
+    return np.array(
+        [f"txn_{i:07d}" for i in range(first_id, first_id + n)], dtype=object
+    )
+
+
+# Below this many users, process start-up costs more than it saves.
+_PARALLEL_MIN_USERS = 500
+
+_OUTPUT_COLUMNS = [
+    "transaction_id",
+    "user_id",
+    "date",
+    "category",
+    "merchant",
+    "mcc_code",
+    "amount",
+    "card_used",
+]
+
+
 class TransactionGenerator:
     """Generates synthetic transactions for a set of user profiles.
 
@@ -47,6 +159,10 @@ class TransactionGenerator:
     start_date : datetime, optional
         Start date of the transaction window. Defaults to
         ``history_months`` months before today.
+    n_workers : int
+        Worker processes used by ``generate()`` and ``generate_iter()`` for
+        large user sets. Each user draws from its own RNG stream spawned from
+        ``seed``, so output is identical for any worker count.
     """
 
     def __init__(
@@ -54,10 +170,12 @@ class TransactionGenerator:
         seed: int = DEFAULT_SEED,
         history_months: int = DEFAULT_HISTORY_MONTHS,
         start_date: Optional[datetime] = None,
+        n_workers: int = 1,
     ) -> None:
         self.seed = seed
         self.history_months = history_months
-        self._rng = np.random.default_rng(seed)
+        self.n_workers = max(1, n_workers)
+        self._seed_seq = np.random.SeedSequence(seed)
         self._archetype_map = {a.name: a for a in SPENDING_ARCHETYPES}
 
         if start_date is None:
@@ -68,6 +186,65 @@ class TransactionGenerator:
 
         self.end_date = self.start_date + timedelta(days=history_months * 30)
 
+        # (year, month, days_in_month) for every month touched by the window
+        self._months: List[Tuple[int, int, int]] = []
+        year, month = self.start_date.year, self.start_date.month
+        while datetime(year, month, 1) < self.end_date:
+            self._months.append((year, month, calendar.monthrange(year, month)[1]))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        self._month_numbers = np.array([m for _, m, _ in self._months])
+        self._month_lengths = np.array([dim for _, _, dim in self._months])
+        self._month_starts = np.array(
+            [f"{y:04d}-{m:02d}-01" for y, m, _ in self._months], dtype="datetime64[D]"
+        )
+
+        # Dense, category-aligned lookup tables so each (user, month) is a
+        # handful of vector ops instead of a Python loop over categories.
+        self._category_order = CATEGORY_ORDER
+        self._arch_weights = ARCHETYPE_WEIGHTS
+        self._active_categories = [
+            np.flatnonzero(row > 0) for row in self._arch_weights
+        ]
+        amount_params = [
+            TRANSACTION_AMOUNT_PARAMS.get(cat, (50.0, 25.0))
+            for cat in self._category_order
+        ]
+        self._mean_vec = np.array([m for m, _ in amount_params], dtype=np.float64)
+        self._std_vec = np.array([sd for _, sd in amount_params], dtype=np.float64)
+        # flat merchant / MCC tables with per-category offsets, so a month's
+        # picks are one integer draw plus an index instead of rng.choice per txn
+        cat_infos = [
+            SPENDING_CATEGORIES.get(cat, SPENDING_CATEGORIES["other"])
+            for cat in self._category_order
+        ]
+        merchant_lists = [info["merchants"] for info in cat_infos]
+        mcc_lists = [info["mcc_codes"] for info in cat_infos]
+        self._merchant_names: List[str] = list(
+            dict.fromkeys(m for merchants in merchant_lists for m in merchants)
+        )
+        merchant_code = {m: i for i, m in enumerate(self._merchant_names)}
+        self._merchant_table = np.array(
+            [merchant_code[m] for merchants in merchant_lists for m in merchants],
+            dtype=np.intp,
+        )
+        self._merchant_counts = np.array([len(m) for m in merchant_lists])
+        self._merchant_offsets = (
+            np.cumsum(self._merchant_counts) - self._merchant_counts
+        )
+        self._mcc_table = np.array(
+            [c for codes in mcc_lists for c in codes], dtype=np.int32
+        )
+        self._mcc_counts = np.array([len(c) for c in mcc_lists])
+        self._mcc_offsets = np.cumsum(self._mcc_counts) - self._mcc_counts
+        self._category_day_class = np.array(
+            [_DAY_CLASSES.index(_day_class(cat)) for cat in self._category_order]
+        )
+        self._day_cdf = _DAY_CDF
+        # the same tables resolved per window month, shared by every user:
+        # seasonal multipliers (month, category) and day CDFs (class, month)
+        self._seasonal_rows = SEASONAL_TABLE[self._month_numbers]
+        self._month_day_cdf = self._day_cdf[:, self._month_lengths - 28]
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -84,8 +261,42 @@ class TransactionGenerator:
         -------
         pd.DataFrame
             Columns: transaction_id, user_id, date, category, merchant,
-            mcc_code, amount, card_used
+            mcc_code, amount, card_used. ``category``, ``merchant`` and
+            ``card_used`` are Categoricals and ``mcc_code`` is int32;
+            ``amount`` stays float64 so cent values are exact.
         """
+        # a single chunk covering every user, so the frame is date-sorted
+        # as a whole rather than per chunk
+        (df,) = self.generate_iter(profiles_df, chunk_users=max(len(profiles_df), 1))
+
+        logger.info(
+            "Generated %d total transactions across %d users",
+            len(df),
+            profiles_df["user_id"].nunique(),
+        )
+        return df
+
+    def generate_iter(
+        self, profiles_df: pd.DataFrame, chunk_users: int = 1000
+    ) -> Iterator[pd.DataFrame]:
+        """Yield transactions for *profiles_df* one chunk of users at a time.
+
+        Each chunk has the same columns and dtypes as ``generate()`` and is
+        sorted by date within the chunk. Transaction ids continue across
+        chunks and the categorical columns share one set of categories, so
+        ``pd.concat`` of the chunks keeps them categorical. Only one chunk
+        of transactions is held in memory at a time.
+
+        Parameters
+        ----------
+        profiles_df : pd.DataFrame
+            Output of ``UserProfileGenerator.generate()``.
+        chunk_users : int
+            Number of users generated per yielded DataFrame.
+        """
+        if chunk_users < 1:
+            raise ValueError(f"chunk_users must be >= 1, got {chunk_users}")
+
         logger.info(
             "Generating transactions for %d users over %d months (seed=%d)",
             len(profiles_df),
@@ -93,181 +304,301 @@ class TransactionGenerator:
             self.seed,
         )
 
-        all_txns: List[Dict] = []
-        txn_counter = 0
+        # pull the profile columns out once instead of boxing a Series per row
+        user_ids = profiles_df["user_id"].tolist()
+        archetype_idx = [ARCHETYPE_INDEX[a] for a in profiles_df["archetype"]]
+        budgets = profiles_df["monthly_budget"].to_numpy(dtype=np.float64)
+        card_names, cards_lists = self._card_codes(profiles_df["cards"])
+
+        # one independent, reproducible stream per user
+        user_seeds = self._seed_seq.spawn(len(user_ids))
+
+        n_users = len(user_ids)
+        next_id = 1
+        with ExitStack() as stack:
+            executor = None
+            if self.n_workers > 1 and min(n_users, chunk_users) >= _PARALLEL_MIN_USERS:
+                # "spawn" is safe even when called from a threaded orchestrator.
+                ctx = multiprocessing.get_context("spawn")
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(self.n_workers, mp_context=ctx)
+                )
+            for start in range(0, max(n_users, 1), chunk_users):
+                chunk = slice(start, start + chunk_users)
+                user_columns = self._run_users(
+                    executor,
+                    user_ids[chunk],
+                    archetype_idx[chunk],
+                    budgets[chunk],
+                    cards_lists[chunk],
+                    user_seeds[chunk],
+                )
+                df = self._build_frame(user_columns, card_names, next_id)
+                next_id += len(df)
+                yield df
 
-        for _, user in profiles_df.iterrows():
-            user_txns, txn_counter = self._generate_user_transactions(user, txn_counter)
-            all_txns.extend(user_txns)
+    def generate_to_parquet(
+        self,
+        profiles_df: pd.DataFrame,
+        path: Union[str, Path],
+        chunk_users: int = 1000,
+    ) -> int:
+        """Stream transactions for *profiles_df* into a Parquet file.
 
-        df = pd.DataFrame(all_txns)
-        if not df.empty:
-            df = df.sort_values("date").reset_index(drop=True)
+        Every chunk from ``generate_iter()`` is appended as its own row
+        group, so the full dataset is never materialized. Requires
+        ``pyarrow``.
 
-        logger.info(
-            "Generated %d total transactions across %d users",
-            len(df),
-            profiles_df["user_id"].nunique(),
-        )
-        return df
+        Returns
+        -------
+        int
+            Number of transactions written.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        total = 0
+        try:
+            for df in self.generate_iter(profiles_df, chunk_users=chunk_users):
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(str(path), table.schema)
+                writer.write_table(table)
+                total += len(df)
+        finally:
+            if writer is not None:
+                writer.close()
+        return total
 
     # ------------------------------------------------------------------
-    # Per-user generation
+    # Batch helpers
     # ------------------------------------------------------------------
 
-    def _generate_user_transactions(
-        self, user: pd.Series, txn_counter: int
-    ) -> Tuple[List[Dict], int]:
-        """Generate all transactions for a single user across the full window."""
-        archetype = self._archetype_map[user["archetype"]]
-        cards = user["cards"]
-        txns: List[Dict] = []
-
-        # iterate month by month
-        current = self.start_date
-        while current < self.end_date:
-            month = current.month
-            year = current.year
-            days_in_month = (
-                (current.replace(month=month % 12 + 1, day=1) - timedelta(days=1)).day
-                if month < 12
-                else 31
+    @staticmethod
+    def _card_codes(
+        portfolios: Iterable[List[str]],
+    ) -> Tuple[List[str], List[np.ndarray]]:
+        """Map each portfolio to card codes against the global card vocabulary.
+
+        Returns the card names the codes index into (the template vocabulary
+        plus any cards from hand-built profiles) and one code array per user.
+        """
+        card_names = list(GLOBAL_CARD_VOCAB)
+        card_code = dict(CARD_INDEX)
+        portfolio_codes: Dict[Tuple[str, ...], np.ndarray] = {}
+        cards_lists = []
+        for cards in portfolios:
+            key = tuple(cards)
+            codes = portfolio_codes.get(key)
+            if codes is None:
+                for card in key:
+                    if card not in card_code:
+                        card_code[card] = len(card_names)
+                        card_names.append(card)
+                codes = np.array([card_code[card] for card in key], dtype=np.intp)
+                portfolio_codes[key] = codes
+            cards_lists.append(codes)
+        return card_names, cards_lists
+
+    def _run_users(
+        self,
+        executor: Optional[ProcessPoolExecutor],
+        user_ids: List[str],
+        archetype_idx: List[int],
+        budgets: np.ndarray,
+        cards_lists: List[np.ndarray],
+        seeds: List[np.random.SeedSequence],
+    ) -> List[Dict[str, np.ndarray]]:
+        """Generate column arrays for a run of users, sharded over *executor*."""
+        if executor is None:
+            return self._generate_users(
+                user_ids, archetype_idx, budgets, cards_lists, seeds
+            )
+        shards = np.array_split(np.arange(len(user_ids)), self.n_workers)
+        futures = [
+            executor.submit(
+                self._generate_users,
+                [user_ids[i] for i in shard],
+                [archetype_idx[i] for i in shard],
+                budgets[shard],
+                [cards_lists[i] for i in shard],
+                [seeds[i] for i in shard],
             )
+            for shard in shards
+        ]
+        return [cols for f in futures for cols in f.result()]
 
-            for category, base_weight in archetype.category_weights.items():
-                if base_weight <= 0:
-                    continue
+    def _build_frame(
+        self,
+        user_columns: List[Dict[str, np.ndarray]],
+        card_names: List[str],
+        first_id: int,
+    ) -> pd.DataFrame:
+        """Assemble per-user column arrays into one date-sorted DataFrame."""
+        columns = {
+            name: (
+                np.concatenate([cols[name] for cols in user_columns])
+                if user_columns
+                else np.empty(0, dtype=dtype)
+            )
+            for name, dtype in _COLUMN_DTYPES.items()
+        }
 
-                # seasonal adjustment
-                seasonal = SEASONAL_MULTIPLIERS.get(category, {}).get(
-                    month, DEFAULT_SEASONAL_MULTIPLIER
-                )
+        # ids follow generation order (user, month, category), before sorting
+        n = len(columns["amount"])
+        columns["transaction_id"] = _transaction_ids(first_id, n)
 
-                # monthly budget for this category
-                cat_budget = user["monthly_budget"] * base_weight * seasonal
-
-                # add per-user noise (±15 %) so users within same archetype differ
-                noise = self._rng.uniform(0.85, 1.15)
-                cat_budget *= noise
-
-                # split into individual transactions
-                cat_txns = self._split_into_transactions(
-                    user_id=user["user_id"],
-                    category=category,
-                    monthly_amount=cat_budget,
-                    year=year,
-                    month=month,
-                    days_in_month=days_in_month,
-                    cards=cards,
-                    txn_counter=txn_counter,
-                )
-                txn_counter += len(cat_txns)
-                txns.extend(cat_txns)
+        # order by date: dates are whole days inside a short window, so a
+        # stable argsort over small day offsets runs as a linear radix sort
+        order = _date_order(columns["date"])
+        columns = {name: col[order] for name, col in columns.items()}
 
-            # advance to next month
-            if month == 12:
-                current = current.replace(year=year + 1, month=1, day=1)
-            else:
-                current = current.replace(month=month + 1, day=1)
+        columns["date"] = columns["date"].astype("datetime64[ns]")
 
-        return txns, txn_counter
+        columns["category"] = pd.Categorical.from_codes(
+            columns["category"], categories=self._category_order
+        )
+        columns["merchant"] = pd.Categorical.from_codes(
+            columns["merchant"], categories=self._merchant_names
+        )
+        columns["card_used"] = pd.Categorical.from_codes(
+            columns["card_used"], categories=card_names
+        )
+
+        return pd.DataFrame({name: columns[name] for name in _OUTPUT_COLUMNS})
 
     # ------------------------------------------------------------------
-    # Transaction splitting
+    # Per-user generation
     # ------------------------------------------------------------------
 
-    def _split_into_transactions(
+    def _generate_users(
         self,
-        user_id: str,
-        category: str,
-        monthly_amount: float,
-        year: int,
-        month: int,
-        days_in_month: int,
-        cards: List[str],
-        txn_counter: int,
-    ) -> List[Dict]:
-        """Split a category's monthly budget into individual transactions."""
-        mean_amt, std_amt = TRANSACTION_AMOUNT_PARAMS.get(category, (50.0, 25.0))
-        cat_info = SPENDING_CATEGORIES.get(category, SPENDING_CATEGORIES["other"])
-
-        # estimate number of transactions
-        if monthly_amount < MIN_TRANSACTION_AMOUNT:
-            return []
-        est_num = max(1, int(round(monthly_amount / mean_amt)))
-        # add some variation in count
-        est_num = max(1, int(self._rng.poisson(est_num)))
-
-        txns: List[Dict] = []
-        remaining = monthly_amount
-
-        for j in range(est_num):
-            if remaining < MIN_TRANSACTION_AMOUNT:
-                break
-
-            # sample amount
-            amt = float(self._rng.normal(mean_amt, std_amt))
-            amt = max(MIN_TRANSACTION_AMOUNT, min(amt, remaining))
-            amt = round(amt, 2)
-            remaining -= amt
-
-            # sample date with day-of-week weighting
-            day = self._sample_transaction_day(category, days_in_month)
-            date = datetime(year, month, day)
-
-            # sample merchant and mcc
-            merchant = str(self._rng.choice(cat_info["merchants"]))
-            mcc_code = int(self._rng.choice(cat_info["mcc_codes"]))
-
-            # sample which card was used (uniform random from portfolio)
-            card_used = str(self._rng.choice(cards))
-
-            txn_counter += 1
-            txns.append(
-                {
-                    "transaction_id": f"txn_{txn_counter:07d}",
-                    "user_id": user_id,
-                    "date": date,
-                    "category": category,
-                    "merchant": merchant,
-                    "mcc_code": mcc_code,
-                    "amount": amt,
-                    "card_used": card_used,
-                }
+        user_ids: List[str],
+        archetype_idx: List[int],
+        budgets: np.ndarray,
+        cards_lists: List[np.ndarray],
+        seeds: List[np.random.SeedSequence],
+    ) -> List[Dict[str, np.ndarray]]:
+        """Generate column arrays for a run of users (one worker's shard)."""
+        return [
+            self._generate_user_transactions(
+                user_ids[i],
+                archetype_idx[i],
+                budgets[i],
+                cards_lists[i],
+                np.random.default_rng(seeds[i]),
             )
+            for i in range(len(user_ids))
+        ]
 
-        return txns
+    def _generate_user_transactions(
+        self,
+        user_id: str,
+        archetype_idx: int,
+        monthly_budget: float,
+        cards: np.ndarray,
+        rng: np.random.Generator,
+    ) -> Dict[str, np.ndarray]:
+        """Generate all transactions for a single user across the full window.
+
+        Every month is handled in the same set of array operations: one draw
+        each for budget noise, transaction counts, amounts, days, merchants,
+        MCCs and cards. Returns one array per column (see ``_COLUMN_DTYPES``),
+        ordered by month, then category.
+        """
+        active = self._active_categories[archetype_idx]
+        num_months, num_cats = len(self._months), len(active)
+
+        # (month, category) budgets: base weight x seasonal adjustment x
+        # per-user noise (±15 %) so users within the same archetype differ
+        cat_budgets = (
+            monthly_budget
+            * self._arch_weights[archetype_idx, active]
+            * self._seasonal_rows[:, active]
+            * rng.uniform(0.85, 1.15, size=(num_months, num_cats))
+        ).ravel()
+        seg_cat = np.tile(active, num_months)
+        seg_month = np.repeat(np.arange(num_months), num_cats)
+
+        funded = cat_budgets >= MIN_TRANSACTION_AMOUNT
+        cat_budgets = cat_budgets[funded]
+        seg_cat = seg_cat[funded]
+        seg_month = seg_month[funded]
+
+        # estimate number of transactions, with some variation in count
+        est_num = np.maximum(1, np.round(cat_budgets / self._mean_vec[seg_cat]))
+        counts = np.maximum(1, rng.poisson(est_num))
+
+        # one flat draw of raw amounts for every candidate transaction
+        txn_cat = np.repeat(seg_cat, counts)
+        raw_amounts = rng.normal(self._mean_vec[txn_cat], self._std_vec[txn_cat])
+        amounts, keep = self._allocate_amounts(raw_amounts, counts, cat_budgets)
+
+        txn_cat = txn_cat[keep]
+        txn_month = np.repeat(seg_month, counts)[keep]
+        n = len(txn_cat)
+
+        # sample days with day-of-week weighting by inverse CDF
+        cdf_rows = self._month_day_cdf[self._category_day_class[txn_cat], txn_month]
+        day_offsets = (cdf_rows < rng.random(n)[:, None]).sum(axis=1)
+        dates = self._month_starts[txn_month] + day_offsets
+
+        # sample merchant and mcc as integer offsets into the flat tables
+        merchants = self._merchant_table[
+            self._merchant_offsets[txn_cat]
+            + rng.integers(0, self._merchant_counts[txn_cat])
+        ]
+        mccs = self._mcc_table[
+            self._mcc_offsets[txn_cat] + rng.integers(0, self._mcc_counts[txn_cat])
+        ]
+
+        # sample which card was used (uniform random from portfolio)
+        cards_used = cards[rng.integers(0, len(cards), size=n)]
+
+        user_ids = np.empty(n, dtype=object)
+        user_ids[:] = user_id
+        return {
+            "user_id": user_ids,
+            "date": dates,
+            "category": txn_cat,
+            "merchant": merchants,
+            "mcc_code": mccs,
+            "amount": amounts[keep],
+            "card_used": cards_used,
+        }
 
-    def _sample_transaction_day(self, category: str, days_in_month: int) -> int:
-        """Sample a day within the month with realistic day-of-week effects.
+    # ------------------------------------------------------------------
+    # Transaction splitting
+    # ------------------------------------------------------------------
 
-        Weekends get higher weight for discretionary categories,
-        weekdays for essentials like utilities and insurance.
-        """
-        days = np.arange(1, days_in_month + 1)
+    @staticmethod
+    def _allocate_amounts(
+        raw_amounts: np.ndarray, counts: np.ndarray, budgets: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Split each category budget across its run of candidate transactions.
 
-        # default: uniform
-        weights = np.ones(days_in_month)
+        ``raw_amounts`` holds ``counts[k]`` consecutive draws for category
+        ``k``. Amounts are floored at ``MIN_TRANSACTION_AMOUNT`` and rounded
+        to cents; the transaction that would overspend a budget is capped to
+        what remains, and everything after it (or after the remainder drops
+        below the floor) is dropped.
 
-        weekend_heavy = {"dining", "entertainment", "online_shopping", "travel"}
-        weekday_heavy = {"utilities", "insurance"}
-        # monthly bills tend to cluster around the 1st or 15th
-        bill_like = {"utilities", "insurance", "streaming"}
-
-        if category in bill_like:
-            # cluster around day 1-5 and 15-20
-            for d in days:
-                if d <= 5 or 15 <= d <= 20:
-                    weights[d - 1] = 3.0
-        elif category in weekend_heavy:
-            # approximate: days 6,7,13,14,20,21,27,28 as weekends
-            for d in days:
-                if d % 7 in (6, 0):
-                    weights[d - 1] = 1.8
-        elif category in weekday_heavy:
-            for d in days:
-                if d % 7 not in (6, 0):
-                    weights[d - 1] = 1.3
-
-        weights = weights / weights.sum()
-        return int(self._rng.choice(days, p=weights))
+        Returns ``(amounts, keep)`` aligned with ``raw_amounts``.
+        """
+        amounts = np.maximum(raw_amounts, MIN_TRANSACTION_AMOUNT)
+        np.round(amounts, 2, out=amounts)
+        starts = np.cumsum(counts) - counts
+
+        # budget left before each transaction, within its category run
+        spent = np.cumsum(amounts) - amounts
+        spent -= np.repeat(spent[starts], counts)
+        remaining = np.repeat(budgets, counts) - spent
+
+        overspends = amounts > remaining
+        seen = np.cumsum(overspends) - overspends
+        seen -= np.repeat(seen[starts], counts)
+
+        keep = (remaining >= MIN_TRANSACTION_AMOUNT) & (seen == 0)
+        amounts[overspends] = np.round(remaining[overspends], 2)
+        return amounts, keep
@@ -7,7 +7,9 @@ reproducible when using a fixed seed.
 """
 
 import logging
-from typing import Dict, List, Optional
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
@@ -18,11 +20,90 @@ from src.data_pipeline.generators.config import (
     DEFAULT_NUM_USERS,
     DEFAULT_SEED,
     REDEMPTION_PREFERENCE_WEIGHTS,
+    REDEMPTION_PREFERENCES,
     SPENDING_ARCHETYPES,
 )
 
 logger = logging.getLogger(__name__)
 
+# Card portfolio templates each archetype draws from (uniformly).
+_CARD_AFFINITIES: Dict[str, List[str]] = {
+    "young_professional": ["starter_cashback", "dining_focused", "all_rounder"],
+    "suburban_family": ["grocery_focused", "all_rounder", "starter_cashback"],
+    "frequent_traveler": ["travel_focused", "dining_focused", "premium_stack"],
+    "budget_conscious": ["starter_cashback", "all_rounder"],
+    "high_roller": ["premium_stack", "travel_focused"],
+    "minimal_user": ["starter_cashback"],
+    "category_specialist": ["grocery_focused", "all_rounder", "dining_focused"],
+}
+
+# Full value sets of the low-cardinality profile columns (categorical dtypes).
+_AGE_GROUPS: List[str] = ["18-25", "26-35", "36-50", "51-65", "65+"]
+_LOCATION_TYPES: List[str] = ["urban", "suburban", "rural"]
+
+# Age group distribution correlated with archetype.
+_AGE_AFFINITIES: Dict[str, Dict[str, float]] = {
+    "young_professional": {"18-25": 0.4, "26-35": 0.5, "36-50": 0.1},
+    "suburban_family": {"26-35": 0.3, "36-50": 0.5, "51-65": 0.2},
+    "frequent_traveler": {"26-35": 0.3, "36-50": 0.4, "51-65": 0.3},
+    "budget_conscious": {
+        "18-25": 0.3,
+        "26-35": 0.3,
+        "36-50": 0.2,
+        "51-65": 0.15,
+        "65+": 0.05,
+    },
+    "high_roller": {"36-50": 0.4, "51-65": 0.4, "65+": 0.2},
+    "minimal_user": {"18-25": 0.5, "65+": 0.3, "51-65": 0.2},
+    "category_specialist": {"26-35": 0.3, "36-50": 0.4, "51-65": 0.3},
+}
+_DEFAULT_AGE_DIST: Dict[str, float] = {"26-35": 0.5, "36-50": 0.5}
+
+# Urban/suburban/rural distribution correlated with archetype.
+_LOCATION_AFFINITIES: Dict[str, Dict[str, float]] = {
+    "young_professional": {"urban": 0.7, "suburban": 0.25, "rural": 0.05},
+    "suburban_family": {"urban": 0.1, "suburban": 0.75, "rural": 0.15},
+    "frequent_traveler": {"urban": 0.5, "suburban": 0.4, "rural": 0.1},
+    "budget_conscious": {"urban": 0.3, "suburban": 0.4, "rural": 0.3},
+    "high_roller": {"urban": 0.6, "suburban": 0.35, "rural": 0.05},
+    "minimal_user": {"urban": 0.3, "suburban": 0.3, "rural": 0.4},
+    "category_specialist": {"urban": 0.3, "suburban": 0.5, "rural": 0.2},
+}
+_DEFAULT_LOCATION_DIST: Dict[str, float] = {
+    "urban": 0.4,
+    "suburban": 0.4,
+    "rural": 0.2,
+}
+
+
+def _weight_table(dist: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split *dist* into an object array of keys and their cumulative weights.
+
+    The CDF is normalized by its last element (exactly 1.0), the same way
+    ``Generator.choice`` builds it, so searchsorted draws match choice().
+    """
+    values = np.array(list(dist.keys()), dtype=object)
+    cdf = np.cumsum(np.array(list(dist.values()), dtype=np.float64))
+    cdf /= cdf[-1]
+    return values, cdf
+
+
+def _stack_tables(
+    tables: List[Tuple[np.ndarray, np.ndarray]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack ``_weight_table`` pairs into padded (values, cdf) matrices.
+
+    Row i holds table i; padding columns have a CDF of 1.0 so they are
+    never drawn.
+    """
+    width = max(len(values) for values, _ in tables)
+    values = np.empty((len(tables), width), dtype=object)
+    cdf = np.ones((len(tables), width), dtype=np.float64)
+    for i, (row_values, row_cdf) in enumerate(tables):
+        values[i, : len(row_values)] = row_values
+        cdf[i, : len(row_cdf)] = row_cdf
+    return values, cdf
+
 
 class UserProfileGenerator:
     """Generates synthetic user profiles for the RewardSense system.
@@ -36,23 +117,98 @@ class UserProfileGenerator:
     num_users : int
         Number of user profiles to generate.
     seed : int
-        Random seed for reproducibility.
+        Random seed for reproducibility. Ignored when ``rng`` is given.
+    rng : np.random.Generator, optional
+        Pre-seeded generator to draw from instead of building one from
+        ``seed`` (see ``from_rng``).
     """
 
     def __init__(
         self,
         num_users: int = DEFAULT_NUM_USERS,
-        seed: int = DEFAULT_SEED,
+        seed: Optional[int] = DEFAULT_SEED,
+        rng: Optional[np.random.Generator] = None,
     ) -> None:
         self.num_users = num_users
-        self.seed = seed
-        self._rng = np.random.default_rng(seed)
+        self.seed = None if rng is not None else seed
+        self._rng = rng if rng is not None else np.random.default_rng(seed)
         self._archetype_map = {a.name: a for a in SPENDING_ARCHETYPES}
 
+        # sampling tables are constant, so build their CDFs once up front
+        self._arch_table = _weight_table(ARCHETYPE_DISTRIBUTION)
+        self._pref_table = _weight_table(REDEMPTION_PREFERENCE_WEIGHTS)
+        # archetype-conditioned tables, one row per archetype code (the
+        # position in self._arch_table), so a whole population is sampled
+        # by gathering each user's row
+        arch_names = list(self._arch_table[0])
+        self._budget_ranges = np.array(
+            [self._archetype_map[a].monthly_budget_range for a in arch_names],
+            dtype=np.float64,
+        )
+        self._age_matrix = _stack_tables(
+            [
+                _weight_table(_AGE_AFFINITIES.get(a, _DEFAULT_AGE_DIST))
+                for a in arch_names
+            ]
+        )
+        self._location_matrix = _stack_tables(
+            [
+                _weight_table(_LOCATION_AFFINITIES.get(a, _DEFAULT_LOCATION_DIST))
+                for a in arch_names
+            ]
+        )
+        # portfolios are uniform over the archetype's templates; values are
+        # the template card lists themselves
+        all_templates = list(CARD_PORTFOLIO_TEMPLATES.keys())
+        portfolio_tables = []
+        for a in arch_names:
+            templates = _CARD_AFFINITIES.get(a, all_templates)
+            _, cdf = _weight_table({t: 1.0 for t in templates})
+            portfolio_tables.append((self._portfolio_array(templates), cdf))
+        self._portfolio_matrix = _stack_tables(portfolio_tables)
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
+    @classmethod
+    def from_rng(
+        cls, num_users: int, rng: np.random.Generator
+    ) -> "UserProfileGenerator":
+        """Build a generator that draws from an existing ``Generator``.
+
+        Useful with one ``default_rng`` per child of
+        ``np.random.SeedSequence(seed).spawn(k)`` to give many cohorts
+        independent streams from one parent seed.
+        """
+        return cls(num_users=num_users, rng=rng)
+
+    @staticmethod
+    def generate_cohorts(
+        cohort_sizes: Sequence[int],
+        seed: int = DEFAULT_SEED,
+        n_workers: int = 1,
+    ) -> List[pd.DataFrame]:
+        """Generate independent cohorts, one per entry of *cohort_sizes*.
+
+        Each cohort draws from its own stream spawned from ``seed``, so the
+        output is the same for any ``n_workers``; with more than one worker
+        the cohorts are generated in separate processes.
+        """
+        # SeedSequence.spawn rather than Generator.spawn (numpy >= 1.25 only)
+        rngs = [
+            np.random.default_rng(s)
+            for s in np.random.SeedSequence(seed).spawn(len(cohort_sizes))
+        ]
+        if n_workers <= 1 or len(cohort_sizes) <= 1:
+            return [
+                _generate_cohort(size, rng) for size, rng in zip(cohort_sizes, rngs)
+            ]
+        # "spawn" is safe even when called from a threaded orchestrator.
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(n_workers, mp_context=ctx) as ex:
+            return list(ex.map(_generate_cohort, cohort_sizes, rngs))
+
     def generate(self) -> pd.DataFrame:
         """Generate all user profiles and return as a DataFrame.
 
@@ -60,39 +216,45 @@ class UserProfileGenerator:
         -------
         pd.DataFrame
             Columns: user_id, archetype, monthly_budget, cards,
-            redemption_preference, age_group, location_type
+            redemption_preference, age_group, location_type. ``archetype``,
+            ``redemption_preference``, ``age_group`` and ``location_type``
+            are Categoricals over their full configured value sets.
         """
         logger.info(
-            "Generating %d user profiles with seed=%d",
+            "Generating %d user profiles with seed=%s",
             self.num_users,
             self.seed,
         )
 
-        archetypes = self._assign_archetypes()
-        profiles: List[Dict] = []
-
-        for i, arch_name in enumerate(archetypes):
-            user_id = f"user_{i + 1:04d}"
-            archetype = self._archetype_map[arch_name]
-            budget = self._sample_monthly_budget(archetype)
-            cards = self._assign_card_portfolio(arch_name)
-            redemption_pref = self._sample_redemption_preference()
-            age_group = self._sample_age_group(arch_name)
-            location_type = self._sample_location_type(arch_name)
-
-            profiles.append(
-                {
-                    "user_id": user_id,
-                    "archetype": arch_name,
-                    "monthly_budget": round(budget, 2),
-                    "cards": cards,
-                    "redemption_preference": redemption_pref,
-                    "age_group": age_group,
-                    "location_type": location_type,
-                }
-            )
-
-        df = pd.DataFrame(profiles)
+        arch_codes = self._assign_archetypes()
+        n = len(arch_codes)
+
+        # every attribute is one draw over all users, conditioned on the
+        # archetype by gathering per-user rows of the stacked tables
+        ranges = self._budget_ranges[arch_codes]
+        budgets = self._rng.uniform(ranges[:, 0], ranges[:, 1], size=n).round(2)
+        redemption_prefs = self._sample_redemption_preferences(n)
+        cards = self._sample_rows(self._portfolio_matrix, arch_codes)
+        age_groups = self._sample_rows(self._age_matrix, arch_codes)
+        location_types = self._sample_rows(self._location_matrix, arch_codes)
+
+        df = pd.DataFrame(
+            {
+                "user_id": [f"user_{i:04d}" for i in range(1, n + 1)],
+                "archetype": pd.Categorical.from_codes(
+                    arch_codes, categories=list(self._arch_table[0])
+                ),
+                "monthly_budget": budgets,
+                "cards": cards,
+                "redemption_preference": pd.Categorical(
+                    redemption_prefs, categories=REDEMPTION_PREFERENCES
+                ),
+                "age_group": pd.Categorical(age_groups, categories=_AGE_GROUPS),
+                "location_type": pd.Categorical(
+                    location_types, categories=_LOCATION_TYPES
+                ),
+            }
+        )
         logger.info(
             "Generated %d profiles across %d archetypes",
             len(df),
@@ -121,94 +283,57 @@ class UserProfileGenerator:
         if profiles_df is None:
             profiles_df = self.generate()
 
-        rows: List[Dict] = []
-        for _, row in profiles_df.iterrows():
-            for card in row["cards"]:
-                rows.append(
-                    {
-                        "user_id": row["user_id"],
-                        "card_id": card,
-                        "redemption_preference": row["redemption_preference"],
-                    }
-                )
-        return pd.DataFrame(rows)
+        # explode is a single C-level pass; users with no cards yield NaN
+        # rows, which are dropped so they contribute nothing (as before)
+        mapping = (
+            profiles_df[["user_id", "cards", "redemption_preference"]]
+            .explode("cards")
+            .rename(columns={"cards": "card_id"})
+        )
+        return mapping.dropna(subset=["card_id"]).reset_index(drop=True)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _assign_archetypes(self) -> List[str]:
-        """Assign an archetype to each user based on configured distribution."""
-        names = list(ARCHETYPE_DISTRIBUTION.keys())
-        weights = np.array([ARCHETYPE_DISTRIBUTION[n] for n in names])
-        weights = weights / weights.sum()
-        return list(self._rng.choice(names, size=self.num_users, p=weights))
-
-    def _sample_monthly_budget(self, archetype) -> float:
-        """Sample a monthly budget uniformly within the archetype range."""
-        lo, hi = archetype.monthly_budget_range
-        return float(self._rng.uniform(lo, hi))
-
-    def _assign_card_portfolio(self, archetype_name: str) -> List[str]:
-        """Select a card portfolio template that aligns with the archetype."""
-        affinity = {
-            "young_professional": ["starter_cashback", "dining_focused", "all_rounder"],
-            "suburban_family": ["grocery_focused", "all_rounder", "starter_cashback"],
-            "frequent_traveler": ["travel_focused", "dining_focused", "premium_stack"],
-            "budget_conscious": ["starter_cashback", "all_rounder"],
-            "high_roller": ["premium_stack", "travel_focused"],
-            "minimal_user": ["starter_cashback"],
-            "category_specialist": ["grocery_focused", "all_rounder", "dining_focused"],
-        }
-        candidates = affinity.get(archetype_name, list(CARD_PORTFOLIO_TEMPLATES.keys()))
-        template_name = self._rng.choice(candidates)
-        return CARD_PORTFOLIO_TEMPLATES[template_name]
-
-    def _sample_redemption_preference(self) -> str:
-        """Sample a redemption preference based on global weights."""
-        prefs = list(REDEMPTION_PREFERENCE_WEIGHTS.keys())
-        weights = np.array([REDEMPTION_PREFERENCE_WEIGHTS[p] for p in prefs])
-        weights = weights / weights.sum()
-        return str(self._rng.choice(prefs, p=weights))
-
-    def _sample_age_group(self, archetype_name: str) -> str:
-        """Sample an age group correlated with archetype."""
-        age_affinities: Dict[str, Dict[str, float]] = {
-            "young_professional": {"18-25": 0.4, "26-35": 0.5, "36-50": 0.1},
-            "suburban_family": {"26-35": 0.3, "36-50": 0.5, "51-65": 0.2},
-            "frequent_traveler": {"26-35": 0.3, "36-50": 0.4, "51-65": 0.3},
-            "budget_conscious": {
-                "18-25": 0.3,
-                "26-35": 0.3,
-                "36-50": 0.2,
-                "51-65": 0.15,
-                "65+": 0.05,
-            },
-            "high_roller": {"36-50": 0.4, "51-65": 0.4, "65+": 0.2},
-            "minimal_user": {"18-25": 0.5, "65+": 0.3, "51-65": 0.2},
-            "category_specialist": {"26-35": 0.3, "36-50": 0.4, "51-65": 0.3},
-        }
-        dist = age_affinities.get(archetype_name, {"26-35": 0.5, "36-50": 0.5})
-        groups = list(dist.keys())
-        weights = np.array(list(dist.values()))
-        weights = weights / weights.sum()
-        return str(self._rng.choice(groups, p=weights))
-
-    def _sample_location_type(self, archetype_name: str) -> str:
-        """Sample urban/suburban/rural location correlated with archetype."""
-        loc_affinities: Dict[str, Dict[str, float]] = {
-            "young_professional": {"urban": 0.7, "suburban": 0.25, "rural": 0.05},
-            "suburban_family": {"urban": 0.1, "suburban": 0.75, "rural": 0.15},
-            "frequent_traveler": {"urban": 0.5, "suburban": 0.4, "rural": 0.1},
-            "budget_conscious": {"urban": 0.3, "suburban": 0.4, "rural": 0.3},
-            "high_roller": {"urban": 0.6, "suburban": 0.35, "rural": 0.05},
-            "minimal_user": {"urban": 0.3, "suburban": 0.3, "rural": 0.4},
-            "category_specialist": {"urban": 0.3, "suburban": 0.5, "rural": 0.2},
-        }
-        dist = loc_affinities.get(
-            archetype_name, {"urban": 0.4, "suburban": 0.4, "rural": 0.2}
-        )
-        locs = list(dist.keys())
-        weights = np.array(list(dist.values()))
-        weights = weights / weights.sum()
-        return str(self._rng.choice(locs, p=weights))
+    def _assign_archetypes(self) -> np.ndarray:
+        """Assign an archetype code to each user from the configured weights.
+
+        Codes index ``self._arch_table`` and the archetype-conditioned tables.
+        """
+        _, cdf = self._arch_table
+        return cdf.searchsorted(self._rng.random(self.num_users), side="right")
+
+    def _sample_redemption_preferences(self, size: int) -> np.ndarray:
+        """Sample *size* redemption preferences based on global weights."""
+        return self._sample_from(self._pref_table, size)
+
+    def _sample_from(
+        self, table: Tuple[np.ndarray, np.ndarray], size: int
+    ) -> np.ndarray:
+        """Draw *size* values from a ``_weight_table`` (values, cdf) pair."""
+        values, cdf = table
+        # inverse-CDF lookup without choice()'s per-call validation of p
+        return values[cdf.searchsorted(self._rng.random(size), side="right")]
+
+    def _sample_rows(
+        self, matrix: Tuple[np.ndarray, np.ndarray], codes: np.ndarray
+    ) -> np.ndarray:
+        """Draw one value per user from row ``codes[i]`` of a stacked table."""
+        values, cdf = matrix
+        u = self._rng.random(len(codes))
+        # per-row inverse CDF: count of CDF entries <= u (searchsorted "right")
+        picks = (cdf[codes] <= u[:, None]).sum(axis=1)
+        return values[codes, picks]
+
+    @staticmethod
+    def _portfolio_array(template_names: List[str]) -> np.ndarray:
+        """Object array holding the card list of each named template."""
+        portfolios = np.empty(len(template_names), dtype=object)
+        portfolios[:] = [CARD_PORTFOLIO_TEMPLATES[name] for name in template_names]
+        return portfolios
+
+
+def _generate_cohort(num_users: int, rng: np.random.Generator) -> pd.DataFrame:
+    """Process-pool entry point for ``UserProfileGenerator.generate_cohorts``."""
+    return UserProfileGenerator.from_rng(num_users, rng).generate()
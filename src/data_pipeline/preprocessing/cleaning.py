@@ -1,9 +1,36 @@
+import functools
+import importlib.util
 import logging
 from typing import Tuple, Dict, Any
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Storage for cleaned string columns: Arrow-backed (compact, vectorized
+# downstream string ops) when pyarrow is installed, else the default.
+_STRING_DTYPE = (
+    "string[pyarrow]" if importlib.util.find_spec("pyarrow") is not None else "string"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_issuer(issuer: str) -> str:
+    """Uppercase, turn underscores into spaces and strip an issuer name."""
+    return issuer.upper().replace("_", " ").strip()
+
+
+def _take_rows(df: pd.DataFrame, keep: np.ndarray) -> Tuple[pd.DataFrame, np.ndarray]:
+    """
+    Returns the *keep* rows of df with a fresh RangeIndex, in a single take,
+    plus their positions in df. The result owns its data, so cleaned columns
+    can be set on it without touching the caller's frame.
+    """
+    pos = np.flatnonzero(keep)
+    out = df.take(pos)
+    out.index = pd.RangeIndex(len(out))
+    return out, pos
+
 
 def clean_credit_card_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     """
@@ -11,62 +38,77 @@ def clean_credit_card_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
     Returns cleaned DataFrame and cleaning report.
     Idempotent and logs all cleaning steps.
     """
-    df = df.copy()
     report: Dict[str, Any] = {}
+    # every filter only narrows this mask; rows are taken once, and column
+    # fixes run on the surviving rows only
+    keep = np.ones(len(df), dtype=bool)
 
     report["initial_count"] = len(df)
 
     # Deduplication
-    before = len(df)
     if "card_id" in df.columns:
-        df = df.drop_duplicates(subset=["card_id"])
+        keep &= ~df.duplicated(subset=["card_id"]).to_numpy()
         report["dedup_key"] = "card_id"
     elif "card_name" in df.columns and "issuer" in df.columns:
-        df = df.drop_duplicates(subset=["card_name", "issuer"])
+        keep &= ~df.duplicated(subset=["card_name", "issuer"]).to_numpy()
         report["dedup_key"] = "card_name+issuer"
     else:
         report["dedup_key"] = "none"
-    report["after_dedup"] = len(df)
-    report["dedup_removed"] = before - len(df)
+    report["after_dedup"] = int(keep.sum())
+    report["dedup_removed"] = len(df) - report["after_dedup"]
 
     # Handle missing reward rates (impute with 1.0 or flag)
     if "reward_rates" in df.columns:
-        missing_reward = int(df["reward_rates"].isnull().sum())
-        df["reward_rates"] = df["reward_rates"].apply(
-            lambda x: x if pd.notnull(x) else {"universal_base_rate": 1.0}
-        )
+        missing_reward = int((df["reward_rates"].isnull().to_numpy() & keep).sum())
         report["missing_reward_rates"] = missing_reward
     else:
         report["missing_reward_rates"] = 0
 
-    # Standardize issuer names
+    # Standardize issuer names: only the distinct raw values are normalized
+    # (memoized across calls), then mapped back through their factorize codes
     if "issuer" in df.columns:
-        df["issuer"] = (
-            df["issuer"].astype("string").str.upper().str.replace("_", " ").str.strip()
+        issuer_codes, raw_issuers = pd.factorize(df["issuer"])
+        issuers = pd.Series(
+            [_normalize_issuer(str(raw)) for raw in raw_issuers], dtype=_STRING_DTYPE
         )
-        report["unique_issuers"] = int(df["issuer"].nunique())
+        present = np.unique(issuer_codes[keep])
+        report["unique_issuers"] = int(issuers.iloc[present[present >= 0]].nunique())
     else:
         report["unique_issuers"] = 0
 
     # Validate annual fee ranges (0 <= annual_fee < 1000)
     if "annual_fee" in df.columns:
-        df["annual_fee"] = pd.to_numeric(df["annual_fee"], errors="coerce")
+        annual_fee = pd.to_numeric(df["annual_fee"], errors="coerce")
         invalid_mask = (
-            (df["annual_fee"] < 0)
-            | (df["annual_fee"] >= 1000)
-            | df["annual_fee"].isna()
-        )
+            (annual_fee < 0) | (annual_fee >= 1000) | annual_fee.isna()
+        ).to_numpy() & keep
         report["invalid_annual_fees"] = int(invalid_mask.sum())
-        before = len(df)
-        df = df.loc[~invalid_mask].copy()
-        report["annual_fee_removed"] = before - len(df)
+        keep &= ~invalid_mask
+        report["annual_fee_removed"] = report["invalid_annual_fees"]
     else:
         report["invalid_annual_fees"] = 0
         report["annual_fee_removed"] = 0
 
+    df, pos = _take_rows(df, keep)
+
+    if "reward_rates" in df.columns:
+        missing_mask = df["reward_rates"].isnull()
+        if missing_mask.any():
+            # one fresh dict per imputed row, aligned onto the missing slots
+            fill = pd.Series(
+                [{"universal_base_rate": 1.0} for _ in range(int(missing_mask.sum()))],
+                index=df.index[missing_mask],
+                dtype=object,
+            )
+            df["reward_rates"] = df["reward_rates"].where(~missing_mask, fill)
+    if "issuer" in df.columns:
+        df["issuer"] = issuers.array.take(issuer_codes[pos], allow_fill=True)
+    if "annual_fee" in df.columns:
+        df["annual_fee"] = annual_fee.iloc[pos].array
+
     report["final_count"] = len(df)
     logger.info("clean_credit_card_data report=%s", report)
-    return df.reset_index(drop=True), report
+    return df, report
 
 
 def clean_transaction_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
@@ -75,20 +117,22 @@ def clean_transaction_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
     Returns cleaned DataFrame and cleaning report.
     Idempotent and logs all cleaning steps.
     """
-    df = df.copy()
     report: Dict[str, Any] = {}
+    # every filter only narrows this mask; rows are taken once at the end
+    keep = np.ones(len(df), dtype=bool)
 
     report["initial_count"] = len(df)
     now = pd.Timestamp.now()
 
     # Amount
     if "amount" in df.columns:
-        df["amount"] = pd.to_numeric(df["amount"], errors="coerce")
-        neg_mask = df["amount"] < 0
+        amount = pd.to_numeric(df["amount"], errors="coerce")
+        # one read of the amounts for both the negative and suspicious checks
+        amounts = amount.to_numpy(dtype=np.float64, na_value=np.nan)
+        neg_mask = amounts < 0
         report["negative_amounts"] = int(neg_mask.sum())
-        before = len(df)
-        df = df.loc[~neg_mask].copy()
-        report["negative_amounts_removed"] = before - len(df)
+        keep &= ~neg_mask
+        report["negative_amounts_removed"] = report["negative_amounts"]
     else:
         report["negative_amounts"] = 0
         report["negative_amounts_removed"] = 0
@@ -96,30 +140,41 @@ def clean_transaction_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
     # Date (robust)
     if "date" in df.columns:
         dt = pd.to_datetime(df["date"], errors="coerce")
-        invalid_mask = dt.isna()
+        invalid_mask = dt.isna().to_numpy() & keep
         report["invalid_dates"] = int(invalid_mask.sum())
-        future_mask = dt > now
+        future_mask = (dt > now).to_numpy() & keep
         report["future_dates"] = int(future_mask.sum())
         drop_mask = invalid_mask | future_mask
-        before = len(df)
-        df = df.loc[~drop_mask].copy()
-        report["dates_removed"] = before - len(df)
+        keep &= ~drop_mask
+        report["dates_removed"] = int(drop_mask.sum())
     else:
         report["invalid_dates"] = 0
         report["future_dates"] = 0
         report["dates_removed"] = 0
 
+    df, pos = _take_rows(df, keep)
+    if "amount" in df.columns:
+        df["amount"] = amount.iloc[pos].array
+
     # Category
     if "category" in df.columns:
-        missing_cat = int(df["category"].isnull().sum())
-        df["category"] = df["category"].fillna("unknown")
+        category = df["category"]
+        missing_cat = int(category.isnull().sum())
+        # Categorical columns (e.g. generator output) only accept known values
+        if (
+            missing_cat
+            and isinstance(category.dtype, pd.CategoricalDtype)
+            and "unknown" not in category.cat.categories
+        ):
+            category = category.cat.add_categories(["unknown"])
+        df["category"] = category.fillna("unknown")
         report["missing_categories"] = missing_cat
     else:
         report["missing_categories"] = 0
 
     # Suspicious flag
     if "amount" in df.columns:
-        suspicious_mask = df["amount"] > 10000
+        suspicious_mask = amounts[pos] > 10000
         report["suspicious_high_amounts"] = int(suspicious_mask.sum())
         df["suspicious"] = suspicious_mask
     else:
@@ -128,4 +183,4 @@ def clean_transaction_data(df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, An
 
     report["final_count"] = len(df)
     logger.info("clean_transaction_data report=%s", report)
-    return df.reset_index(drop=True), report
+    return df, report
@@ -5,21 +5,43 @@ Abstract base class for all credit card scrapers.
 Provides common functionality like rate limiting, retries, and logging.
 """
 
+import re
+import copy
 import time
+import hashlib
+import functools
 import random
+import asyncio
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from datetime import datetime
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, UnicodeDammit
+from lxml import etree
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+# (etag, last_modified, content_type, body) of a page kept for revalidation
+_PageEntry = Tuple[Optional[str], Optional[str], Optional[str], bytes]
+
 
 class BaseScraper(ABC):
     """
@@ -29,6 +51,25 @@ class BaseScraper(ABC):
     the abstract methods for their specific data source.
     """
 
+    # Pages kept per scraper for ETag / Last-Modified revalidation, keyed by URL
+    PAGE_CACHE_SIZE = 64
+
+    # Parsed pages kept per scraper, keyed by a hash of the page body
+    PARSE_CACHE_SIZE = 16
+
+    # Parsed card records kept per scraper, keyed by a hash of the card markup
+    CARD_CACHE_SIZE = 4096
+
+    # Listing pages fetched at once by scrape_all_cards() unless max_workers
+    # is given; request starts stay rate_limit apart, so extra workers only
+    # overlap one page's download and parse with the next page's request
+    MAX_LISTING_WORKERS = 4
+
+    # Listing pages go to parse_card_listing_html() as decoded HTML instead
+    # of being turned into a BeautifulSoup first; only scrapers that define
+    # that method can use it
+    USE_LXML_LISTING = False
+
     def __init__(
         self,
         rate_limit: float = 1.0,
@@ -36,6 +77,7 @@ class BaseScraper(ABC):
         timeout: int = 30,
         user_agent: Optional[str] = None,
         respect_robots: bool = True,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Initialize the base scraper.
@@ -46,12 +88,36 @@ class BaseScraper(ABC):
             timeout: Request timeout in seconds (default: 30)
             user_agent: Custom user agent string (default: RewardSense bot)
             respect_robots: Whether to respect robots.txt (default: True)
+            max_workers: Listing pages fetched concurrently by
+                scrape_all_cards(); request starts stay rate limited
+                (default: one per listing URL, up to MAX_LISTING_WORKERS)
         """
         self.rate_limit = rate_limit
         self.max_retries = max_retries
         self.timeout = timeout
         self.respect_robots = respect_robots
-        self.last_request_time: float = 0.0
+        self.max_workers = None if max_workers is None else max(1, max_workers)
+        # Request spacing is measured on the monotonic clock, which NTP or
+        # manual clock changes cannot move; None until the first request
+        self._last_request_monotonic: Optional[float] = None
+
+        # Guard the rate limiter and stats when pages are fetched from threads
+        self._rate_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        # url -> (etag, last_modified, content_type, body) for revalidation,
+        # and body hash -> parsed soup so unchanged pages are parsed once
+        self._page_cache: "OrderedDict[str, _PageEntry]" = OrderedDict()
+        self._page_lock = threading.Lock()
+        self._soup_cache: "OrderedDict[Tuple[bytes, Optional[str]], BeautifulSoup]" = (
+            OrderedDict()
+        )
+        self._soup_lock = threading.Lock()
+
+        # markup hash -> parsed card (None for non-card markup), so a card
+        # repeated on a page or across scrapes is parsed once
+        self._card_cache: "OrderedDict[bytes, Optional[Dict[str, Any]]]" = OrderedDict()
+        self._card_lock = threading.Lock()
 
         # Default user agent
         self.user_agent = user_agent or (
@@ -82,6 +148,8 @@ class BaseScraper(ABC):
             backoff_factor=1,  # Wait 1, 2, 4 seconds between retries
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"],
+            respect_retry_after_header=True,
+            backoff_jitter=0.3,  # de-synchronise retries after a 429 burst
         )
 
         adapter = HTTPAdapter(max_retries=retry_strategy)
@@ -103,17 +171,190 @@ class BaseScraper(ABC):
 
         return session
 
+    @property
+    def last_request_time(self) -> float:
+        """Wall-clock time (time.time()) of the last request, or 0.0 if none."""
+        if self._last_request_monotonic is None:
+            return 0.0
+        return time.time() - (time.monotonic() - self._last_request_monotonic)
+
+    @last_request_time.setter
+    def last_request_time(self, value: float) -> None:
+        self._last_request_monotonic = time.monotonic() - (time.time() - value)
+
     def _wait_for_rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit:
-            # Add small random jitter to avoid patterns
-            sleep_time = self.rate_limit - elapsed + random.uniform(0.1, 0.5)
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
-
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        # Held while sleeping so concurrent fetches still start rate_limit apart
+        with self._rate_lock:
+            if self._last_request_monotonic is not None:
+                elapsed = time.monotonic() - self._last_request_monotonic
+                if elapsed < self.rate_limit:
+                    # Add small random jitter to avoid patterns
+                    sleep_time = self.rate_limit - elapsed + random.uniform(0.1, 0.5)
+                    logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+                    time.sleep(sleep_time)
+            self._last_request_monotonic = time.monotonic()
+
+    def _increment_stat(self, key: str) -> None:
+        """Increment an integer stats counter (thread-safe)."""
+        with self._stats_lock:
+            value = self.stats[key]
+            if isinstance(value, int):
+                self.stats[key] = value + 1
+
+    def _get_body(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[bytes, Optional[str]]:
+        """
+        GET a page, revalidating any copy fetched earlier by this scraper.
+
+        A previously seen ETag / Last-Modified is sent as If-None-Match /
+        If-Modified-Since, and a 304 reuses the stored body.
+
+        Returns:
+            (body, content_type)
+        """
+        with self._page_lock:
+            cached = self._page_cache.get(url)
+            if cached is not None:
+                self._page_cache.move_to_end(url)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            etag, last_modified = cached[0], cached[1]
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+        response = self.session.get(url, timeout=self.timeout, headers=request_headers)
+        response.raise_for_status()
+
+        if cached is not None and response.status_code == 304:
+            logger.debug(f"Not modified, reusing cached body: {url}")
+            return cached[3], cached[2]
+
+        content_type = response.headers.get("Content-Type")
+        content_type = content_type if isinstance(content_type, str) else None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        etag = etag if isinstance(etag, str) else None
+        last_modified = last_modified if isinstance(last_modified, str) else None
+        if etag or last_modified:
+            with self._page_lock:
+                self._page_cache[url] = (
+                    etag,
+                    last_modified,
+                    content_type,
+                    response.content,
+                )
+                self._page_cache.move_to_end(url)
+                while len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                    self._page_cache.popitem(last=False)
+        return response.content, content_type
+
+    def _parse_html(
+        self,
+        content: bytes,
+        content_type: Optional[str],
+        parse_only: Optional[SoupStrainer] = None,
+    ) -> BeautifulSoup:
+        """
+        Parse a page body with lxml, reusing the soup for an identical body.
+
+        When the server declares a charset in Content-Type it is passed to
+        BeautifulSoup, skipping the encoding detection pass over the raw bytes.
+        With parse_only, only matching subtrees are built into the soup.
+        Cached soups are shared, so callers must treat them as read-only.
+        """
+        match = _CHARSET_RE.search(content_type) if content_type else None
+        from_encoding = match.group(1) if match else None
+
+        key = (
+            hashlib.blake2b(content, digest_size=16).digest(),
+            from_encoding,
+            parse_only,
+        )
+        with self._soup_lock:
+            soup = self._soup_cache.get(key)
+            if soup is not None:
+                self._soup_cache.move_to_end(key)
+                return soup
+
+        soup = BeautifulSoup(
+            content, "lxml", from_encoding=from_encoding, parse_only=parse_only
+        )
+        with self._soup_lock:
+            self._soup_cache[key] = soup
+            while len(self._soup_cache) > self.PARSE_CACHE_SIZE:
+                self._soup_cache.popitem(last=False)
+        return soup
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def class_xpath(
+        tag: str, class_name: str, axis: str = "descendant", first: bool = False
+    ) -> etree.XPath:
+        """
+        Compiled XPath selecting `tag` elements that carry `class_name`.
+
+        Equivalent to the CSS selector "tag.class_name" along `axis`; with
+        first=True only the nearest match is returned. Selectors are compiled
+        once and shared, so lxml parsers can call this per element.
+
+        Args:
+            tag: Element tag to match (e.g. "div")
+            class_name: One of the element's space-separated classes
+            axis: XPath axis to search from the context node
+            first: Return at most the first match along the axis
+
+        Returns:
+            Callable taking a context element and returning a list of matches
+        """
+        step = (
+            f"{axis}::{tag}[contains(concat(' ', normalize-space(@class), ' '), "
+            f"' {class_name} ')]"
+        )
+        return etree.XPath(f"{step}[1]" if first else step)
+
+    def _parse_card_cached(
+        self,
+        markup: Union[str, bytes],
+        parse: Callable[[], Optional[Dict[str, Any]]],
+        scraped_at: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return parse() for a card element, skipping it if the markup was seen.
+
+        Hits return a fresh deep copy with scraped_at set to the given
+        timestamp (or now), so callers can modify the record, including its
+        nested lists and dicts, freely. Markup that parsed to None stays None.
+        """
+        if isinstance(markup, str):
+            markup = markup.encode("utf-8")
+        key = hashlib.blake2b(markup, digest_size=16).digest()
+        with self._card_lock:
+            hit = key in self._card_cache
+            if hit:
+                self._card_cache.move_to_end(key)
+                card = self._card_cache[key]
+        if hit:
+            if card is None:
+                return None
+            card = copy.deepcopy(card)
+            if "scraped_at" in card:
+                card["scraped_at"] = scraped_at or datetime.now().isoformat()
+            return card
+
+        card = parse()
+        with self._card_lock:
+            self._card_cache[key] = None if card is None else copy.deepcopy(card)
+            while len(self._card_cache) > self.CARD_CACHE_SIZE:
+                self._card_cache.popitem(last=False)
+        return card
+
+    def fetch_page(
+        self, url: str, parse_only: Optional[SoupStrainer] = None
+    ) -> Optional[BeautifulSoup]:
         """
         Fetch a page and return parsed BeautifulSoup object.
 
@@ -124,21 +365,46 @@ class BaseScraper(ABC):
             BeautifulSoup object or None if request failed
         """
         self._wait_for_rate_limit()
-        requests_made = self.stats["requests_made"]
-        if isinstance(requests_made, int):
-            self.stats["requests_made"] = requests_made + 1
+        self._increment_stat("requests_made")
 
         try:
             logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            return self._parse_html(*self._get_body(url), parse_only=parse_only)
+
+        except requests.exceptions.RequestException as e:
+            self._increment_stat("requests_failed")
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """
+        Fetch a page and return its decoded body without parsing it.
+
+        The charset declared in Content-Type is used when present; otherwise
+        the encoding is detected the same way BeautifulSoup would.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Page HTML or None if request failed
+        """
+        self._wait_for_rate_limit()
+        self._increment_stat("requests_made")
 
-            return BeautifulSoup(response.content, "lxml")
+        try:
+            logger.info(f"Fetching: {url}")
+            content, content_type = self._get_body(url)
+            match = _CHARSET_RE.search(content_type) if content_type else None
+            if match:
+                try:
+                    return content.decode(match.group(1), errors="replace")
+                except LookupError:
+                    pass  # unknown charset name; fall back to detection
+            return UnicodeDammit(content, is_html=True).unicode_markup or ""
 
         except requests.exceptions.RequestException as e:
-            requests_failed = self.stats["requests_failed"]
-            if isinstance(requests_failed, int):
-                self.stats["requests_failed"] = requests_failed + 1
+            self._increment_stat("requests_failed")
             logger.error(f"Failed to fetch {url}: {e}")
             return None
 
@@ -156,23 +422,14 @@ class BaseScraper(ABC):
             BeautifulSoup object or None if request failed
         """
         self._wait_for_rate_limit()
-        requests_made = self.stats["requests_made"]
-        if isinstance(requests_made, int):
-            self.stats["requests_made"] = requests_made + 1
+        self._increment_stat("requests_made")
 
         try:
             logger.info(f"Fetching (custom headers): {url}")
-            response = self.session.get(
-                url, timeout=self.timeout, headers=headers or {}
-            )
-            response.raise_for_status()
-
-            return BeautifulSoup(response.content, "lxml")
+            return self._parse_html(*self._get_body(url, headers or {}))
 
         except requests.exceptions.RequestException as e:
-            requests_failed = self.stats["requests_failed"]
-            if isinstance(requests_failed, int):
-                self.stats["requests_failed"] = requests_failed + 1
+            self._increment_stat("requests_failed")
             logger.error(f"Failed to fetch {url}: {e}")
             return None
 
@@ -199,6 +456,19 @@ class BaseScraper(ABC):
         """
         pass
 
+    def get_strainer(self) -> Optional[SoupStrainer]:
+        """
+        Return a filter limiting which parts of a listing page are parsed.
+
+        Listing parsers that only look inside a few container elements can
+        override this so the rest of the page is never built into the soup.
+        Detail pages are always parsed whole.
+
+        Returns:
+            SoupStrainer for listing pages, or None to parse everything
+        """
+        return None
+
     @abstractmethod
     def parse_card_details(self, card_url: str) -> Optional[Dict[str, Any]]:
         """
@@ -228,13 +498,16 @@ class BaseScraper(ABC):
         listing_urls = self.get_card_list_urls()
         logger.info(f"Found {len(listing_urls)} listing pages to scrape")
 
-        # Scrape each listing page
-        for url in listing_urls:
-            soup = self.fetch_page(url)
-            if soup:
-                cards = self.parse_card_listing(soup)
-                logger.info(f"Found {len(cards)} cards on {url}")
-                all_cards.extend(cards)
+        # Scrape each listing page; with several workers the network waits
+        # and parsing of one page overlap with the next page's request
+        workers = min(self.max_workers or self.MAX_LISTING_WORKERS, len(listing_urls))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for cards in executor.map(self._scrape_listing, listing_urls):
+                    all_cards.extend(cards)
+        else:
+            for url in listing_urls:
+                all_cards.extend(self._scrape_listing(url))
 
         self.stats["cards_scraped"] = len(all_cards)
         self.stats["end_time"] = datetime.now()
@@ -246,6 +519,33 @@ class BaseScraper(ABC):
 
         return all_cards
 
+    def _scrape_listing(self, url: str) -> List[Dict[str, Any]]:
+        """Fetch and parse one listing page (empty list if the fetch failed)."""
+        if self.USE_LXML_LISTING and hasattr(self, "parse_card_listing_html"):
+            html = self.fetch_html(url)
+            if html is None:
+                return []
+            cards = self.parse_card_listing_html(html)
+        else:
+            soup = self.fetch_page(url, parse_only=self.get_strainer())
+            if not soup:
+                return []
+            cards = self.parse_card_listing(soup)
+        logger.info(f"Found {len(cards)} cards on {url}")
+        return cards
+
+    async def scrape_all_cards_async(self) -> List[Dict[str, Any]]:
+        """
+        Awaitable variant of scrape_all_cards().
+
+        Runs the blocking scrape in a worker thread so several scrapers can
+        be driven concurrently with asyncio.gather().
+
+        Returns:
+            List of dictionaries containing card data
+        """
+        return await asyncio.to_thread(self.scrape_all_cards)
+
     def get_stats(self) -> Dict[str, Any]:
         """Return scraping statistics."""
         stats: Dict[str, Any] = dict(self.stats)
@@ -12,26 +12,130 @@ Status:
 """
 
 import re
+import string
 import logging
-from typing import List, Dict, Any, Optional
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
+from lxml import etree
 
 from .base_scraper import BaseScraper
 
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import; the per-card parsers below run in tight
+# loops over every listing container.
+_WS_RE = re.compile(r"\s+")
+_DOLLAR_RE = re.compile(r"\$(\d+)")
+
+_CHASE_NAME_SUFFIX_RES = (
+    re.compile(r"Credit Card.*", re.IGNORECASE),
+    re.compile(r"Card\s*Links to.*", re.IGNORECASE),
+    re.compile(r"Links to.*", re.IGNORECASE),
+)
+_CHASE_LISTING_STRAINER = SoupStrainer(
+    "div", class_=re.compile(r"cmp-cardsummary__inner-container")
+)
+# Text nodes get_text() would join: script/style/template contents are left
+# out, as bs4 gives them their own string types
+# fetch_html() has already decoded the page, so it is re-encoded as UTF-8 and
+# parsed with that encoding fixed; lxml rejects str input carrying an XML
+# encoding declaration, and any declared charset is stale after decoding
+_UTF8_HTML_PARSER = etree.HTMLParser(encoding="utf-8")
+_TEXT_XPATH = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False,
+)
+_CHASE_CONTAINER_CLASS = "cmp-cardsummary__inner-container"
+_CHASE_TITLE_CLASS = "cmp-cardsummary__inner-container__title"
+_CHASE_FEE_CLASS = "cmp-cardsummary__inner-container--annual-fee"
+_CHASE_OFFER_CLASS = "cmp-cardsummary__inner-container--card-member-offer"
+_CHASE_IMAGE_CLASS = "cmp-cardsummary__inner-container__image"
+_CHASE_SECTION_CLASSES = frozenset(
+    {_CHASE_FEE_CLASS, _CHASE_OFFER_CLASS, _CHASE_IMAGE_CLASS}
+)
+# String node types get_text() includes (no comments, scripts, ...)
+_TEXT_TYPES = (NavigableString, CData)
+_CHASE_TRADEMARK_TABLE = str.maketrans({"®": "", "℠": "", "™": ""})
+_CHASE_POINTS_BONUS_RE = re.compile(
+    r"[Ee]arn\s+(\d{1,3},?\d{3})\s*(bonus\s+)?(points?|miles?)"
+)
+_CASH_BONUS_RE = re.compile(r"\$(\d+)\s*bonus", re.I)
+
+# One pass finds both "5% cash back on travel" and "3X points on dining" /
+# "Earn 3X on dining". Terminators are lookaheads so the digit that ends one
+# phrase can still start the next. Numbers only start at the beginning of a
+# digit run, so a long digit run in scraped text is scanned from one position
+# instead of every digit, which keeps the cost linear rather than quadratic.
+_REWARD_SCANNER = re.compile(
+    r"(?<!\d)(?P<pct>\d+(?:\.\d+)?)\s*%\s*(?:cash\s*back|back)\s+(?:on\s+)?"
+    r"(?P<cash_cat>[a-zA-Z\s,&]+?)(?=\.|,|and\s+\d|\s+\d)"
+    r"|(?<!\d)(?P<mult>\d+)[xX]\s*(?:points?\s+)?(?:on\s+)?"
+    r"(?P<points_cat>[a-zA-Z\s,&]+?)(?=\.|,|and\s+\d|\s+\d)"
+)
+
+_DISCOVER_CARD_CLASS_RE = re.compile(r"card", re.I)
+_DISCOVER_LISTING_STRAINER = SoupStrainer("div", class_=_DISCOVER_CARD_CLASS_RE)
+_DISCOVER_TRADEMARK_TABLE = str.maketrans({"®": "", "™": ""})
+_DISCOVER_FEE_RE = re.compile(r"\$(\d+)\s*annual", re.I)
+_DISCOVER_CASHBACK_RE = re.compile(r"(\d+)%\s*cash\s*back", re.I)
+_NAME_KEEP = frozenset(string.ascii_lowercase + string.digits)
+
+
+class _NameCharTable(dict):
+    """
+    str.translate table keeping a-z, 0-9 and whitespace, dropping the rest.
+
+    Code points are classified on first sight and remembered, so the table
+    covers all of Unicode (e.g. ®, ™, accented letters) without prebuilding it.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        keep = char in _NAME_KEEP or char.isspace()
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+
+_NAME_TABLE = _NameCharTable()
+
+# Listing pages with less visible body text than this were rendered by JS
+_JS_RENDERED_MIN_TEXT = 500
+
+
+def _has_body_text(soup: BeautifulSoup, min_chars: int) -> bool:
+    """
+    len(soup.body.get_text(strip=True)) >= min_chars, without building the text.
+
+    Stops walking the body as soon as enough text has been seen.
+    """
+    body = soup.body
+    if body is None:
+        return False
+    total = 0
+    for text in body.stripped_strings:
+        total += len(text)
+        if total >= min_chars:
+            return True
+    return False
+
 
 class ChaseScraper(BaseScraper):
     """
     Scraper for Chase credit cards.
 
+    Listing pages are parsed straight into an lxml tree (see
+    parse_card_listing_html); set USE_LXML_LISTING = False to fall back to
+    the BeautifulSoup path.
+
     Updated 2026-02 with correct selectors for Chase's current HTML structure.
     Uses 'cmp-cardsummary__inner-container' as the main card container.
     """
 
     BASE_URL = "https://creditcards.chase.com"
+    USE_LXML_LISTING = True
 
     CARD_URLS = {
         "all_cards": "/all-credit-cards",
@@ -43,6 +147,10 @@ class ChaseScraper(BaseScraper):
     def get_card_list_urls(self) -> List[str]:
         return [f"{self.BASE_URL}{path}" for path in self.CARD_URLS.values()]
 
+    def get_strainer(self) -> SoupStrainer:
+        # Only the card summary containers are inspected below
+        return _CHASE_LISTING_STRAINER
+
     def parse_card_listing(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse Chase credit card listing page."""
         cards = []
@@ -53,14 +161,84 @@ class ChaseScraper(BaseScraper):
         )
         logger.info(f"Found {len(title_divs)} card containers on Chase")
 
+        # One timestamp for the whole listing rather than one per card
+        scraped_at = datetime.now().isoformat()
         for title_div in title_divs:
-            card = self._parse_chase_card(title_div)
+            card = self._parse_chase_card(title_div, scraped_at)
             if card and card.get("name"):
                 cards.append(card)
 
         return cards
 
-    def _parse_chase_card(self, title_div) -> Optional[Dict[str, Any]]:
+    def parse_card_listing_html(self, html: str) -> List[Dict[str, Any]]:
+        """
+        Parse a Chase listing page from its HTML source using lxml directly.
+
+        Same output as parse_card_listing(), without building BeautifulSoup
+        wrappers around every node; lookups are XPath and element walks.
+        """
+        root = (
+            etree.fromstring(html.encode("utf-8"), _UTF8_HTML_PARSER)
+            if html.strip()
+            else None
+        )
+        if root is None:
+            return []
+
+        cards = []
+        title_divs = self.class_xpath("div", _CHASE_TITLE_CLASS)(root)
+        logger.info(f"Found {len(title_divs)} card containers on Chase")
+
+        scraped_at = datetime.now().isoformat()
+        for title_div in title_divs:
+            card = self._parse_chase_element(title_div, scraped_at)
+            if card and card.get("name"):
+                cards.append(card)
+
+        return cards
+
+    def _parse_chase_element(
+        self, title_div, scraped_at: str
+    ) -> Optional[Dict[str, Any]]:
+        """lxml counterpart of _parse_chase_card()."""
+        containers = self.class_xpath(
+            "div", _CHASE_CONTAINER_CLASS, axis="ancestor", first=True
+        )(title_div)
+        if not containers:
+            return None
+        container = containers[0]
+
+        def parse() -> Optional[Dict[str, Any]]:
+            h2 = title_div.find(".//h2")
+            if h2 is None:
+                return None
+
+            def first(class_name: str) -> Optional[etree._Element]:
+                found = self.class_xpath("div", class_name, first=True)(container)
+                return found[0] if found else None
+
+            def text_of(class_name: str) -> Optional[str]:
+                elem = first(class_name)
+                return None if elem is None else "".join(_TEXT_XPATH(elem))
+
+            link = container.find(".//a[@href]")
+            img_div = first(_CHASE_IMAGE_CLASS)
+            img = img_div.find(".//img") if img_div is not None else None
+
+            return self._build_chase_card(
+                name="".join(s.strip() for s in h2.itertext()),
+                fee_text=text_of(_CHASE_FEE_CLASS),
+                offer_text=text_of(_CHASE_OFFER_CLASS),
+                full_text="".join(_TEXT_XPATH(container)),
+                href=link.get("href") if link is not None else None,
+                image_url=img.get("src") if img is not None else None,
+                scraped_at=scraped_at,
+            )
+
+        markup = etree.tostring(container, with_tail=False)
+        return self._parse_card_cached(markup, parse, scraped_at)
+
+    def _parse_chase_card(self, title_div, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Parse a single Chase card from its title div."""
 
         # Get the parent container with all card details
@@ -70,49 +248,103 @@ class ChaseScraper(BaseScraper):
         if not container:
             return None
 
+        def parse() -> Optional[Dict[str, Any]]:
+            # Extract card name from h2
+            h2 = title_div.find("h2")
+            if not h2:
+                return None
+
+            texts, tags = self._collect_texts(container)
+            link = tags.get("a")
+            img_div = tags.get(_CHASE_IMAGE_CLASS)
+            img = img_div.find("img") if img_div else None
+
+            def text_of(key: str) -> Optional[str]:
+                return "".join(texts[key]) if key in texts else None
+
+            return self._build_chase_card(
+                name=h2.get_text(strip=True),
+                fee_text=text_of(_CHASE_FEE_CLASS),
+                offer_text=text_of(_CHASE_OFFER_CLASS),
+                full_text="".join(texts[""]),
+                href=link.get("href", "") if link else None,
+                image_url=img.get("src") if img else None,
+                scraped_at=scraped_at,
+            )
+
+        # Repeated containers (same markup) are parsed once per scraper
+        return self._parse_card_cached(str(container), parse, scraped_at)
+
+    @staticmethod
+    def _collect_texts(
+        container: Tag,
+    ) -> Tuple[Dict[str, List[str]], Dict[str, Tag]]:
+        """
+        Walk a card container once, gathering what _parse_chase_card needs.
+
+        Returns (texts, tags). texts[""] holds every string of the container
+        and texts[cls] the strings of the first div carrying each class in
+        _CHASE_SECTION_CLASSES, i.e. what get_text() would join on each.
+        tags maps those classes to their div and "a" to the first link with
+        an href, matching what container.find() would return.
+        """
+        texts: Dict[str, List[str]] = {"": []}
+        tags: Dict[str, Tag] = {}
+        for node in container.descendants:
+            if isinstance(node, Tag):
+                if node.name == "a" and node.get("href") is not None:
+                    tags.setdefault("a", node)
+                elif node.name == "div":
+                    for cls in node.get("class") or ():
+                        if cls in _CHASE_SECTION_CLASSES and cls not in tags:
+                            tags[cls] = node
+                            texts[cls] = []
+            elif type(node) in _TEXT_TYPES:
+                texts[""].append(node)
+                for parent in node.parents:
+                    if parent is container:
+                        break
+                    for cls in parent.get("class") or ():
+                        if tags.get(cls) is parent:
+                            texts[cls].append(node)
+        return texts, tags
+
+    def _build_chase_card(
+        self,
+        name: str,
+        fee_text: Optional[str],
+        offer_text: Optional[str],
+        full_text: str,
+        href: Optional[str],
+        image_url: Optional[str],
+        scraped_at: str,
+    ) -> Dict[str, Any]:
+        """Build a card record from the text pulled out of one container."""
         card: Dict[str, Any] = {
             "source": "Chase",
             "issuer": "Chase",
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at,
         }
 
-        # Extract card name from h2
-        h2 = title_div.find("h2")
-        if not h2:
-            return None
-
-        name = h2.get_text(strip=True)
         # Clean up the name - remove common suffixes
-        name = re.sub(r"Credit Card.*", "", name, flags=re.IGNORECASE)
-        name = re.sub(r"Card\s*Links to.*", "", name, flags=re.IGNORECASE)
-        name = re.sub(r"Links to.*", "", name, flags=re.IGNORECASE)
+        for suffix_re in _CHASE_NAME_SUFFIX_RES:
+            name = suffix_re.sub("", name)
         # Remove trademark symbols but keep the name clean
-        name = name.replace("®", "").replace("℠", "").replace("™", "")
-        name = re.sub(r"\s+", " ", name).strip()
+        name = name.translate(_CHASE_TRADEMARK_TABLE)
+        name = _WS_RE.sub(" ", name).strip()
         card["name"] = name
 
         # Annual fee
-        fee_div = container.find(
-            "div", class_="cmp-cardsummary__inner-container--annual-fee"
-        )
-        if fee_div:
-            fee_text = fee_div.get_text()
-            fee_match = re.search(r"\$(\d+)", fee_text)
+        if fee_text is not None:
+            fee_match = _DOLLAR_RE.search(fee_text)
             card["annual_fee"] = int(fee_match.group(1)) if fee_match else 0
         else:
             card["annual_fee"] = 0
 
         # Welcome bonus / card member offer
-        offer_div = container.find(
-            "div", class_="cmp-cardsummary__inner-container--card-member-offer"
-        )
-        if offer_div:
-            offer_text = offer_div.get_text()
-
+        if offer_text is not None:
             # Try to find points/miles bonus
-            points_match = re.search(
-                r"[Ee]arn\s+(\d{1,3},?\d{3})\s*(bonus\s+)?(points?|miles?)", offer_text
-            )
+            points_match = _CHASE_POINTS_BONUS_RE.search(offer_text)
             if points_match:
                 points_str = points_match.group(1).replace(",", "")
                 card["welcome_bonus"] = (
@@ -123,75 +355,53 @@ class ChaseScraper(BaseScraper):
                 )
             else:
                 # Try cash bonus
-                cash_match = re.search(r"\$(\d+)\s*bonus", offer_text, re.I)
+                cash_match = _CASH_BONUS_RE.search(offer_text)
                 if cash_match:
                     card["welcome_bonus"] = f"${cash_match.group(1)} bonus"
                     card["bonus_value_usd"] = int(cash_match.group(1))
 
         # Try to extract reward rates from the full container text
-        full_text = container.get_text()
         card["reward_rates"] = self._extract_reward_rates(full_text)
 
         # Get the detail URL
-        link = container.find("a", href=True)
-        if link:
-            href = link.get("href", "")
+        if href is not None:
             if href.startswith("/"):
                 card["detail_url"] = f"{self.BASE_URL}{href}"
             elif href.startswith("http"):
                 card["detail_url"] = href
 
         # Card image
-        img_div = container.find(
-            "div", class_="cmp-cardsummary__inner-container__image"
-        )
-        if img_div:
-            img = img_div.find("img")
-            if img and img.get("src"):
-                card["image_url"] = img["src"]
+        if image_url:
+            card["image_url"] = image_url
 
         return card
 
     def _extract_reward_rates(self, text: str) -> Dict[str, Any]:
         """Extract reward rates from card description text."""
-        rates = {}
-
-        # Common patterns for Chase cards
-        patterns = [
-            # "5% cash back on travel"
-            (
-                r"(\d+(?:\.\d+)?)\s*%\s*(?:cash\s*back|back)\s+(?:on\s+)?([a-zA-Z\s,&]+?)(?:\.|,|and\s+\d|\s+\d)",
-                "cashback",
-            ),
-            # "3X points on dining"
-            (
-                r"(\d+)[xX]\s*(?:points?\s+)?(?:on\s+)?([a-zA-Z\s,&]+?)(?:\.|,|and\s+\d|\s+\d)",
-                "points",
-            ),
-            # "Earn 3X on dining"
-            (
-                r"[Ee]arn\s+(\d+)[xX]\s+(?:on\s+)?([a-zA-Z\s,&]+?)(?:\.|,|and\s+\d|\s+\d)",
-                "points",
-            ),
-        ]
-
-        for pattern, rate_type in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                rate, category = match
-                category = category.strip().lower()
-                # Skip if category is too long (probably not a real category)
-                if len(category) > 30:
-                    continue
-                # Clean up category
-                category = re.sub(r"\s+", " ", category).strip()
-                if category:
-                    rates[category] = {
-                        "rate": float(rate) if "." in rate else int(rate),
-                        "type": rate_type,
-                    }
-
-        return rates
+        cashback: Dict[str, Any] = {}
+        points: Dict[str, Any] = {}
+
+        for match in _REWARD_SCANNER.finditer(text):
+            if match.group("pct") is not None:
+                rate, category = match.group("pct", "cash_cat")
+                rates, rate_type = cashback, "cashback"
+            else:
+                rate, category = match.group("mult", "points_cat")
+                rates, rate_type = points, "points"
+            category = category.strip().lower()
+            # Skip if category is too long (probably not a real category)
+            if len(category) > 30:
+                continue
+            # Clean up category
+            category = _WS_RE.sub(" ", category).strip()
+            if category:
+                rates[category] = {
+                    "rate": float(rate) if "." in rate else int(rate),
+                    "type": rate_type,
+                }
+
+        # Points rates win over cash back for the same category
+        return {**cashback, **points}
 
     def _estimate_points_value(self, points: int, issuer: str) -> float:
         """Estimate USD value of points/miles."""
@@ -235,16 +445,26 @@ class DiscoverScraper(BaseScraper):
     def get_card_list_urls(self) -> List[str]:
         return [f"{self.BASE_URL}{path}" for path in self.CARD_URLS.values()]
 
+    def get_strainer(self) -> SoupStrainer:
+        # Only card-class divs are inspected below
+        return _DISCOVER_LISTING_STRAINER
+
     def parse_card_listing(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse Discover card listing with deduplication."""
         cards = []
         seen_names = set()  # For deduplication
 
         # Try to find card containers
-        card_elements = soup.find_all("div", class_=re.compile(r"card", re.I))
+        card_elements = soup.find_all("div", class_=_DISCOVER_CARD_CLASS_RE)
 
+        # One timestamp for the whole listing rather than one per card
+        scraped_at = datetime.now().isoformat()
         for element in card_elements:
-            card = self._parse_discover_card(element)
+            card = self._parse_card_cached(
+                str(element),
+                partial(self._parse_discover_card, element, scraped_at),
+                scraped_at,
+            )
             if card and card.get("name"):
                 # Deduplicate by normalized name
                 normalized_name = self._normalize_name(card["name"])
@@ -257,12 +477,14 @@ class DiscoverScraper(BaseScraper):
         logger.info(f"Found {len(cards)} unique Discover cards (after dedup)")
         return cards
 
-    def _parse_discover_card(self, element) -> Optional[Dict[str, Any]]:
+    def _parse_discover_card(
+        self, element, scraped_at: str
+    ) -> Optional[Dict[str, Any]]:
         """Parse a single Discover card element."""
         card: Dict[str, Any] = {
             "source": "Discover",
             "issuer": "Discover",
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at,
         }
 
         # Find card name
@@ -283,8 +505,8 @@ class DiscoverScraper(BaseScraper):
             return None
 
         # Clean up name
-        name = name.replace("®", "").replace("™", "")
-        name = re.sub(r"\s+", " ", name).strip()
+        name = name.translate(_DISCOVER_TRADEMARK_TABLE)
+        name = _WS_RE.sub(" ", name).strip()
         card["name"] = name
 
         # Try to extract annual fee
@@ -292,7 +514,7 @@ class DiscoverScraper(BaseScraper):
         if "no annual fee" in text.lower() or "$0 annual fee" in text.lower():
             card["annual_fee"] = 0
         else:
-            fee_match = re.search(r"\$(\d+)\s*annual", text, re.I)
+            fee_match = _DISCOVER_FEE_RE.search(text)
             if fee_match:
                 card["annual_fee"] = int(fee_match.group(1))
             else:
@@ -300,7 +522,7 @@ class DiscoverScraper(BaseScraper):
                 card["annual_fee"] = 0
 
         # Try to extract rewards info
-        rewards_match = re.search(r"(\d+)%\s*cash\s*back", text, re.I)
+        rewards_match = _DISCOVER_CASHBACK_RE.search(text)
         if rewards_match:
             card["reward_rates"] = {"cash back": f"{rewards_match.group(1)}%"}
 
@@ -318,11 +540,7 @@ class DiscoverScraper(BaseScraper):
     def _normalize_name(self, name: str) -> str:
         """Normalize card name for deduplication comparison."""
         # Lowercase, remove special chars, collapse whitespace
-        normalized = name.lower()
-        normalized = re.sub(r"[®™©]", "", normalized)
-        normalized = re.sub(r"[^a-z0-9\s]", "", normalized)
-        normalized = re.sub(r"\s+", " ", normalized).strip()
-        return normalized
+        return " ".join(name.lower().translate(_NAME_TABLE).split())
 
     def parse_card_details(self, card_url: str) -> Optional[Dict[str, Any]]:
         return None
@@ -367,8 +585,7 @@ class AmexScraper(BaseScraper):
         Amex uses JavaScript to render card content.
         """
         # Check if page has content (it won't with requests)
-        body_text = soup.find("body").get_text(strip=True) if soup.find("body") else ""
-        if len(body_text) < 500:
+        if not _has_body_text(soup, _JS_RENDERED_MIN_TEXT):
             logger.warning(
                 "AmexScraper: Page appears to be JavaScript-rendered. "
                 "Returning empty results. TODO: Implement Selenium support."
@@ -415,8 +632,7 @@ class CitiScraper(BaseScraper):
         NOTE: This will return empty results without Selenium.
         Citi uses JavaScript to render card content.
         """
-        body_text = soup.find("body").get_text(strip=True) if soup.find("body") else ""
-        if len(body_text) < 500:
+        if not _has_body_text(soup, _JS_RENDERED_MIN_TEXT):
             logger.warning(
                 "CitiScraper: Page appears to be JavaScript-rendered. "
                 "Returning empty results. TODO: Implement Selenium support."
@@ -463,8 +679,7 @@ class CapitalOneScraper(BaseScraper):
         NOTE: This will return empty results without Selenium.
         Capital One uses JavaScript and may have bot protection.
         """
-        body_text = soup.find("body").get_text(strip=True) if soup.find("body") else ""
-        if len(body_text) < 500:
+        if not _has_body_text(soup, _JS_RENDERED_MIN_TEXT):
             logger.warning(
                 "CapitalOneScraper: Page appears to be JavaScript-rendered. "
                 "Returning empty results. TODO: Implement Selenium support."
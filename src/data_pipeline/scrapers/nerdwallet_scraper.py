@@ -75,15 +75,17 @@ class NerdWalletScraper(BaseScraper):
         Parse a NerdWallet category page for credit card listings.
         """
         cards = []
+        # One timestamp for the whole listing rather than one per card
+        scraped_at = datetime.now().isoformat()
 
         # Try JSON-LD structured data first (most reliable)
-        json_ld_cards = self._extract_json_ld(soup)
+        json_ld_cards = self._extract_json_ld(soup, scraped_at)
         if json_ld_cards:
             cards.extend(json_ld_cards)
             logger.info(f"Extracted {len(json_ld_cards)} cards from JSON-LD")
 
         # Also parse HTML for additional cards
-        html_cards = self._parse_html_cards(soup)
+        html_cards = self._parse_html_cards(soup, scraped_at)
 
         # Merge avoiding duplicates by card name
         existing_names = {c.get("name", "").lower() for c in cards}
@@ -95,7 +97,9 @@ class NerdWalletScraper(BaseScraper):
 
         return cards
 
-    def _extract_json_ld(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _extract_json_ld(
+        self, soup: BeautifulSoup, scraped_at: str
+    ) -> List[Dict[str, Any]]:
         """Extract card data from JSON-LD structured data."""
         cards = []
 
@@ -107,13 +111,13 @@ class NerdWalletScraper(BaseScraper):
 
                 if isinstance(data, list):
                     for item in data:
-                        card = self._parse_json_ld_item(item)
+                        card = self._parse_json_ld_item(item, scraped_at)
                         if card:
                             cards.append(card)
                 elif isinstance(data, dict):
                     # Check if it's a product or list of products
                     if data.get("@type") in ["Product", "CreditCard"]:
-                        card = self._parse_json_ld_item(data)
+                        card = self._parse_json_ld_item(data, scraped_at)
                         if card:
                             cards.append(card)
                     elif "itemListElement" in data:
@@ -122,7 +126,9 @@ class NerdWalletScraper(BaseScraper):
                                 item_data = item["item"]
                                 # item can be a URL string or a dict
                                 if isinstance(item_data, dict):
-                                    card = self._parse_json_ld_item(item_data)
+                                    card = self._parse_json_ld_item(
+                                        item_data, scraped_at
+                                    )
                                     if card:
                                         cards.append(card)
 
@@ -132,7 +138,9 @@ class NerdWalletScraper(BaseScraper):
 
         return cards
 
-    def _parse_json_ld_item(self, item: Dict) -> Optional[Dict[str, Any]]:
+    def _parse_json_ld_item(
+        self, item: Dict, scraped_at: str
+    ) -> Optional[Dict[str, Any]]:
         """Parse a single JSON-LD item into card data."""
         item_type = item.get("@type", "")
         if not any(
@@ -151,7 +159,7 @@ class NerdWalletScraper(BaseScraper):
             "issuer": self._extract_issuer(name),
             "detail_url": item.get("url"),
             "image_url": item.get("image"),
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at,
         }
 
         # Extract offers/pricing info
@@ -169,7 +177,9 @@ class NerdWalletScraper(BaseScraper):
 
         return card
 
-    def _parse_html_cards(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _parse_html_cards(
+        self, soup: BeautifulSoup, scraped_at: str
+    ) -> List[Dict[str, Any]]:
         """Parse card data from HTML elements."""
         cards = []
 
@@ -197,17 +207,17 @@ class NerdWalletScraper(BaseScraper):
                 unique_elements.append(elem)
 
         for element in unique_elements:
-            card = self._parse_card_element(element)
+            card = self._parse_card_element(element, scraped_at)
             if card and card.get("name"):
                 cards.append(card)
 
         return cards
 
-    def _parse_card_element(self, element) -> Dict[str, Any]:
+    def _parse_card_element(self, element, scraped_at: str) -> Dict[str, Any]:
         """Parse a single card HTML element."""
         card: Dict[str, Any] = {
             "source": "NerdWallet",
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at,
         }
 
         # Extract card name from heading
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import data_pipeline.api_fetcher as api_fetcher
+
+
+@pytest.mark.unit
+def test_all_exports_resolve_lazily():
+    from data_pipeline.api_fetcher.client_base import BaseAPIClient
+    from data_pipeline.api_fetcher.schema import CardOffer
+
+    for name in api_fetcher.__all__:
+        assert getattr(api_fetcher, name) is not None
+
+    assert api_fetcher.BaseAPIClient is BaseAPIClient
+    assert api_fetcher.CardOffer is CardOffer
+
+
+@pytest.mark.unit
+def test_unknown_attribute_raises():
+    missing = "DoesNotExist"
+    with pytest.raises(AttributeError, match=missing):
+        getattr(api_fetcher, missing)
+
+
+@pytest.mark.unit
+def test_package_import_does_not_load_requests():
+    code = (
+        "import sys; sys.path.insert(0, 'src'); "
+        "import data_pipeline.api_fetcher; "
+        "print('requests' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[3],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "False"
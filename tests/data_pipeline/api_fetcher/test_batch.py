@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+import pytest
+
+from data_pipeline.api_fetcher.batch import CardOfferBatch
+from data_pipeline.api_fetcher.schema import CardOffer
+
+
+def _offer(name, fee=None, rates=None):
+    return CardOffer(
+        source="test",
+        card_name=name,
+        issuer="Chase",
+        annual_fee=fee,
+        reward_rates=rates or {},
+    )
+
+
+@pytest.mark.unit
+def test_batch_flattens_reward_rates_into_matrix():
+    batch = CardOfferBatch.from_offers(
+        [
+            _offer("A", 95, {"dining": 3, "travel": 2}),
+            _offer("B", None, {"travel": 5}),
+            _offer("C", 0),
+        ]
+    )
+
+    assert len(batch) == 3
+    assert batch.card_names == ["A", "B", "C"]
+    assert batch.reward_matrix.shape == (3, 2)
+    np.testing.assert_array_equal(batch.rates_for("travel"), [2.0, 5.0, 0.0])
+    np.testing.assert_array_equal(batch.rates_for("dining"), [3.0, 0.0, 0.0])
+    np.testing.assert_array_equal(batch.rates_for("gas"), [0.0, 0.0, 0.0])
+
+    assert batch.annual_fees[0] == 95.0
+    assert math.isnan(batch.annual_fees[1])
+    assert list(batch.issuers) == ["Chase"] * 3
+
+
+@pytest.mark.unit
+def test_batch_from_empty_offers():
+    batch = CardOfferBatch.from_offers([])
+
+    assert len(batch) == 0
+    assert batch.reward_matrix.shape == (0, 0)
+    assert batch.rates_for("dining").shape == (0,)
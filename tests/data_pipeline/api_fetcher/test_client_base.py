@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 import pytest
 from unittest.mock import MagicMock
 
@@ -6,15 +9,30 @@ from data_pipeline.api_fetcher.client_base import (
     APIClientError,
     APIClientHTTPError,
     APIClientTimeout,
+    _get_session,
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_sessions():
+    # Tests replace session.get on the shared session; don't leak it.
+    _get_session.cache_clear()
+    yield
+    _get_session.cache_clear()
+
+
 class FakeResponse:
     def __init__(self, status_code=200, json_data=None, json_raises=False):
         self.status_code = status_code
         self._json_data = json_data
         self._json_raises = json_raises
 
+    @property
+    def content(self):
+        if self._json_raises:
+            return b"<html>not json</html>"
+        return json.dumps(self._json_data).encode("utf-8")
+
     def json(self):
         if self._json_raises:
             raise ValueError("Invalid JSON")
@@ -75,3 +93,156 @@ def test_get_json_timeout_raises():
         client.get_json("/offers")
 
     assert "timed out" in str(e.value).lower()
+
+
+@pytest.mark.unit
+def test_get_json_async_matches_sync():
+    client = BaseAPIClient(base_url="https://example.com")
+    client.session.get = MagicMock(return_value=FakeResponse(200, {"ok": True}))
+
+    async def fetch_two():
+        return await asyncio.gather(
+            client.get_json_async("/a"), client.get_json_async("/b")
+        )
+
+    assert asyncio.run(fetch_two()) == [{"ok": True}, {"ok": True}]
+    assert client.session.get.call_count == 2
+
+
+@pytest.mark.unit
+def test_session_adapter_pool_is_sized():
+    client = BaseAPIClient(base_url="https://example.com")
+    adapter = client.session.get_adapter("https://example.com")
+
+    assert adapter._pool_maxsize == BaseAPIClient.POOL_MAXSIZE
+    assert adapter._pool_connections == BaseAPIClient.POOL_CONNECTIONS
+    assert client.session.get_adapter("http://example.com") is adapter
+
+
+@pytest.mark.unit
+def test_retry_policy_uses_jitter_and_retry_after():
+    client = BaseAPIClient(base_url="https://example.com", retries=2)
+    retry = client.session.get_adapter("https://example.com").max_retries
+
+    assert retry.total == 2
+    assert retry.respect_retry_after_header is True
+    assert retry.backoff_jitter == BaseAPIClient.BACKOFF_JITTER
+    assert retry.backoff_max == BaseAPIClient.BACKOFF_MAX
+    assert 429 in retry.status_forcelist
+
+
+@pytest.mark.unit
+def test_get_many_json_preserves_order_and_bounds_concurrency():
+    import threading
+    import time
+
+    client = BaseAPIClient(base_url="https://example.com")
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def fake_get(url, **kwargs):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.01)
+        with lock:
+            state["in_flight"] -= 1
+        return FakeResponse(200, {"url": url})
+
+    client.session.get = MagicMock(side_effect=fake_get)
+    endpoints = [f"/offers/{i}" for i in range(10)]
+
+    data = asyncio.run(client.get_many_json(endpoints, max_concurrency=3))
+
+    assert [d["url"] for d in data] == [
+        f"https://example.com/offers/{i}" for i in range(10)
+    ]
+    assert 1 < state["peak"] <= 3
+
+
+@pytest.mark.unit
+def test_clients_for_same_host_share_session():
+    a = BaseAPIClient(base_url="https://example.com")
+    b = BaseAPIClient(base_url="https://example.com/")
+    other = BaseAPIClient(base_url="https://other.example.com")
+
+    assert a.session is b.session
+    assert other.session is not a.session
+
+
+@pytest.mark.unit
+def test_default_headers_sent_per_request_not_on_shared_session():
+    client = BaseAPIClient(
+        base_url="https://example.com", default_headers={"Authorization": "Bearer x"}
+    )
+    client.session.get = MagicMock(return_value=FakeResponse(200, {}))
+
+    client.get_json("/offers", headers={"X-Trace": "1"})
+
+    assert "Authorization" not in client.session.headers
+    sent = client.session.get.call_args.kwargs["headers"]
+    assert sent == {"Authorization": "Bearer x", "X-Trace": "1"}
+
+
+@pytest.fixture
+def local_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append((self.path, dict(self.headers)))
+            status = 404 if self.path.startswith("/missing") else 200
+            body = b'{"ok": true}'
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", seen
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+def test_get_bytes_sends_merged_headers(local_server):
+    base_url, seen = local_server
+    client = BaseAPIClient(base_url=base_url, default_headers={"X-Key": "k"}, retries=0)
+
+    assert client.get_bytes("/data.json", params={"v": 1}) == b'{"ok": true}'
+
+    path, headers = seen[0]
+    assert path == "/data.json?v=1"
+    assert headers["X-Key"] == "k"
+    assert headers["User-Agent"] == "RewardSense/1.0"
+
+
+@pytest.mark.unit
+def test_get_bytes_http_error_raises(local_server):
+    base_url, _ = local_server
+    client = BaseAPIClient(base_url=base_url, retries=0)
+
+    with pytest.raises(APIClientHTTPError, match="HTTP 404"):
+        client.get_bytes("/missing")
+
+
+@pytest.mark.unit
+def test_get_bytes_goes_through_session_get(local_server):
+    # Session.get applies trust_env settings (proxies, REQUESTS_CA_BUNDLE).
+    base_url, _ = local_server
+    client = BaseAPIClient(base_url=base_url, retries=0)
+    real_get = client.session.get
+    client.session.get = MagicMock(side_effect=real_get)
+
+    assert client.get_bytes("/data.json") == b'{"ok": true}'
+
+    _, kwargs = client.session.get.call_args
+    assert kwargs["stream"] is True
@@ -1,3 +1,5 @@
+import gzip
+
 import pytest
 from unittest.mock import patch
 
@@ -19,8 +21,8 @@ def test_public_export_mode_selected_when_no_api_key(monkeypatch):
     )
     monkeypatch.setenv("CREDITCARDBONUSES_TIMEOUT_SEC", "10")
 
-    # Avoid real HTTP by patching BaseAPIClient.get_json
-    with patch.object(CreditCardBonusesClient, "get_json", return_value=[]):
+    # Avoid real HTTP by patching BaseAPIClient.get_bytes
+    with patch.object(CreditCardBonusesClient, "get_bytes", return_value=b"[]"):
         client = CreditCardBonusesClient()
         assert client.mode == "public_export"
         offers = client.fetch_current_offers()
@@ -69,7 +71,7 @@ def test_coerce_offers_list_accepts_list(monkeypatch):
     monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
 
     with patch.object(
-        CreditCardBonusesClient, "get_json", return_value=[{"a": 1}, "x", {"b": 2}]
+        CreditCardBonusesClient, "get_bytes", return_value=b'[{"a": 1}, "x", {"b": 2}]'
     ):
         client = CreditCardBonusesClient()
         offers = client.fetch_current_offers()
@@ -83,7 +85,7 @@ def test_coerce_offers_list_accepts_wrapped_offers(monkeypatch):
     monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
 
     with patch.object(
-        CreditCardBonusesClient, "get_json", return_value={"offers": [{"x": 1}]}
+        CreditCardBonusesClient, "get_bytes", return_value=b'{"offers": [{"x": 1}]}'
     ):
         client = CreditCardBonusesClient()
         offers = client.fetch_current_offers()
@@ -107,3 +109,156 @@ def test_upstream_error_wrapping(monkeypatch):
             client.fetch_current_offers()
 
         assert "Keyed API fetch failed" in str(e.value)
+
+
+class _ExportResponse:
+    def __init__(self, status_code, body=b"", etag=None):
+        self.status_code = status_code
+        self.content = body
+        self.headers = {"ETag": etag} if etag else {}
+
+    def json(self):
+        import json
+
+        return json.loads(self.content)
+
+
+@pytest.mark.unit
+def test_public_export_uses_etag_cache(monkeypatch, tmp_path):
+    monkeypatch.delenv("CREDITCARDBONUSES_API_KEY", raising=False)
+    monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
+    monkeypatch.setenv("CREDITCARDBONUSES_CACHE_DIR", str(tmp_path))
+
+    client = CreditCardBonusesClient()
+    responses = [
+        _ExportResponse(200, b'[{"name": "A"}]', etag='"v1"'),
+        _ExportResponse(304),
+    ]
+    sent_headers = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        sent_headers.append(headers)
+        return responses.pop(0)
+
+    with patch.object(client.session, "get", side_effect=fake_get):
+        assert client.fetch_current_offers() == [{"name": "A"}]
+        assert client.fetch_current_offers() == [{"name": "A"}]
+
+    assert sent_headers[0] is None
+    assert sent_headers[1] == {"If-None-Match": '"v1"'}
+    assert (tmp_path / "ccb_export.etag").read_text() == '"v1"'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "cached_body",
+    [b"not gzip", b"\x1f\x8b\x08\x00truncated", gzip.compress(b"{oops"), None],
+)
+def test_public_export_refetches_when_cache_is_unreadable(
+    monkeypatch, tmp_path, cached_body
+):
+    monkeypatch.delenv("CREDITCARDBONUSES_API_KEY", raising=False)
+    monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
+    monkeypatch.setenv("CREDITCARDBONUSES_CACHE_DIR", str(tmp_path))
+    etag_path = tmp_path / "ccb_export.etag"
+    body_path = tmp_path / "ccb_export.json.gz"
+    etag_path.write_text('"v1"')
+    body_path.write_bytes(b"")
+
+    client = CreditCardBonusesClient()
+    responses = [
+        _ExportResponse(304),
+        _ExportResponse(200, b'[{"name": "B"}]', etag='"v2"'),
+    ]
+    sent_headers = []
+
+    def fake_get(url, params=None, headers=None, timeout=None):
+        sent_headers.append(headers)
+        if len(sent_headers) == 1:
+            if cached_body is None:
+                body_path.unlink()  # removed after the is_file() check
+            else:
+                body_path.write_bytes(cached_body)
+        return responses.pop(0)
+
+    with patch.object(client.session, "get", side_effect=fake_get):
+        assert client.fetch_current_offers() == [{"name": "B"}]
+
+    assert sent_headers == [{"If-None-Match": '"v1"'}, None]
+    assert etag_path.read_text() == '"v2"'
+
+
+@pytest.mark.unit
+def test_public_export_without_cache_dir_uses_get_bytes(monkeypatch):
+    monkeypatch.delenv("CREDITCARDBONUSES_API_KEY", raising=False)
+    monkeypatch.delenv("CREDITCARDBONUSES_CACHE_DIR", raising=False)
+    monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
+
+    with patch.object(
+        CreditCardBonusesClient, "get_bytes", return_value=b'[{"a": 1}]'
+    ) as mock_get:
+        client = CreditCardBonusesClient()
+        assert client.cache_dir is None
+        assert client.fetch_current_offers() == [{"a": 1}]
+        mock_get.assert_called_once()
+
+
+@pytest.mark.unit
+def test_coerce_offers_list_passes_clean_list_through(monkeypatch):
+    monkeypatch.delenv("CREDITCARDBONUSES_API_KEY", raising=False)
+    monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
+
+    records = [{"a": 1}, {"b": 2}]
+    with patch.object(
+        CreditCardBonusesClient, "_fetch_from_public_export", return_value=records
+    ):
+        client = CreditCardBonusesClient()
+        assert client.fetch_current_offers() is records
+
+
+@pytest.mark.unit
+def test_invalid_export_url_raises_config_error(monkeypatch):
+    monkeypatch.delenv("CREDITCARDBONUSES_API_KEY", raising=False)
+    monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "not-a-url")
+
+    with pytest.raises(CreditCardBonusesConfigError):
+        CreditCardBonusesClient()
+
+
+@pytest.mark.unit
+def test_public_export_invalid_json_raises_upstream_error(monkeypatch):
+    monkeypatch.delenv("CREDITCARDBONUSES_API_KEY", raising=False)
+    monkeypatch.delenv("CREDITCARDBONUSES_CACHE_DIR", raising=False)
+    monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
+
+    with patch.object(CreditCardBonusesClient, "get_bytes", return_value=b"<html>"):
+        client = CreditCardBonusesClient()
+        with pytest.raises(CreditCardBonusesUpstreamError, match="invalid JSON"):
+            client.fetch_current_offers()
+
+
+@pytest.mark.unit
+def test_fetch_current_offers_async_gathers_sources(monkeypatch):
+    import asyncio
+    import threading
+
+    monkeypatch.delenv("CREDITCARDBONUSES_API_KEY", raising=False)
+    monkeypatch.delenv("CREDITCARDBONUSES_CACHE_DIR", raising=False)
+    monkeypatch.setenv("CREDITCARDBONUSES_EXPORT_URL", "https://example.com/data.json")
+
+    # Both fetches must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_get_bytes(self, endpoint, params=None, headers=None):
+        barrier.wait()
+        return b'[{"name": "A"}]'
+
+    with patch.object(CreditCardBonusesClient, "get_bytes", fake_get_bytes):
+        clients = [CreditCardBonusesClient(), CreditCardBonusesClient()]
+
+        async def fetch_both():
+            return await asyncio.gather(
+                *(c.fetch_current_offers_async() for c in clients)
+            )
+
+        assert asyncio.run(fetch_both()) == [[{"name": "A"}], [{"name": "A"}]]
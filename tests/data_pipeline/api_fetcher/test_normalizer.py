@@ -1,6 +1,9 @@
 import pytest
 
-from src.data_pipeline.api_fetcher.normalizer import normalize_creditcardbonuses_offer
+from src.data_pipeline.api_fetcher.normalizer import (
+    normalize_all,
+    normalize_creditcardbonuses_offer,
+)
 from src.data_pipeline.api_fetcher.schema import CardOffer
 
 
@@ -165,3 +168,199 @@ def test_normalizer_includes_raw_payload_by_default():
     assert offer is not None
     assert offer.raw is not None
     assert offer.raw["name"] == "Test Card"
+
+
+@pytest.mark.unit
+def test_normalize_all_drops_invalid_and_keeps_order():
+    raws = [
+        {"name": "A", "issuer": "Chase"},
+        {"name": "missing issuer"},
+        "not a dict",
+        {"name": "B", "issuer": "Citi", "annualFee": 95},
+    ]
+    offers = normalize_all(raws)
+
+    assert [o.card_name for o in offers] == ["A", "B"]
+    assert offers[1].annual_fee == 95.0
+    assert normalize_all([]) == []
+
+
+@pytest.mark.unit
+def test_pick_best_offer_vectorized_matches_scalar_rule():
+    import random
+
+    from src.data_pipeline.api_fetcher.normalizer import _pick_best_offer
+
+    rng = random.Random(7)
+    for _ in range(50):
+        offers = [
+            {
+                "amount": [{"amount": rng.choice([0, 10000, 20000, 50000])}],
+                "spend": rng.choice([0, 1000, 2000, 4000]),
+                "days": rng.choice([0, 90, 180]),
+                "id": i,
+            }
+            for i in range(rng.randint(16, 40))
+        ]
+        offers.insert(3, "junk")
+
+        def key(o):
+            amt = o["amount"][0]["amount"]
+            ratio = amt / o["spend"] if o["spend"] > 0 else 0.0
+            return (ratio, amt, -o["days"])
+
+        dicts = [o for o in offers if isinstance(o, dict)]
+        expected = max(dicts, key=key)  # max() keeps the first maximal item
+
+        assert _pick_best_offer(offers, [])["id"] == expected["id"]
+
+
+@pytest.mark.unit
+def test_normalize_all_process_pool_matches_sequential(monkeypatch):
+    from src.data_pipeline.api_fetcher import normalizer
+
+    monkeypatch.setattr(normalizer, "_PARALLEL_MIN_RECORDS", 10)
+    raws = [{"name": f"Card {i}", "issuer": "Chase", "annualFee": i} for i in range(40)]
+    raws[5] = {"name": "no issuer"}
+
+    parallel = normalize_all(raws, max_workers=2)
+    sequential = normalize_all(raws, max_workers=1)
+
+    assert len(parallel) == 39
+    assert [o.card_name for o in parallel] == [o.card_name for o in sequential]
+    assert [o.annual_fee for o in parallel] == [o.annual_fee for o in sequential]
+    assert len({o.last_updated for o in parallel}) == 1
+
+
+@pytest.mark.unit
+def test_normalize_all_is_sequential_by_default(monkeypatch):
+    from src.data_pipeline.api_fetcher import normalizer
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool started without max_workers > 1")
+
+    monkeypatch.setattr(normalizer, "_PARALLEL_MIN_RECORDS", 1)
+    monkeypatch.setattr(normalizer, "ProcessPoolExecutor", no_pool)
+    raws = [{"name": f"Card {i}", "issuer": "Chase"} for i in range(5)]
+
+    assert [o.card_name for o in normalize_all(raws)] == [r["name"] for r in raws]
+
+
+@pytest.mark.unit
+def test_normalizer_fast_path_matches_validated_model():
+    raw = {
+        "name": "Sapphire",
+        "issuer": "CHASE",
+        "annualFee": "$95",
+        "universalCashbackPercent": 1,
+        "isBusiness": False,
+        "offers": [{"amount": [{"amount": 60000}], "spend": 4000}, "junk"],
+        "credits": None,
+    }
+    offer = normalize_creditcardbonuses_offer(raw)
+
+    validated = CardOffer(**offer.model_dump(exclude={"last_updated"}))
+    assert offer.model_dump(exclude={"last_updated"}) == validated.model_dump(
+        exclude={"last_updated"}
+    )
+    assert offer.annual_fee == 95.0
+    assert offer.offers == [{"amount": [{"amount": 60000}], "spend": 4000}]
+
+
+@pytest.mark.unit
+def test_normalize_all_shares_one_batch_timestamp():
+    from datetime import datetime
+
+    raws = [{"name": f"Card {i}", "issuer": "Chase"} for i in range(5)]
+    offers = normalize_all(raws, max_workers=1)
+
+    stamps = {o.last_updated for o in offers}
+    assert len(stamps) == 1
+    assert datetime.fromisoformat(stamps.pop()).utcoffset().total_seconds() == 0
+
+    # The batch timestamp does not leak past normalize_all.
+    from src.data_pipeline.api_fetcher.schema import current_batch_timestamp
+
+    assert current_batch_timestamp.get() is None
+
+
+@pytest.mark.unit
+def test_normalize_all_interns_low_cardinality_fields():
+    raws = [
+        {
+            "name": "A",
+            "issuer": "".join(["CH", "ASE"]),
+            "network": "".join(["VI", "SA"]),
+        },
+        {
+            "name": "B",
+            "issuer": "".join(["CHA", "SE"]),
+            "network": "".join(["V", "ISA"]),
+        },
+    ]
+    assert raws[0]["issuer"] is not raws[1]["issuer"]
+
+    a, b = normalize_all(raws, max_workers=1)
+    assert a.issuer is b.issuer
+    assert a.network is b.network
+
+
+@pytest.mark.unit
+def test_normalizer_raw_is_compressed_and_roundtrips():
+    raw = {"name": "Test Card", "issuer": "Chase", "offers": [{"spend": 1}]}
+    offer = normalize_creditcardbonuses_offer(raw)
+
+    assert isinstance(offer.raw_blob, bytes)
+    assert offer.raw == raw
+    assert offer.model_dump()["raw"] == raw
+    assert "raw_blob" not in offer.model_dump()
+
+
+@pytest.mark.unit
+def test_normalizer_skips_raw_when_disabled(monkeypatch):
+    monkeypatch.setenv("REWARDSENSE_PRESERVE_RAW", "0")
+    offer = normalize_creditcardbonuses_offer({"name": "Test Card", "issuer": "Chase"})
+
+    assert offer.raw_blob is None
+    assert offer.raw is None
+
+
+@pytest.mark.unit
+def test_normalize_all_reads_preserve_raw_once_per_batch(monkeypatch):
+    from src.data_pipeline.api_fetcher import normalizer
+
+    calls = []
+
+    def preserve_raw():
+        calls.append(1)
+        return False
+
+    monkeypatch.setattr(normalizer, "_preserve_raw", preserve_raw)
+    raws = [{"name": f"Card {i}", "issuer": "Chase"} for i in range(5)]
+    offers = normalize_all(raws)
+
+    assert len(calls) == 1
+    assert [o.raw_blob for o in offers] == [None] * 5
+
+
+@pytest.mark.unit
+def test_card_offer_still_accepts_raw_dict():
+    offer = CardOffer(source="s", card_name="c", issuer="i", raw={"a": 1})
+    assert offer.raw == {"a": 1}
+
+
+@pytest.mark.unit
+def test_validate_card_offers_batch_drops_invalid_records():
+    from src.data_pipeline.api_fetcher.schema import validate_card_offers
+
+    records = [
+        {"source": "s", "card_name": "A", "issuer": "i", "annual_fee": "$95"},
+        {"source": "s", "issuer": "i"},  # missing card_name
+        {"source": "s", "card_name": "C", "issuer": "i", "categories": ["Travel"]},
+    ]
+    offers = validate_card_offers(records)
+
+    assert [o.card_name for o in offers] == ["A", "C"]
+    assert offers[0].annual_fee == 95.0
+    assert offers[1].categories == ["travel"]
+    assert validate_card_offers(records[:1])[0].card_name == "A"
@@ -14,9 +14,11 @@ Run with: pytest tests/test_base_scraper.py -v --cov=src/data_pipeline/scrapers/
 
 import pytest
 import time
+import asyncio
 from unittest.mock import Mock, patch
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 
 import sys
 
@@ -396,6 +398,53 @@ class TestBaseScraperRateLimiting:
         # Then
         assert elapsed < 0.2
 
+    def test_rate_limit_ignores_wall_clock_jumps(self):
+        """
+        Given: A recent request, then the wall clock jumps back an hour
+        When: _wait_for_rate_limit is called after the rate limit elapsed
+        Then: It should not sleep for the size of the clock jump
+        """
+        # Given
+        scraper = ConcreteScraper(rate_limit=0.05)
+        scraper._wait_for_rate_limit()
+        time.sleep(0.06)
+        real_time = time.time
+
+        # When
+        with patch("time.time", side_effect=lambda: real_time() - 3600):
+            start = time.monotonic()
+            scraper._wait_for_rate_limit()
+            elapsed = time.monotonic() - start
+
+        # Then
+        assert elapsed < 0.05
+
+    def test_rate_limit_spaces_concurrent_requests(self):
+        """
+        Given: A scraper with a 0.1s rate limit
+        When: _wait_for_rate_limit is called from several threads at once
+        Then: The calls should be serialized, one rate limit apart
+        """
+        import threading
+
+        # Given
+        scraper = ConcreteScraper(rate_limit=0.1)
+        scraper.last_request_time = time.time()
+
+        # When
+        start = time.time()
+        threads = [
+            threading.Thread(target=scraper._wait_for_rate_limit) for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.time() - start
+
+        # Then
+        assert elapsed >= 0.3
+
     def test_rate_limit_updates_last_request_time(self, scraper_fast_rate_limit):
         """
         Given: A scraper with rate limiting
@@ -439,6 +488,161 @@ class TestBaseScraperFetchPage:
         assert result is not None
         assert isinstance(result, BeautifulSoup)
 
+    @patch("requests.Session.get")
+    def test_fetch_page_uses_declared_charset(self, mock_get, scraper_no_rate_limit):
+        """
+        Given: A response whose Content-Type declares a non-UTF-8 charset
+        When: fetch_page is called
+        Then: The body should be decoded with the declared charset
+        """
+        # Given
+        response = Mock()
+        response.headers = {"Content-Type": "text/html; charset=windows-1252"}
+        response.content = "<html><body><h2>Caf\u00e9 Card</h2></body></html>".encode(
+            "windows-1252"
+        )
+        response.raise_for_status = Mock()
+        mock_get.return_value = response
+
+        # When
+        result = scraper_no_rate_limit.fetch_page("https://example.com")
+
+        # Then
+        assert result.find("h2").get_text() == "Caf\u00e9 Card"
+
+    @patch("requests.Session.get")
+    def test_fetch_html_decodes_declared_charset(self, mock_get, scraper_no_rate_limit):
+        """
+        Given: A response whose Content-Type declares a non-UTF-8 charset
+        When: fetch_html is called
+        Then: The body should be returned as text decoded with that charset
+        """
+        # Given
+        response = Mock()
+        response.headers = {"Content-Type": "text/html; charset=windows-1252"}
+        response.content = "<h2>Caf\u00e9 Card</h2>".encode("windows-1252")
+        response.raise_for_status = Mock()
+        mock_get.return_value = response
+
+        # When
+        result = scraper_no_rate_limit.fetch_html("https://example.com")
+
+        # Then
+        assert result == "<h2>Caf\u00e9 Card</h2>"
+
+    @patch("requests.Session.get")
+    def test_fetch_page_parse_only_limits_tree(self, mock_get, scraper_no_rate_limit):
+        """
+        Given: A page already fetched and parsed in full
+        When: fetch_page is called again with a SoupStrainer
+        Then: Only the matching subtrees should be built, not the cached soup
+        """
+        # Given
+        response = Mock()
+        response.headers = {"Content-Type": "text/html"}
+        response.content = (
+            b"<html><body><h1>Title</h1>"
+            b'<div class="card"><h2>A</h2></div><p>footer</p></body></html>'
+        )
+        response.raise_for_status = Mock()
+        mock_get.return_value = response
+        full = scraper_no_rate_limit.fetch_page("https://example.com")
+
+        # When
+        strained = scraper_no_rate_limit.fetch_page(
+            "https://example.com", parse_only=SoupStrainer("div", class_="card")
+        )
+
+        # Then
+        assert full.find("h1") is not None
+        assert strained.find("h1") is None
+        assert strained.find("p") is None
+        assert strained.find("h2").get_text() == "A"
+
+    def test_fetch_page_revalidates_with_etag(self, scraper_no_rate_limit):
+        """
+        Given: A page served with an ETag, then answered with 304
+        When: fetch_page is called twice
+        Then: The second request sends If-None-Match and reuses the body
+        """
+        # Given
+        first = Mock()
+        first.status_code = 200
+        first.headers = {"Content-Type": "text/html", "ETag": '"v1"'}
+        first.content = b"<html><body><h2>Card One</h2></body></html>"
+        first.raise_for_status = Mock()
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+        not_modified.content = b""
+        not_modified.raise_for_status = Mock()
+        scraper_no_rate_limit.session.get = Mock(side_effect=[first, not_modified])
+
+        # When
+        soup1 = scraper_no_rate_limit.fetch_page("https://example.com")
+        soup2 = scraper_no_rate_limit.fetch_page("https://example.com")
+
+        # Then
+        second_call = scraper_no_rate_limit.session.get.call_args_list[1]
+        assert second_call.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert soup2.find("h2").get_text() == "Card One"
+        # identical body is parsed once
+        assert soup2 is soup1
+
+    def test_page_cache_is_bounded_lru(self, scraper_no_rate_limit):
+        """
+        Given: A page cache of two entries
+        When: Three ETag-tagged pages are fetched, re-using the first in between
+        Then: The least recently used page is evicted
+        """
+        # Given
+        scraper_no_rate_limit.PAGE_CACHE_SIZE = 2
+
+        def tagged(url, timeout, headers):
+            response = Mock()
+            response.status_code = 200
+            response.headers = {"ETag": f'"{url}"'}
+            response.content = f"<html><body><h2>{url}</h2></body></html>".encode()
+            response.raise_for_status = Mock()
+            return response
+
+        scraper_no_rate_limit.session.get = Mock(side_effect=tagged)
+
+        # When
+        for url in ("https://a.test", "https://b.test", "https://a.test"):
+            scraper_no_rate_limit.fetch_page(url)
+        scraper_no_rate_limit.fetch_page("https://c.test")
+
+        # Then
+        assert list(scraper_no_rate_limit._page_cache) == [
+            "https://a.test",
+            "https://c.test",
+        ]
+
+    @patch("requests.Session.get")
+    def test_parse_cache_is_bounded(self, mock_get, scraper_no_rate_limit):
+        """
+        Given: A parse cache of two entries
+        When: Three distinct pages are fetched
+        Then: Only the two most recent parses are kept
+        """
+        # Given
+        scraper_no_rate_limit.PARSE_CACHE_SIZE = 2
+        pages = []
+        for i in range(3):
+            response = Mock()
+            response.content = f"<html><body><h2>{i}</h2></body></html>".encode()
+            response.raise_for_status = Mock()
+            pages.append(response)
+        mock_get.side_effect = pages
+
+        # When
+        for _ in pages:
+            scraper_no_rate_limit.fetch_page("https://example.com")
+
+        # Then
+        assert len(scraper_no_rate_limit._soup_cache) == 2
+
     def test_fetch_page_returns_none_on_failure(self, scraper_no_rate_limit):
         """
         Given: A URL that causes a connection error
@@ -716,6 +920,178 @@ class TestBaseScraperScrapeAllCards:
         assert cards == []
         assert scraper_no_rate_limit.stats["requests_failed"] == 2  # 2 URLs
 
+    @patch("requests.Session.get")
+    def test_scrape_all_cards_lxml_flag_without_hook_uses_soup(
+        self, mock_get, scraper_no_rate_limit, mock_html_with_cards
+    ):
+        """
+        Given: USE_LXML_LISTING set on a scraper without parse_card_listing_html
+        When: scrape_all_cards is called
+        Then: Listing pages are parsed through parse_card_listing as usual
+        """
+        # Given
+        mock_get.return_value = mock_html_with_cards
+        scraper_no_rate_limit.USE_LXML_LISTING = True
+
+        # When
+        cards = scraper_no_rate_limit.scrape_all_cards()
+
+        # Then
+        assert len(cards) == 6
+        assert not hasattr(scraper_no_rate_limit, "parse_card_listing_html")
+
+    @patch("requests.Session.get")
+    def test_scrape_all_cards_async_returns_list(
+        self, mock_get, scraper_no_rate_limit, mock_html_with_cards
+    ):
+        """
+        Given: A scraper with valid URLs
+        When: scrape_all_cards_async is awaited
+        Then: Should return the same cards as the blocking variant
+        """
+        # Given
+        mock_get.return_value = mock_html_with_cards
+
+        # When
+        cards = asyncio.run(scraper_no_rate_limit.scrape_all_cards_async())
+
+        # Then
+        assert isinstance(cards, list)
+        assert len(cards) == 6
+        assert scraper_no_rate_limit.stats["cards_scraped"] == 6
+
+    def test_class_xpath_matches_class_tokens_and_is_cached(self):
+        """
+        Given: Elements whose classes contain a target class as token or substring
+        When: class_xpath selects by that class
+        Then: Only whole-token matches are returned and the selector is reused
+        """
+        # Given
+        root = etree.fromstring(
+            '<div><div class="card big"><p class="card">a</p></div>'
+            '<div class="cardholder">b</div><div class="x card">c</div></div>'
+        )
+
+        # When
+        select = BaseScraper.class_xpath("div", "card")
+        first = BaseScraper.class_xpath("div", "card", first=True)
+        parent = BaseScraper.class_xpath("div", "card", axis="ancestor", first=True)
+
+        # Then
+        assert [e.text or e[0].text for e in select(root)] == ["a", "c"]
+        assert len(first(root)) == 1
+        assert parent(root.find(".//p")) == [root[0]]
+        assert BaseScraper.class_xpath("div", "card") is select
+
+    def test_parse_card_cached_parses_identical_markup_once(
+        self, scraper_no_rate_limit
+    ):
+        """
+        Given: The same card markup seen twice, plus markup that is not a card
+        When: _parse_card_cached is called for each
+        Then: Each distinct markup is parsed once and hits return copies
+        """
+        # Given
+        parse = Mock(return_value={"name": "Card", "scraped_at": "then"})
+        not_a_card = Mock(return_value=None)
+
+        # When
+        first = scraper_no_rate_limit._parse_card_cached("<div>a</div>", parse)
+        again = scraper_no_rate_limit._parse_card_cached("<div>a</div>", parse)
+        skipped = scraper_no_rate_limit._parse_card_cached("<p/>", not_a_card)
+        skipped_again = scraper_no_rate_limit._parse_card_cached("<p/>", not_a_card)
+
+        # Then
+        assert parse.call_count == 1
+        assert not_a_card.call_count == 1
+        assert again["name"] == "Card" and again is not first
+        assert again["scraped_at"] != "then"
+        assert skipped is None and skipped_again is None
+
+    def test_parse_card_cached_hits_do_not_share_nested_values(
+        self, scraper_no_rate_limit
+    ):
+        """
+        Given: A cached card with nested reward data
+        When: A caller mutates the nested values of a returned record
+        Then: Later hits and the cached entry are unaffected
+        """
+        # Given
+        parse = Mock(return_value={"name": "Card", "rewards": {"dining": [3]}})
+        first = scraper_no_rate_limit._parse_card_cached("<div>a</div>", parse)
+
+        # When
+        first["rewards"]["dining"].append(99)
+        again = scraper_no_rate_limit._parse_card_cached("<div>a</div>", parse)
+        again["rewards"]["travel"] = [2]
+        third = scraper_no_rate_limit._parse_card_cached("<div>a</div>", parse)
+
+        # Then
+        assert third["rewards"] == {"dining": [3]}
+
+    def test_scrape_all_cards_concurrent_keeps_listing_order(self):
+        """
+        Given: A scraper with several workers and pages that finish out of order
+        When: scrape_all_cards is called
+        Then: Cards come back in listing order and every request is counted
+        """
+        # Given
+        scraper = ConcreteScraper(rate_limit=0, max_workers=2)
+
+        def slow_first(url, timeout, headers):
+            if url.endswith("/cards"):
+                time.sleep(0.1)
+            response = Mock()
+            response.content = f"<html><body><h2>{url}</h2></body></html>".encode()
+            response.raise_for_status = Mock()
+            return response
+
+        scraper.session.get = Mock(side_effect=slow_first)
+
+        # When
+        cards = scraper.scrape_all_cards()
+
+        # Then
+        assert [c["name"] for c in cards] == [
+            "https://example.com/cards",
+            "https://example.com/cards2",
+        ]
+        assert scraper.stats["requests_made"] == 2
+        assert scraper.stats["cards_scraped"] == 2
+
+    @pytest.mark.parametrize(
+        "max_workers, expected_pool", [(None, [2]), (1, []), (3, [2])]
+    )
+    def test_scrape_all_cards_worker_count(
+        self, monkeypatch, mock_html_with_cards, max_workers, expected_pool
+    ):
+        """
+        Given: A scraper with two listing URLs
+        When: scrape_all_cards is called with the default or an explicit max_workers
+        Then: By default one worker per listing URL is used; max_workers=1 is serial
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from data_pipeline.scrapers import base_scraper
+
+        # Given
+        pools = []
+
+        def recording_pool(max_workers):
+            pools.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        monkeypatch.setattr(base_scraper, "ThreadPoolExecutor", recording_pool)
+        scraper = ConcreteScraper(rate_limit=0, max_workers=max_workers)
+        scraper.session.get = Mock(return_value=mock_html_with_cards)
+
+        # When
+        cards = scraper.scrape_all_cards()
+
+        # Then
+        assert len(cards) == 6
+        assert pools == expected_pool
+
 
 # =============================================================================
 # Context Manager Tests
@@ -12,6 +12,7 @@ Run with: pytest tests/test_issuer_scrapers.py -v
 """
 
 import pytest
+from unittest.mock import Mock
 from bs4 import BeautifulSoup
 
 import sys
@@ -24,9 +25,16 @@ from data_pipeline.scrapers.issuer_scrapers import (
     CitiScraper,
     CapitalOneScraper,
     DiscoverScraper,
+    _REWARD_SCANNER,
+    _has_body_text,
 )
 
 
+def _without_scraped_at(card):
+    """Card record minus its per-scrape timestamp, for parity checks."""
+    return {k: v for k, v in card.items() if k != "scraped_at"}
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -346,6 +354,22 @@ class TestChaseScraper:
         for card in cards:
             assert card.get("scraped_at") is not None
 
+    def test_parse_card_listing_shares_one_timestamp(self, chase_scraper, chase_html):
+        """
+        Given: Chase HTML with several cards
+        When: parse_card_listing is called
+        Then: All cards from the listing should carry the same scraped_at
+        """
+        # Given
+        soup = BeautifulSoup(chase_html, "lxml")
+
+        # When
+        cards = chase_scraper.parse_card_listing(soup)
+
+        # Then
+        assert len(cards) > 1
+        assert len({card["scraped_at"] for card in cards}) == 1
+
     def test_parse_card_listing_empty_html_returns_empty_list(self, chase_scraper):
         """
         Given: Empty HTML
@@ -361,6 +385,191 @@ class TestChaseScraper:
         # Then
         assert cards == []
 
+    def test_strained_parse_matches_full_parse(self, chase_scraper, chase_html):
+        """
+        Given: Chase listing HTML
+        When: It is parsed with the scraper's strainer
+        Then: parse_card_listing should return the same cards as a full parse
+        """
+        # Given
+        full = BeautifulSoup(chase_html, "lxml")
+        strained = BeautifulSoup(
+            chase_html, "lxml", parse_only=chase_scraper.get_strainer()
+        )
+
+        # When
+        expected = chase_scraper.parse_card_listing(full)
+        cards = chase_scraper.parse_card_listing(strained)
+
+        # Then
+        assert [_without_scraped_at(c) for c in cards] == [
+            _without_scraped_at(c) for c in expected
+        ]
+        assert strained.find("div", class_="cardsummarylist") is None
+
+    def test_extract_reward_rates_single_pass(self, chase_scraper):
+        """
+        Given: Text mixing cash back and points phrases back to back
+        When: _extract_reward_rates is called
+        Then: Every phrase should yield its category, points winning ties
+        """
+        # Given
+        text = (
+            "5% back on groceries 2% back on gas. Earn 3X points on dining "
+            "and 2X on travel. 1.5% cash back on travel."
+        )
+
+        # When
+        rates = chase_scraper._extract_reward_rates(text)
+
+        # Then
+        assert rates == {
+            "groceries": {"rate": 5, "type": "cashback"},
+            "gas": {"rate": 2, "type": "cashback"},
+            "travel": {"rate": 2, "type": "points"},
+            "dining": {"rate": 3, "type": "points"},
+        }
+
+    def test_extract_reward_rates_linear_on_long_digit_runs(self, chase_scraper):
+        """
+        Given: Scraped text containing a very long run of digits
+        When: _extract_reward_rates is called
+        Then: Matches only start at the beginning of a digit run, and the
+              real rates are still found
+        """
+        # Given
+        text = "1" * 20000 + " filler. 3X points on dining. 2.5" + "0" * 20000
+
+        # When
+        rates = chase_scraper._extract_reward_rates(text)
+
+        # Then
+        assert rates == {"dining": {"rate": 3, "type": "points"}}
+        # the lookbehind rejects every start inside a run, so a run is
+        # scanned from its first digit only
+        phrase = "123X points on dining."
+        assert _REWARD_SCANNER.match(phrase).group("mult") == "123"
+        assert _REWARD_SCANNER.match(phrase, 1) is None
+        assert _REWARD_SCANNER.match(phrase, 2) is None
+
+    def test_collect_texts_matches_get_text(self, chase_scraper, chase_html):
+        """
+        Given: A parsed Chase card container
+        When: _collect_texts walks it
+        Then: Section texts should equal get_text() of the matching divs
+        """
+        # Given
+        soup = BeautifulSoup(chase_html, "lxml")
+        container = soup.find("div", class_="cmp-cardsummary__inner-container")
+        fee_class = "cmp-cardsummary__inner-container--annual-fee"
+
+        # When
+        texts, tags = chase_scraper._collect_texts(container)
+
+        # Then
+        assert "".join(texts[""]) == container.get_text()
+        assert tags[fee_class] is container.find("div", class_=fee_class)
+        assert "".join(texts[fee_class]) == tags[fee_class].get_text()
+        assert tags["a"] is container.find("a", href=True)
+
+    def test_parse_card_listing_html_matches_soup_parse(
+        self, chase_scraper, chase_html
+    ):
+        """
+        Given: Chase listing HTML
+        When: parse_card_listing_html is called on the HTML source
+        Then: It should return the same cards as the BeautifulSoup path
+        """
+        # Given
+        soup = BeautifulSoup(chase_html, "lxml")
+
+        # When
+        expected = chase_scraper.parse_card_listing(soup)
+        cards = chase_scraper.parse_card_listing_html(chase_html)
+
+        # Then
+        assert len(cards) > 0
+        assert [_without_scraped_at(c) for c in cards] == [
+            _without_scraped_at(c) for c in expected
+        ]
+
+    def test_parse_card_listing_html_skips_script_text(self, chase_scraper):
+        """
+        Given: A fee div with an inline script mentioning another price
+        When: Both the lxml and BeautifulSoup paths parse the listing
+        Then: Script text is ignored and both read the visible fee
+        """
+        # Given
+        html = """
+        <html><body>
+            <div class="cmp-cardsummary__inner-container">
+                <div class="cmp-cardsummary__inner-container__title">
+                    <h2>Chase Sapphire Preferred</h2>
+                </div>
+                <div class="cmp-cardsummary__inner-container--annual-fee">
+                    <script>var a="$999";</script> $95
+                </div>
+            </div>
+        </body></html>
+        """
+
+        # When
+        expected = chase_scraper.parse_card_listing(BeautifulSoup(html, "lxml"))
+        cards = chase_scraper.parse_card_listing_html(html)
+
+        # Then
+        assert [c["annual_fee"] for c in cards] == [95]
+        assert [_without_scraped_at(c) for c in cards] == [
+            _without_scraped_at(c) for c in expected
+        ]
+
+    def test_parse_card_listing_html_empty_returns_empty_list(self, chase_scraper):
+        """
+        Given: An empty page
+        When: parse_card_listing_html is called
+        Then: Should return empty list
+        """
+        assert chase_scraper.parse_card_listing_html("") == []
+
+    def test_scrape_all_cards_uses_lxml_listing(self, chase_scraper, chase_html):
+        """
+        Given: ChaseScraper with USE_LXML_LISTING enabled
+        When: scrape_all_cards is called
+        Then: Listing pages should be parsed from raw HTML, not via fetch_page
+        """
+        # Given
+        chase_scraper.fetch_html = Mock(return_value=chase_html)
+        chase_scraper.fetch_page = Mock()
+
+        # When
+        cards = chase_scraper.scrape_all_cards()
+
+        # Then
+        assert len(cards) > 0
+        chase_scraper.fetch_page.assert_not_called()
+
+    def test_scrape_all_cards_handles_xml_declared_page(
+        self, chase_scraper, chase_html
+    ):
+        """
+        Given: A listing page that starts with an XML encoding declaration
+        When: scrape_all_cards is called on the lxml path
+        Then: The same cards as without the declaration are returned
+        """
+        # Given
+        html = '<?xml version="1.0" encoding="utf-8"?>\n' + chase_html.strip()
+        chase_scraper.fetch_html = Mock(return_value=html)
+
+        # When
+        cards = chase_scraper.scrape_all_cards()
+
+        # Then
+        expected = chase_scraper.parse_card_listing(BeautifulSoup(chase_html, "lxml"))
+        assert len(cards) == 2
+        assert [_without_scraped_at(c) for c in cards] == [
+            _without_scraped_at(c) for c in expected
+        ]
+
 
 # =============================================================================
 # DiscoverScraper Tests
@@ -486,6 +695,65 @@ class TestDiscoverScraper:
         assert "™" not in normalized
         assert "discover it cash back" == normalized
 
+    def test_normalize_name_drops_non_ascii_and_collapses_whitespace(
+        self, discover_scraper
+    ):
+        """
+        Given: A name with accents, punctuation and mixed whitespace
+        When: _normalize_name is called
+        Then: Only ASCII letters, digits and single spaces should remain
+        """
+        # Given
+        name = "  Café\u00a0Card © - NHL®\tDiscover it®\n"
+
+        # When
+        normalized = discover_scraper._normalize_name(name)
+
+        # Then
+        assert normalized == "caf card nhl discover it"
+
+    def test_repeated_listing_reuses_parsed_cards(
+        self, discover_scraper, discover_html
+    ):
+        """
+        Given: A Discover listing page that was already parsed once
+        When: parse_card_listing is called on it again
+        Then: Cards should be served from the card cache, not re-parsed
+        """
+        # Given
+        soup = BeautifulSoup(discover_html, "lxml")
+        first = discover_scraper.parse_card_listing(soup)
+        discover_scraper._parse_discover_card = Mock()
+
+        # When
+        second = discover_scraper.parse_card_listing(soup)
+
+        # Then
+        discover_scraper._parse_discover_card.assert_not_called()
+        assert [c["name"] for c in second] == [c["name"] for c in first]
+        assert second[0] is not first[0]
+
+    def test_strained_parse_matches_full_parse(self, discover_scraper, discover_html):
+        """
+        Given: Discover listing HTML
+        When: It is parsed with the scraper's strainer
+        Then: parse_card_listing should return the same cards as a full parse
+        """
+        # Given
+        full = BeautifulSoup(discover_html, "lxml")
+        strained = BeautifulSoup(
+            discover_html, "lxml", parse_only=discover_scraper.get_strainer()
+        )
+
+        # When
+        expected = discover_scraper.parse_card_listing(full)
+        cards = discover_scraper.parse_card_listing(strained)
+
+        # Then
+        assert [_without_scraped_at(c) for c in cards] == [
+            _without_scraped_at(c) for c in expected
+        ]
+
 
 # =============================================================================
 # TODO Scraper Tests (Skipped)
@@ -547,6 +815,25 @@ class TestAmexScraper:
         # Then
         assert cards == []
 
+    def test_has_body_text_matches_get_text_threshold(self):
+        """
+        Given: Bodies with just under, exactly at, and no visible text
+        When: _has_body_text checks them against 500 characters
+        Then: The result should match len(body.get_text(strip=True)) >= 500
+        """
+        # Given
+        short = BeautifulSoup(
+            f"<body><p> {'a' * 250} </p><p>{'b' * 249}</p></body>", "lxml"
+        )
+        enough = BeautifulSoup(f"<body><p>{'a' * 250}</p>{'b' * 250}</body>", "lxml")
+        no_body = BeautifulSoup("", "lxml")
+
+        # When / Then
+        assert len(short.body.get_text(strip=True)) == 499
+        assert not _has_body_text(short, 500)
+        assert _has_body_text(enough, 500)
+        assert not _has_body_text(no_body, 500)
+
 
 class TestCitiScraper:
     """Tests for CitiScraper (TODO: Needs Selenium)."""
@@ -162,3 +162,131 @@ def test_clean_transaction_data_invalid_dates():
     assert report["invalid_dates"] == 1
     assert report["dates_removed"] == 1
     assert len(cleaned) == 1
+
+
+def test_clean_credit_card_data_imputes_reward_rates():
+    data = [
+        {"card_id": "1", "reward_rates": None},
+        {"card_id": "2", "reward_rates": {"dining": 3.0}},
+        {"card_id": "3", "reward_rates": None},
+    ]
+    cleaned, report = clean_credit_card_data(pd.DataFrame(data))
+    assert report["missing_reward_rates"] == 2
+    assert cleaned["reward_rates"].tolist() == [
+        {"universal_base_rate": 1.0},
+        {"dining": 3.0},
+        {"universal_base_rate": 1.0},
+    ]
+    # imputed rows do not share one mutable dict
+    assert cleaned["reward_rates"][0] is not cleaned["reward_rates"][2]
+
+
+def test_clean_transaction_data_suspicious_flag_follows_filters():
+    data = [
+        {"transaction_id": "t1", "date": "2025-08-01", "amount": -20000},
+        {"transaction_id": "t2", "date": "notadate", "amount": 50000},
+        {"transaction_id": "t3", "date": "2025-08-01", "amount": 12000},
+        {"transaction_id": "t4", "date": "2025-08-01", "amount": "7.5"},
+    ]
+    cleaned, report = clean_transaction_data(pd.DataFrame(data))
+    assert cleaned["transaction_id"].tolist() == ["t3", "t4"]
+    assert cleaned["suspicious"].tolist() == [True, False]
+    assert report["suspicious_high_amounts"] == 1
+    assert cleaned.columns[-1] == "suspicious"
+
+
+def test_clean_transaction_data_fills_missing_categorical_category():
+    df = pd.DataFrame(
+        {
+            "transaction_id": ["t1", "t2"],
+            "date": ["2025-08-01", "2025-08-02"],
+            "amount": [10.0, 20.0],
+            "category": pd.Categorical(["dining", None], categories=["dining"]),
+        }
+    )
+    cleaned, report = clean_transaction_data(df)
+    assert cleaned["category"].tolist() == ["dining", "unknown"]
+    assert isinstance(cleaned["category"].dtype, pd.CategoricalDtype)
+    assert report["missing_categories"] == 1
+    assert df["category"].isna().sum() == 1
+
+
+def test_clean_transaction_data_accepts_generator_output():
+    from src.data_pipeline.generators.transaction_generator import (
+        TransactionGenerator,
+    )
+    from src.data_pipeline.generators.user_profile_generator import (
+        UserProfileGenerator,
+    )
+
+    profiles = UserProfileGenerator(num_users=3, seed=7).generate()
+    txns = TransactionGenerator(seed=7, history_months=2).generate(profiles)
+    # a reindexed/concatenated batch can leave gaps in the Categorical
+    txns.loc[txns.index[0], "category"] = None
+
+    cleaned, report = clean_transaction_data(txns)
+    assert report["missing_categories"] == 1
+    assert "unknown" in cleaned["category"].tolist()
+    assert cleaned["category"].notna().all()
+
+
+def test_cleaning_does_not_modify_input():
+    cards = pd.DataFrame(
+        {
+            "issuer": ["amex", "chase_bank"],
+            "annual_fee": ["95", "-1"],
+            "reward_rates": [None, {"dining": 3.0}],
+        },
+        index=[10, 10],
+    )
+    cards_before = cards.copy()
+    cleaned_cards, _ = clean_credit_card_data(cards)
+    pd.testing.assert_frame_equal(cards, cards_before)
+    assert cleaned_cards.index.equals(pd.RangeIndex(1))
+    assert cleaned_cards["issuer"].tolist() == ["AMEX"]
+    assert cleaned_cards["annual_fee"].tolist() == [95]
+
+    txns = pd.DataFrame(
+        {"date": ["2025-08-01", "2025-08-02"], "amount": ["5", "-5"], "category": None}
+    )
+    txns_before = txns.copy()
+    cleaned_txns, _ = clean_transaction_data(txns)
+    pd.testing.assert_frame_equal(txns, txns_before)
+    assert "suspicious" not in txns.columns
+    assert cleaned_txns["amount"].tolist() == [5]
+    assert cleaned_txns["category"].tolist() == ["unknown"]
+
+
+def test_clean_credit_card_data_issuer_uses_string_dtype():
+    df = pd.DataFrame({"issuer": [" amex_bank", None], "annual_fee": [0, 95]})
+    cleaned, _ = clean_credit_card_data(df)
+    assert isinstance(cleaned["issuer"].dtype, pd.StringDtype)
+    assert cleaned["issuer"][0] == "AMEX BANK"
+    assert cleaned["issuer"].isna()[1]
+
+
+def test_clean_credit_card_data_issuer_counts_before_fee_filter():
+    data = [
+        {"card_id": "1", "issuer": "amex", "annual_fee": 0},
+        {"card_id": "2", "issuer": "AMEX ", "annual_fee": 95},
+        {"card_id": "3", "issuer": "chase", "annual_fee": 5000},
+        {"card_id": "3", "issuer": "citi", "annual_fee": 0},
+    ]
+    cleaned, report = clean_credit_card_data(pd.DataFrame(data))
+    # "citi" is a duplicate card_id; "CHASE" still counts before the fee check
+    assert report["unique_issuers"] == 2
+    assert cleaned["issuer"].tolist() == ["AMEX", "AMEX"]
+
+
+def test_issuer_normalization_is_memoized():
+    from src.data_pipeline.preprocessing.cleaning import _normalize_issuer
+
+    _normalize_issuer.cache_clear()
+    df = pd.DataFrame({"issuer": ["amex_bank", "amex_bank", " chase", 7, None]})
+    cleaned, report = clean_credit_card_data(df)
+    assert cleaned["issuer"].tolist()[:4] == ["AMEX BANK", "AMEX BANK", "CHASE", "7"]
+    assert report["unique_issuers"] == 3
+    # one call per distinct raw value, and none on a repeat run
+    assert _normalize_issuer.cache_info().misses == 3
+    clean_credit_card_data(df)
+    assert _normalize_issuer.cache_info().misses == 3
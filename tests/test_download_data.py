@@ -1,6 +1,8 @@
+import hashlib
 import importlib.util
 import json
 import sys
+import threading
 import types
 from pathlib import Path
 
@@ -26,6 +28,7 @@ def _args(
     sources: str,
     out_dir: str = "data/processed",
     issuers: str = "",
+    per_issuer_files: bool = False,
     include_raw: bool = False,
     nerdwallet_selenium: bool = False,
     manifest_name: str = "manifest_latest.json",
@@ -41,6 +44,7 @@ def _args(
     return types.SimpleNamespace(
         sources=sources,
         issuers=issuers,
+        per_issuer_files=per_issuer_files,
         nerdwallet_selenium=nerdwallet_selenium,
         out_dir=out_dir,
         manifest_name=manifest_name,
@@ -71,14 +75,14 @@ def test_failure_does_not_overwrite_current(tmp_path, monkeypatch, mod):
     mod.__file__ = str(scripts / "download_data.py")
 
     # API ok, issuers fail -> should NOT commit
-    def ok_api(stage_dir, logger, include_raw=False):
+    def ok_api(stage_dir, logger, include_raw=False, fetched_at=None):
         out = stage_dir / "offers"
         out.mkdir(parents=True, exist_ok=True)
         p = out / "creditcardbonuses_offers.json"
         mod.atomic_write_json(p, {"offers": [{"x": 1}]})
-        return [{"x": 1}], 1, [p]
+        return 1, [p]
 
-    def fail_issuers(stage_dir, logger, issuers=None):
+    def fail_issuers(stage_dir, logger, issuers=None, **_):
         raise RuntimeError("boom")
 
     monkeypatch.setattr(mod, "run_creditcardbonuses_api", ok_api)
@@ -99,23 +103,27 @@ def test_success_writes_manifest_including_synthetic(tmp_path, monkeypatch, mod)
     mod.__file__ = str(repo / "scripts" / "download_data.py")
 
     # Stub API
-    def ok_api(stage_dir, logger, include_raw=False):
+    def ok_api(stage_dir, logger, include_raw=False, fetched_at=None):
         out = stage_dir / "offers"
         out.mkdir(parents=True, exist_ok=True)
         p = out / "creditcardbonuses_offers.json"
-        mod.atomic_write_json(p, {"offers": [{"x": 1}, {"x": 2}]})
-        return [{"x": 1}, {"x": 2}], 2, [p]
+        mod.atomic_write_json(
+            p, {"fetched_at": fetched_at, "offers": [{"x": 1}, {"x": 2}]}
+        )
+        return 2, [p]
 
     # Stub issuers
-    def ok_issuers(stage_dir, logger, issuers=None):
+    def ok_issuers(stage_dir, logger, issuers=None, **_):
         out = stage_dir / "offers"
         out.mkdir(parents=True, exist_ok=True)
-        p = out / "issuer_chase_offers.json"
+        p = out / "issuer_offers.json"
         mod.atomic_write_json(p, {"offers": [{"y": 1}]})
-        return [{"y": 1}], 1, [p]
+        return 1, [p]
 
     # Stub synthetic generators
-    def ok_synth(stage_dir, logger, num_users, history_months, seed, fmt="csv"):
+    def ok_synth(
+        stage_dir, logger, num_users, history_months, seed, fmt="csv", fetched_at=None
+    ):
         out = stage_dir / "synthetic"
         out.mkdir(parents=True, exist_ok=True)
 
@@ -142,9 +150,8 @@ def test_success_writes_manifest_including_synthetic(tmp_path, monkeypatch, mod)
             },
         )
 
-        preview = [{"user_id": "u1"}]
         total_records = 3
-        return preview, total_records, [p1, p2, p3, p4]
+        return total_records, [p1, p2, p3, p4]
 
     monkeypatch.setattr(mod, "run_creditcardbonuses_api", ok_api)
     monkeypatch.setattr(mod, "run_issuer_scrapers", ok_issuers)
@@ -179,8 +186,346 @@ def test_success_writes_manifest_including_synthetic(tmp_path, monkeypatch, mod)
     # Files recorded in manifest
     paths = [f["path"] for f in m["files"]]
     assert "offers/creditcardbonuses_offers.json" in paths
-    assert "offers/issuer_chase_offers.json" in paths
+    assert "offers/issuer_offers.json" in paths
     assert "synthetic/user_profiles.csv" in paths
     assert "synthetic/user_cards.csv" in paths
     assert "synthetic/transactions.csv" in paths
     assert "synthetic/synthetic_meta.json" in paths
+
+    # Every payload carries the single run timestamp
+    api_payload = json.loads(
+        (current / "offers" / "creditcardbonuses_offers.json").read_text()
+    )
+    assert api_payload["fetched_at"] == m["started_at"]
+
+
+def test_make_manifest_hashes_every_file(tmp_path, mod):
+    (tmp_path / "a").mkdir()
+    payloads = {"a/x.json": b"{}", "b.csv": b"x" * (3 * 1024 * 1024 + 7)}
+    for rel, data in payloads.items():
+        (tmp_path / rel).write_bytes(data)
+
+    m = mod.make_manifest("rid", "s", "f", [], tmp_path)
+
+    assert [f["path"] for f in m["files"]] == ["a/x.json", "b.csv"]
+    for f in m["files"]:
+        data = payloads[f["path"]]
+        assert f["bytes"] == len(data)
+        assert f["sha256"] == hashlib.sha256(data).hexdigest()
+
+
+def test_atomic_write_fsyncs_parent_dir(tmp_path, monkeypatch, mod):
+    synced = []
+    real_fsync_dir = mod._fsync_dir
+    monkeypatch.setattr(
+        mod, "_fsync_dir", lambda p: (synced.append(p), real_fsync_dir(p))
+    )
+
+    dest = tmp_path / "out" / "x.json"
+    mod.atomic_write_json(dest, {"a": 1})
+
+    assert json.loads(dest.read_text()) == {"a": 1}
+    assert synced == [dest.parent]
+
+
+def test_streaming_writer_matches_json_payload(tmp_path, mod):
+    dest = tmp_path / "offers" / "all.json"
+    with mod.StreamingJsonArrayWriter(dest, {"source": "s", "n": 1}) as w:
+        w.extend([{"a": 1}, {"a": "é"}])
+        w.extend([])
+        w.extend([{"a": 3}])
+
+    assert w.count == 3
+    assert json.loads(dest.read_text(encoding="utf-8")) == {
+        "source": "s",
+        "n": 1,
+        "offers": [{"a": 1}, {"a": "é"}, {"a": 3}],
+    }
+
+
+def test_streaming_writer_discards_partial_file_on_error(tmp_path, mod):
+    dest = tmp_path / "all.json"
+    with pytest.raises(RuntimeError):
+        with mod.StreamingJsonArrayWriter(dest, {}) as w:
+            w.extend([{"a": 1}])
+            raise RuntimeError("scrape failed")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_issuer_scrapers_write_one_combined_file(tmp_path, monkeypatch, mod):
+    import logging
+
+    from src.data_pipeline.scrapers import issuer_scrapers
+
+    def fake_scraper(issuer):
+        class _S:
+            def scrape_all_cards(self):
+                return [{"issuer": issuer, "i": i} for i in range(2)]
+
+        return _S
+
+    monkeypatch.setattr(issuer_scrapers, "ChaseScraper", fake_scraper("chase"))
+    monkeypatch.setattr(issuer_scrapers, "AmexScraper", fake_scraper("amex"))
+
+    n, files = mod.run_issuer_scrapers(
+        tmp_path, logging.getLogger("t"), issuers=["chase", "amex"], fetched_at="T"
+    )
+
+    assert n == 4
+    assert files == [tmp_path / "offers" / "issuer_offers.json"]
+    payload = json.loads(files[0].read_text())
+    assert payload["fetched_at"] == "T"
+    assert payload["issuers"] == ["chase", "amex"]
+    assert [o["issuer"] for o in payload["offers"]] == ["chase"] * 2 + ["amex"] * 2
+
+    _, files = mod.run_issuer_scrapers(
+        tmp_path, logging.getLogger("t"), issuers=["amex"], per_issuer_files=True
+    )
+    assert [f.name for f in files] == ["issuer_offers.json", "issuer_amex_offers.json"]
+
+
+def test_commit_moves_stage_into_current(tmp_path, mod):
+    import logging
+
+    processed = tmp_path / "processed"
+    (processed / "current").mkdir(parents=True)
+    (processed / "current" / "old.txt").write_text("old")
+    stage = tmp_path / ".staging" / "run_x"
+    stage.mkdir(parents=True)
+    (stage / "new.txt").write_text("new")
+
+    mod.commit_stage_to_processed(stage, processed, logging.getLogger("t"))
+
+    assert not stage.exists()
+    assert (processed / "current" / "new.txt").read_text() == "new"
+    assert not (processed / "current" / "old.txt").exists()
+    assert [p.name for p in processed.iterdir()] == ["current"]
+
+
+def test_commit_fsyncs_stage_written_without_fsync(tmp_path, monkeypatch, mod):
+    import logging
+
+    fsynced = []
+    real_fsync = mod.os.fsync
+    monkeypatch.setattr(
+        mod.os, "fsync", lambda fd: (fsynced.append(fd), real_fsync(fd))
+    )
+    synced_files = []
+    real_fsync_file = mod._fsync_file
+    monkeypatch.setattr(
+        mod, "_fsync_file", lambda p: (synced_files.append(p), real_fsync_file(p))
+    )
+
+    stage = tmp_path / ".staging" / "run_x"
+    mod.atomic_write_json(stage / "offers" / "a.json", {"a": 1}, durable=False)
+    assert fsynced == []
+
+    processed = tmp_path / "processed"
+    mod.commit_stage_to_processed(stage, processed, logging.getLogger("t"))
+
+    assert [Path(p).name for p in synced_files] == ["a.json"]
+    assert (processed / "current" / "offers" / "a.json").exists()
+
+
+def test_commit_copies_stage_across_filesystems(tmp_path, monkeypatch, mod):
+    import errno
+    import logging
+
+    processed = tmp_path / "processed"
+    (processed / "current").mkdir(parents=True)
+    (processed / "current" / "old.txt").write_text("old")
+    stage = tmp_path / ".staging" / "run_x"
+    (stage / "offers").mkdir(parents=True)
+    (stage / "offers" / "new.json").write_text("{}")
+
+    real_replace = mod.os.replace
+
+    def cross_device_replace(src, dst):
+        if str(src) == str(stage):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(mod.os, "replace", cross_device_replace)
+
+    mod.commit_stage_to_processed(stage, processed, logging.getLogger("t"))
+
+    assert not stage.exists()
+    assert (processed / "current" / "offers" / "new.json").read_text() == "{}"
+    assert [p.name for p in processed.iterdir()] == ["current"]
+
+
+def test_commit_restores_current_when_rename_fails(tmp_path, monkeypatch, mod):
+    import logging
+
+    processed = tmp_path / "processed"
+    (processed / "current").mkdir(parents=True)
+    (processed / "current" / "old.txt").write_text("old")
+    stage = tmp_path / ".staging" / "run_x"
+    stage.mkdir(parents=True)
+
+    real_replace = mod.os.replace
+
+    def flaky_replace(src, dst):
+        if str(src) == str(stage):
+            raise OSError("rename failed")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(mod.os, "replace", flaky_replace)
+
+    with pytest.raises(OSError):
+        mod.commit_stage_to_processed(stage, processed, logging.getLogger("t"))
+
+    assert (processed / "current" / "old.txt").read_text() == "old"
+    assert stage.exists()
+
+
+def test_manifest_reuses_digests_of_written_files(tmp_path, monkeypatch, mod):
+    mod.atomic_write_json(tmp_path / "a.json", {"a": 1})
+    (tmp_path / "external.txt").write_bytes(b"x")
+    hashed = []
+    real_sha256_file = mod.sha256_file
+    monkeypatch.setattr(
+        mod, "sha256_file", lambda p: (hashed.append(p), real_sha256_file(p))[1]
+    )
+
+    m = mod.make_manifest("rid", "s", "f", [], tmp_path)
+
+    assert [Path(p).name for p in hashed] == ["external.txt"]
+    digests = {f["path"]: f["sha256"] for f in m["files"]}
+    assert (
+        digests["a.json"]
+        == hashlib.sha256((tmp_path / "a.json").read_bytes()).hexdigest()
+    )
+
+
+def test_rerun_hardlinks_unchanged_outputs(tmp_path, monkeypatch, mod):
+    repo = tmp_path
+    (repo / "scripts").mkdir()
+    mod.__file__ = str(repo / "scripts" / "download_data.py")
+
+    def ok_api(stage_dir, logger, include_raw=False, fetched_at=None):
+        p = stage_dir / "offers" / "creditcardbonuses_offers.json"
+        mod.atomic_write_json(p, {"offers": [{"x": 1}]})
+        return 1, [p]
+
+    linked = []
+    real_link = mod._link_into_place
+
+    def spy_link(src, dest, **kwargs):
+        linked.append(dest.name)
+        return real_link(src, dest, **kwargs)
+
+    monkeypatch.setattr(mod, "_link_into_place", spy_link)
+    monkeypatch.setattr(mod, "run_creditcardbonuses_api", ok_api)
+    monkeypatch.setattr(mod, "parse_args", lambda: _args(sources="api"))
+
+    assert mod.main() == 0
+    assert linked == []
+    assert mod.main() == 0
+    assert linked == ["creditcardbonuses_offers.json"]
+
+    current = repo / "data" / "processed" / "current"
+    m = json.loads((current / "manifest_latest.json").read_text())
+    out = current / "offers" / "creditcardbonuses_offers.json"
+    assert json.loads(out.read_text()) == {"offers": [{"x": 1}]}
+    assert m["files"][0]["sha256"] == hashlib.sha256(out.read_bytes()).hexdigest()
+
+
+def test_rerun_rewrites_output_edited_in_place(tmp_path, monkeypatch, mod):
+    repo = tmp_path
+    (repo / "scripts").mkdir()
+    mod.__file__ = str(repo / "scripts" / "download_data.py")
+
+    def ok_api(stage_dir, logger, include_raw=False, fetched_at=None):
+        p = stage_dir / "offers" / "creditcardbonuses_offers.json"
+        mod.atomic_write_json(p, {"offers": [{"x": 1}]})
+        return 1, [p]
+
+    linked = []
+    real_link = mod._link_into_place
+
+    def spy_link(src, dest, **kwargs):
+        linked.append(dest.name)
+        return real_link(src, dest, **kwargs)
+
+    monkeypatch.setattr(mod, "_link_into_place", spy_link)
+    monkeypatch.setattr(mod, "run_creditcardbonuses_api", ok_api)
+    monkeypatch.setattr(mod, "parse_args", lambda: _args(sources="api"))
+
+    assert mod.main() == 0
+    current = repo / "data" / "processed" / "current"
+    out = current / "offers" / "creditcardbonuses_offers.json"
+    # Same size, different content, written in place (same inode)
+    original = out.read_bytes()
+    with open(out, "r+b") as f:
+        f.write(original.replace(b"1", b"2"))
+    assert out.stat().st_size == len(original)
+
+    assert mod.main() == 0
+
+    assert linked == []
+    m = json.loads((current / "manifest_latest.json").read_text())
+    assert json.loads(out.read_text()) == {"offers": [{"x": 1}]}
+    assert m["files"][0]["sha256"] == hashlib.sha256(out.read_bytes()).hexdigest()
+
+
+def test_network_sources_run_concurrently(tmp_path, monkeypatch, mod):
+    repo = tmp_path
+    (repo / "scripts").mkdir()
+    mod.__file__ = str(repo / "scripts" / "download_data.py")
+
+    # Both stubs block until the other has started; a serial orchestrator
+    # would time out on the barrier and report both sources as failed.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def ok_api(stage_dir, logger, include_raw=False, fetched_at=None):
+        barrier.wait()
+        out = stage_dir / "offers"
+        out.mkdir(parents=True, exist_ok=True)
+        p = out / "creditcardbonuses_offers.json"
+        mod.atomic_write_json(p, {"offers": []})
+        return 0, [p]
+
+    def ok_nerdwallet(stage_dir, logger, use_selenium=False, fetched_at=None):
+        barrier.wait()
+        out = stage_dir / "offers"
+        out.mkdir(parents=True, exist_ok=True)
+        p = out / "nerdwallet_offers.json"
+        mod.atomic_write_json(p, {"offers": []})
+        return 0, [p]
+
+    monkeypatch.setattr(mod, "run_creditcardbonuses_api", ok_api)
+    monkeypatch.setattr(mod, "run_nerdwallet_scraper", ok_nerdwallet)
+    monkeypatch.setattr(mod, "parse_args", lambda: _args(sources="nerdwallet,api"))
+
+    assert mod.main() == 0
+
+    manifest = repo / "data" / "processed" / "current" / "manifest_latest.json"
+    m = json.loads(manifest.read_text())
+    # Sources are reported in orchestrator order, not completion order.
+    assert [s["name"] for s in m["sources"]] == [
+        "api:creditcardbonuses",
+        "scrape:nerdwallet",
+    ]
+
+
+def test_fail_fast_skips_synthetic(tmp_path, monkeypatch, mod):
+    repo = tmp_path
+    (repo / "scripts").mkdir()
+    mod.__file__ = str(repo / "scripts" / "download_data.py")
+
+    def fail_api(stage_dir, logger, include_raw=False, fetched_at=None):
+        raise RuntimeError("boom")
+
+    def never_synth(*args, **kwargs):
+        raise AssertionError("synthetic should not run after a fail-fast abort")
+
+    monkeypatch.setattr(mod, "run_creditcardbonuses_api", fail_api)
+    monkeypatch.setattr(mod, "run_synthetic_generators", never_synth)
+    monkeypatch.setattr(
+        mod, "parse_args", lambda: _args(sources="api,synthetic", fail_fast=True)
+    )
+
+    assert mod.main() == 2
+    assert not (repo / "data" / "processed" / "current").exists()
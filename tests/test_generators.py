@@ -19,15 +19,24 @@ import pandas as pd
 import pytest
 
 from src.data_pipeline.generators.config import (
+    ARCHETYPE_INDEX,
+    ARCHETYPE_WEIGHTS,
+    CARD_PORTFOLIO_TEMPLATES,
+    CATEGORY_INDEX,
     DEFAULT_HISTORY_MONTHS,
     DEFAULT_NUM_USERS,
     DEFAULT_SEED,
     MIN_TRANSACTION_AMOUNT,
     REDEMPTION_PREFERENCES,
+    SEASONAL_MULTIPLIERS,
+    SEASONAL_TABLE,
     SPENDING_ARCHETYPES,
     SPENDING_CATEGORIES,
 )
-from src.data_pipeline.generators.transaction_generator import TransactionGenerator
+from src.data_pipeline.generators.transaction_generator import (
+    TransactionGenerator,
+    _transaction_ids,
+)
 from src.data_pipeline.generators.user_profile_generator import UserProfileGenerator
 
 
@@ -130,6 +139,14 @@ class TestUserProfileSchema:
         valid_locs = {"urban", "suburban", "rural"}
         assert set(profiles["location_type"].unique()).issubset(valid_locs)
 
+    def test_low_cardinality_columns_are_categorical(self, profiles):
+        for col in ("archetype", "redemption_preference", "age_group", "location_type"):
+            assert isinstance(profiles[col].dtype, pd.CategoricalDtype)
+            assert profiles[col].notna().all()
+        assert list(profiles["redemption_preference"].cat.categories) == (
+            REDEMPTION_PREFERENCES
+        )
+
 
 # =====================================================================
 # UserProfileGenerator — Count & Diversity
@@ -166,6 +183,30 @@ class TestUserProfileDiversity:
             lo, hi = arch_map[row["archetype"]].monthly_budget_range
             assert lo <= row["monthly_budget"] <= hi
 
+    def test_age_and_location_follow_archetype_affinities(self):
+        from src.data_pipeline.generators.user_profile_generator import (
+            _AGE_AFFINITIES,
+            _LOCATION_AFFINITIES,
+        )
+
+        df = UserProfileGenerator(num_users=2000, seed=3).generate()
+        for arch, group in df.groupby("archetype", observed=True):
+            assert set(group["age_group"]) <= set(_AGE_AFFINITIES[arch])
+            assert set(group["location_type"]) <= set(_LOCATION_AFFINITIES[arch])
+
+        families = df[df["archetype"] == "suburban_family"]
+        share = (families["location_type"] == "suburban").mean()
+        assert 0.6 < share < 0.9  # configured weight is 0.75
+
+    def test_cards_come_from_archetype_templates(self, profiles):
+        from src.data_pipeline.generators.user_profile_generator import (
+            _CARD_AFFINITIES,
+        )
+
+        for arch, cards in zip(profiles["archetype"], profiles["cards"]):
+            allowed = [CARD_PORTFOLIO_TEMPLATES[t] for t in _CARD_AFFINITIES[arch]]
+            assert cards in allowed
+
 
 # =====================================================================
 # UserProfileGenerator — Reproducibility
@@ -180,6 +221,32 @@ class TestUserProfileReproducibility:
         g2 = UserProfileGenerator(num_users=20, seed=42)
         pd.testing.assert_frame_equal(g1.generate(), g2.generate())
 
+    def test_from_rng_matches_seeded_constructor(self):
+        seeded = UserProfileGenerator(num_users=20, seed=42).generate()
+        shared = UserProfileGenerator.from_rng(20, np.random.default_rng(42))
+        pd.testing.assert_frame_equal(shared.generate(), seeded)
+        assert shared.seed is None
+
+    def test_cohorts_are_independent_and_worker_invariant(self):
+        serial = UserProfileGenerator.generate_cohorts([15, 15], seed=5)
+        parallel = UserProfileGenerator.generate_cohorts([15, 15], seed=5, n_workers=2)
+        for a, b in zip(serial, parallel):
+            pd.testing.assert_frame_equal(a, b)
+        assert not serial[0]["monthly_budget"].equals(serial[1]["monthly_budget"])
+
+    def test_cdf_sampling_matches_rng_choice(self):
+        from src.data_pipeline.generators.user_profile_generator import _weight_table
+
+        dist = {"urban": 0.3, "suburban": 0.5, "rural": 0.2}
+        gen = UserProfileGenerator(num_users=1, seed=7)
+        gen._rng = np.random.default_rng(7)
+        sampled = gen._sample_from(_weight_table(dist), 1000)
+
+        expected = np.random.default_rng(7).choice(
+            list(dist), size=1000, p=list(dist.values())
+        )
+        assert sampled.tolist() == expected.tolist()
+
     def test_different_seed_different_output(self):
         g1 = UserProfileGenerator(num_users=20, seed=42)
         g2 = UserProfileGenerator(num_users=20, seed=99)
@@ -209,6 +276,19 @@ class TestUserCardMapping:
         expected = sum(len(cards) for cards in profiles["cards"])
         assert len(mapping) == expected
 
+    def test_mapping_skips_users_without_cards(self, user_gen):
+        profiles = pd.DataFrame(
+            {
+                "user_id": ["user_0001", "user_0002"],
+                "cards": [["Amex Gold", "Citi Double Cash"], []],
+                "redemption_preference": ["cash_back", "travel_transfer"],
+            }
+        )
+        mapping = user_gen.generate_user_cards_mapping(profiles)
+        assert mapping["user_id"].tolist() == ["user_0001", "user_0001"]
+        assert mapping["card_id"].tolist() == ["Amex Gold", "Citi Double Cash"]
+        assert mapping.index.equals(pd.RangeIndex(2))
+
 
 # =====================================================================
 # TransactionGenerator — Schema Validation
@@ -252,6 +332,11 @@ class TestTransactionSchema:
     def test_mcc_codes_are_int(self, transactions):
         assert transactions["mcc_code"].dtype in (np.int64, np.int32, int)
 
+    def test_low_cardinality_columns_are_categorical(self, transactions):
+        for col in ("category", "merchant", "card_used"):
+            assert isinstance(transactions[col].dtype, pd.CategoricalDtype)
+        assert transactions["mcc_code"].dtype == np.int32
+
     def test_merchant_non_empty(self, transactions):
         assert (transactions["merchant"].str.len() > 0).all()
 
@@ -281,6 +366,23 @@ class TestTransactionTemporalCoverage:
         months = transactions["date"].apply(lambda d: (d.year, d.month)).unique()
         assert len(months) >= 12
 
+    def test_month_table_covers_window(self, txn_gen):
+        months = txn_gen._months
+        assert months[0] == (2024, 1, 31)
+        assert (2024, 2, 29) in months  # leap year
+        assert len(months) == 14  # Jan 2024 .. Feb 2025 (420 days)
+
+    def test_per_month_tables_follow_month_table(self, txn_gen):
+        feb = txn_gen._months.index((2024, 2, 29))
+        np.testing.assert_array_equal(txn_gen._seasonal_rows[feb], SEASONAL_TABLE[2])
+        np.testing.assert_array_equal(
+            txn_gen._month_day_cdf[:, feb], txn_gen._day_cdf[:, 29 - 28]
+        )
+
+    def test_sorted_by_date_with_default_index(self, transactions):
+        assert transactions["date"].is_monotonic_increasing
+        assert transactions.index.equals(pd.RangeIndex(len(transactions)))
+
     def test_date_within_expected_window(self, txn_gen, transactions):
         assert transactions["date"].min() >= txn_gen.start_date
         assert transactions["date"].max() <= txn_gen.end_date + timedelta(days=7)
@@ -434,3 +536,194 @@ class TestEdgeCases:
         txn_gen = TransactionGenerator(seed=42, start_date=datetime(2024, 1, 1))
         txns = txn_gen.generate(empty)
         assert len(txns) == 0
+
+
+# =====================================================================
+# Config — Dense Lookup Tables
+# =====================================================================
+
+
+class TestSeasonalTable:
+
+    def test_table_matches_seasonal_multipliers(self):
+        assert SEASONAL_TABLE.shape == (13, len(SPENDING_CATEGORIES))
+        for category, idx in CATEGORY_INDEX.items():
+            for month in range(1, 13):
+                expected = SEASONAL_MULTIPLIERS.get(category, {}).get(month, 1.0)
+                assert SEASONAL_TABLE[month, idx] == expected
+
+    def test_archetype_weights_match_dataclasses(self):
+        assert ARCHETYPE_WEIGHTS.shape == (
+            len(SPENDING_ARCHETYPES),
+            len(SPENDING_CATEGORIES),
+        )
+        for archetype in SPENDING_ARCHETYPES:
+            row = ARCHETYPE_WEIGHTS[ARCHETYPE_INDEX[archetype.name]]
+            for category, idx in CATEGORY_INDEX.items():
+                assert row[idx] == archetype.category_weights.get(category, 0.0)
+
+
+class TestDayWeights:
+
+    def test_bill_days_cluster_around_1st_and_15th(self):
+        from src.data_pipeline.generators.transaction_generator import _day_weights
+
+        w = _day_weights("bill", 30)
+        assert w.sum() == pytest.approx(1.0)
+        assert w[0] == w[14] == pytest.approx(3 * w[9])
+
+    def test_bill_categories_cluster_on_bill_days(self, transactions):
+        bills = transactions[transactions["category"].isin(["utilities", "insurance"])]
+        day = bills["date"].dt.day
+        on_bill_days = ((day <= 5) | ((day >= 15) & (day <= 20))).mean()
+        # 11 of ~30 days at 3x weight -> ~64 % expected vs ~37 % if uniform
+        assert on_bill_days > 0.5
+
+    def test_generated_days_fall_within_month(self, transactions):
+        days_in_month = transactions["date"].dt.days_in_month
+        assert (transactions["date"].dt.day <= days_in_month).all()
+
+
+# =====================================================================
+# TransactionGenerator — Budget Allocation
+# =====================================================================
+
+
+class TestAmountAllocation:
+    """The vectorized budget split must match the sequential rule."""
+
+    @staticmethod
+    def _sequential(raw_amounts, counts, budgets):
+        amounts, pos = [], 0
+        for n, budget in zip(counts, budgets):
+            remaining = budget
+            run = raw_amounts[pos : pos + n]
+            pos += n
+            for raw in run:
+                if remaining < MIN_TRANSACTION_AMOUNT:
+                    break
+                amt = round(max(MIN_TRANSACTION_AMOUNT, min(raw, remaining)), 2)
+                remaining -= amt
+                amounts.append(amt)
+        return amounts
+
+    def test_matches_sequential_split(self):
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            counts = rng.integers(1, 12, size=rng.integers(1, 8))
+            budgets = rng.uniform(1.5, 600.0, size=len(counts))
+            raw = rng.normal(60.0, 45.0, size=int(counts.sum()))
+
+            amounts, keep = TransactionGenerator._allocate_amounts(raw, counts, budgets)
+
+            np.testing.assert_allclose(
+                amounts[keep], self._sequential(raw, counts, budgets), atol=0.011
+            )
+
+
+# =====================================================================
+# TransactionGenerator — Parallel Generation
+# =====================================================================
+
+
+class TestParallelGeneration:
+
+    def test_worker_count_does_not_change_output(self, small_profiles, monkeypatch):
+        from src.data_pipeline.generators import transaction_generator
+
+        monkeypatch.setattr(transaction_generator, "_PARALLEL_MIN_USERS", 2)
+        serial = TransactionGenerator(seed=42, start_date=datetime(2024, 1, 1))
+        parallel = TransactionGenerator(
+            seed=42, start_date=datetime(2024, 1, 1), n_workers=2
+        )
+        pd.testing.assert_frame_equal(
+            serial.generate(small_profiles), parallel.generate(small_profiles)
+        )
+
+    def test_user_stream_independent_of_other_users(self, small_profiles):
+        gen_all = TransactionGenerator(seed=42, start_date=datetime(2024, 1, 1))
+        gen_one = TransactionGenerator(seed=42, start_date=datetime(2024, 1, 1))
+        first_user = small_profiles["user_id"].iloc[0]
+
+        all_txns = gen_all.generate(small_profiles)
+        one_txns = gen_one.generate(small_profiles.iloc[:1])
+
+        expected = all_txns[all_txns["user_id"] == first_user]
+        np.testing.assert_array_equal(
+            np.sort(expected["amount"].to_numpy()),
+            np.sort(one_txns["amount"].to_numpy()),
+        )
+
+    def test_unknown_cards_still_resolve(self):
+        profiles = pd.DataFrame(
+            [
+                {
+                    "user_id": "user_0001",
+                    "archetype": "young_professional",
+                    "monthly_budget": 3000.0,
+                    "cards": ["House Card"],
+                }
+            ]
+        )
+        txns = TransactionGenerator(seed=1, start_date=datetime(2024, 1, 1)).generate(
+            profiles
+        )
+        assert set(txns["card_used"]) == {"House Card"}
+
+
+class TestChunkedGeneration:
+
+    def test_chunks_match_full_generation(self, small_profiles):
+        full = TransactionGenerator(seed=42, start_date=datetime(2024, 1, 1))
+        chunked = TransactionGenerator(seed=42, start_date=datetime(2024, 1, 1))
+
+        chunks = list(chunked.generate_iter(small_profiles, chunk_users=3))
+        assert len(chunks) == 4
+        combined = pd.concat(chunks, ignore_index=True)
+        assert isinstance(combined["card_used"].dtype, pd.CategoricalDtype)
+        assert combined["transaction_id"].is_unique
+
+        expected = full.generate(small_profiles)
+        key = ["transaction_id"]
+        pd.testing.assert_frame_equal(
+            combined.sort_values(key).reset_index(drop=True),
+            expected.sort_values(key).reset_index(drop=True),
+        )
+
+    def test_each_chunk_sorted_by_date(self, txn_gen, small_profiles):
+        for chunk in txn_gen.generate_iter(small_profiles, chunk_users=4):
+            assert chunk["date"].is_monotonic_increasing
+
+    def test_invalid_chunk_size(self, txn_gen, small_profiles):
+        with pytest.raises(ValueError):
+            next(txn_gen.generate_iter(small_profiles, chunk_users=0))
+
+    def test_generate_to_parquet(self, txn_gen, small_profiles, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "transactions.parquet"
+
+        written = txn_gen.generate_to_parquet(small_profiles, path, chunk_users=4)
+
+        parquet_file = pq.ParquetFile(path)
+        assert parquet_file.metadata.num_rows == written
+        assert parquet_file.num_row_groups == 3
+
+    def test_transaction_ids_past_seven_digits(self, txn_gen, small_profiles):
+        row = small_profiles.iloc[0]
+        card_names, cards_lists = txn_gen._card_codes([row["cards"]])
+        user_columns = txn_gen._generate_users(
+            [row["user_id"]],
+            [ARCHETYPE_INDEX[row["archetype"]]],
+            np.array([row["monthly_budget"]]),
+            cards_lists,
+            np.random.SeedSequence(1).spawn(1),
+        )
+        df = txn_gen._build_frame(user_columns, card_names, first_id=9_999_999)
+        ids = set(df["transaction_id"])
+        assert {"txn_9999999", "txn_10000000"} <= ids
+
+    def test_transaction_id_helper_crosses_ten_million(self):
+        ids = _transaction_ids(9_999_999, 3).tolist()
+        assert ids == ["txn_9999999", "txn_10000000", "txn_10000001"]
+        assert len(set(ids)) == 3
+        assert _transaction_ids(1, 2).tolist() == ["txn_0000001", "txn_0000002"]